@@ -0,0 +1,67 @@
+"""Micro-benchmark of the QuAM waveform kernels against the qualang_tools helpers.
+
+Usage:
+    python benchmarks/waveform_kernels.py
+"""
+
+import timeit
+
+import numpy as np
+from qualang_tools.config.waveform_tools import (
+    drag_gaussian_pulse_waveforms,
+    flattop_gaussian_waveform as qualang_flattop_gaussian_waveform,
+)
+
+from quam.components.pulses import drag_gaussian_waveform, flattop_gaussian_waveform
+
+LENGTHS = [16, 100, 1_000, 10_000, 100_000]
+
+
+def qualang_drag(length):
+    I, Q = drag_gaussian_pulse_waveforms(
+        0.1, length, length / 5, 0.5, -200e6, detuning=1e6
+    )
+    return np.array(I) + 1j * np.array(Q)
+
+
+def quam_drag(length):
+    return drag_gaussian_waveform(0.1, length, length / 5, 0.5, -200e6, detuning=1e6)
+
+
+def qualang_flattop(length):
+    return np.array(qualang_flattop_gaussian_waveform(0.1, length // 2, length // 4))
+
+
+def quam_flattop(length):
+    return flattop_gaussian_waveform(0.1, length // 2, length // 4)
+
+
+def time_function(func, length, repeat=5):
+    number = max(1, 100_000 // length)
+    timings = timeit.repeat(lambda: func(length), number=number, repeat=repeat)
+    return min(timings) / number
+
+
+def main():
+    header = (
+        f"{'kernel':<10}{'length':>10}{'qualang (us)':>15}{'quam (us)':>12}"
+        f"{'speedup':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, reference_func, func in [
+        ("drag", qualang_drag, quam_drag),
+        ("flattop", qualang_flattop, quam_flattop),
+    ]:
+        for length in LENGTHS:
+            assert np.allclose(reference_func(length), func(length), atol=1e-12)
+            t_reference = time_function(reference_func, length)
+            t_quam = time_function(func, length)
+            print(
+                f"{name:<10}{length:>10}{t_reference * 1e6:>15.1f}{t_quam * 1e6:>12.1f}"
+                f"{t_reference / t_quam:>10.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
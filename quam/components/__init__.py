@@ -1,7 +1,10 @@
 from .basic_quam import *
 from .hardware import *
 from .octave import *
+from .octave_calibration import *
 from .channels import *
+from .frequency_planning import *
+from .spectral_collisions import *
 from . import pulses
 
 __all__ = [
@@ -9,5 +12,8 @@ __all__ = [
     *hardware.__all__,
     *channels.__all__,
     *octave.__all__,
+    *octave_calibration.__all__,
+    *frequency_planning.__all__,
+    *spectral_collisions.__all__,
     "pulses",
 ]
@@ -1,5 +1,16 @@
 from dataclasses import field
-from typing import ClassVar, Dict, List, Optional, Sequence, Literal, Tuple, Union, Any
+from typing import (
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Literal,
+    Tuple,
+    Type,
+    Union,
+    Any,
+)
 import warnings
 
 from quam.components.hardware import BaseFrequencyConverter, Mixer, LocalOscillator
@@ -23,6 +34,7 @@ from quam.components.pulses import Pulse, BaseReadoutPulse
 from quam.components.ports.digital_outputs import (
     FEMDigitalOutputPort,
 )
+from quam.components.ports.base_ports import BasePort, get_port_flyweight
 from quam.core import QuamComponent, quam_dataclass
 from quam.core.quam_classes import QuamDict
 from quam.utils import string_reference as str_ref
@@ -68,6 +80,38 @@ __all__ = [
 ]
 
 
+def _get_port(
+    port: Union[BasePort, Sequence[Union[str, int]]],
+    port_classes: Tuple[Type[BasePort], Type[BasePort]],
+    config: Dict[str, dict],
+    **port_properties,
+) -> BasePort:
+    """Get the port object of a channel port, adding port tuples to the config.
+
+    Port objects are returned as is, as these are QuAM components that are added to
+    the config separately. Port tuples are converted to a shared port object, see
+    [`get_port_flyweight`][quam.components.ports.base_ports.get_port_flyweight],
+    which is added to the config.
+
+    Args:
+        port: The port object or port tuple of the channel.
+        port_classes: The port classes for an OPX+ port tuple `(controller, port)`,
+            and for an OPX1000 FEM port tuple `(controller, fem, port)`.
+        config: The QUA config that's in the process of being generated.
+        **port_properties: The properties of the port if it's a port tuple.
+
+    Returns:
+        The port object.
+    """
+    if isinstance(port, BasePort):
+        return port
+
+    port_cls = port_classes[0] if len(port) == 2 else port_classes[1]
+    port_obj = get_port_flyweight(port_cls, tuple(port), **port_properties)
+    port_obj.apply_to_config(config)
+    return port_obj
+
+
 @quam_dataclass
 class DigitalOutputChannel(QuamComponent):
     """QuAM component for a digital output channel (signal going out of the OPX)
@@ -141,15 +185,13 @@ class DigitalOutputChannel(QuamComponent):
 
         shareable = self.shareable if self.shareable is not None else False
         inverted = self.inverted if self.inverted is not None else False
-        if len(self.opx_output) == 2:
-            digital_output_port = OPXPlusDigitalOutputPort(
-                *self.opx_output, shareable=shareable, inverted=inverted
-            )
-        else:
-            digital_output_port = FEMDigitalOutputPort(
-                *self.opx_output, shareable=shareable, inverted=inverted
-            )
-        digital_output_port.apply_to_config(config)
+        _get_port(
+            self.opx_output,
+            (OPXPlusDigitalOutputPort, FEMDigitalOutputPort),
+            config,
+            shareable=shareable,
+            inverted=inverted,
+        )
 
 
 @quam_dataclass
@@ -194,7 +236,7 @@ class Channel(QuamComponent):
                 "a name."
             )
         if isinstance(self.parent, QuamDict):
-            return self.parent.get_attr_name(self)
+            return self._attr_name_in_parent
         if not hasattr(self.parent, "name"):
             raise AttributeError(
                 f"{cls_name}.name cannot be determined. "
@@ -202,11 +244,37 @@ class Channel(QuamComponent):
                 f"or {cls_name} should be an attribute of another QuAM component with "
                 "a name."
             )
-        return f"{self.parent.name}{str_ref.DELIMITER}{self.parent.get_attr_name(self)}"
+        return f"{self.parent.name}{str_ref.DELIMITER}{self._attr_name_in_parent}"
 
     @property
     def pulse_mapping(self):
-        return {label: pulse.pulse_name for label, pulse in self.operations.items()}
+        pulse_mapping = {}
+        for label, pulse in self.operations.items():
+            if pulse.segment_labels is None:
+                pulse_mapping[label] = pulse.pulse_name
+                continue
+
+            # Segmented pulses are added as separate pulses, one per segment
+            for segment_label, pulse_name in pulse.segment_pulse_mapping.items():
+                pulse_mapping[f"{label}{str_ref.DELIMITER}{segment_label}"] = pulse_name
+        return pulse_mapping
+
+    @property
+    def sampling_rate(self) -> float:
+        """The sampling rate of the channel's analog output in samples per second.
+
+        This is the sampling rate of the output port, e.g.
+        `LFFEMAnalogOutputPort.sampling_rate`. Output ports specified as a tuple, as
+        well as ports without a configurable sampling rate, have the default
+        sampling rate of 1 GS/s. For an IQ channel the sampling rate of the I port
+        is used.
+        """
+        for attr in ["opx_output", "opx_output_I"]:
+            port = getattr(self, attr, None)
+            sampling_rate = getattr(port, "sampling_rate", None)
+            if sampling_rate is not None:
+                return sampling_rate
+        return 1e9
 
     # def play(
     #     self,
@@ -415,47 +483,47 @@ class Channel(QuamComponent):
     #     """
     #     frame_rotation_2pi(angle, self.name)
 
-    # def _config_add_digital_outputs(self, config: Dict[str, dict]) -> None:
-    #     """Adds the digital outputs to the QUA config.
+    def _config_add_digital_outputs(self, config: Dict[str, dict]) -> None:
+        """Adds the digital outputs to the QUA config.
 
-    #     config.elements.<element_name>.digitalInputs will be updated with the digital
-    #     outputs of this channel.
+        config.elements.<element_name>.digitalInputs will be updated with the digital
+        outputs of this channel.
 
-    #     Note that the digital outputs are added separately to the controller config in
-    #     `DigitalOutputChannel.apply_to_config`.
+        Note that the digital outputs are added separately to the controller config in
+        `DigitalOutputChannel.apply_to_config`.
 
-    #     Args:
-    #         config (dict): The QUA config that's in the process of being generated.
-    #     """
-    #     if not self.digital_outputs:
-    #         return
+        Args:
+            config (dict): The QUA config that's in the process of being generated.
+        """
+        if not self.digital_outputs:
+            return
 
-    #     element_cfg = config["elements"][self.name]
-    #     element_cfg.setdefault("digitalInputs", {})
+        element_cfg = config["elements"][self.name]
+        element_cfg.setdefault("digitalInputs", {})
 
-    #     for name, digital_output in self.digital_outputs.items():
-    #         digital_cfg = digital_output.generate_element_config()
-    #         element_cfg["digitalInputs"][name] = digital_cfg
+        for name, digital_output in self.digital_outputs.items():
+            digital_cfg = digital_output.generate_element_config()
+            element_cfg["digitalInputs"][name] = digital_cfg
 
-    # def apply_to_config(self, config: Dict[str, dict]) -> None:
-    #     """Adds this Channel to the QUA configuration.
+    def apply_to_config(self, config: Dict[str, dict]) -> None:
+        """Adds this Channel to the QUA configuration.
 
-    #     config.elements.<element_name> will be created, and the operations are added.
+        config.elements.<element_name> will be created, and the operations are added.
 
-    #     Args:
-    #         config (dict): The QUA config that's in the process of being generated.
+        Args:
+            config (dict): The QUA config that's in the process of being generated.
 
-    #     Raises:
-    #         ValueError: If the channel already exists in the config.
-    #     """
-    #     if self.name in config["elements"]:
-    #         raise ValueError(
-    #             f"Cannot add channel '{self.name}' to the config because it already "
-    #             f"exists. Existing entry: {config['elements'][self.name]}"
-    #         )
-    #     config["elements"][self.name] = {"operations": self.pulse_mapping}
+        Raises:
+            ValueError: If the channel already exists in the config.
+        """
+        if self.name in config["elements"]:
+            raise ValueError(
+                f"Cannot add channel '{self.name}' to the config because it already "
+                f"exists. Existing entry: {config['elements'][self.name]}"
+            )
+        config["elements"][self.name] = {"operations": self.pulse_mapping}
 
-    #     self._config_add_digital_outputs(config)
+        self._config_add_digital_outputs(config)
 
 
 @quam_dataclass
@@ -518,24 +586,14 @@ class SingleChannel(Channel):
         if self.intermediate_frequency is not None:
             element_config["intermediate_frequency"] = self.intermediate_frequency
 
-        if isinstance(self.opx_output, LFAnalogOutputPort):
-            opx_port = self.opx_output
-        elif len(self.opx_output) == 2:
-            opx_port = OPXPlusAnalogOutputPort(
-                *self.opx_output,
-                offset=self.opx_output_offset,
-                feedforward_filter=self.filter_fir_taps,
-                feedback_filter=self.filter_iir_taps,
-            )
-            opx_port.apply_to_config(config)
-        else:
-            opx_port = LFFEMAnalogOutputPort(
-                *self.opx_output,
-                offset=self.opx_output_offset,
-                feedforward_filter=self.filter_fir_taps,
-                feedback_filter=self.filter_iir_taps,
-            )
-            opx_port.apply_to_config(config)
+        opx_port = _get_port(
+            self.opx_output,
+            (OPXPlusAnalogOutputPort, LFFEMAnalogOutputPort),
+            config,
+            offset=self.opx_output_offset,
+            feedforward_filter=self.filter_fir_taps,
+            feedback_filter=self.filter_iir_taps,
+        )
 
         element_config["singleInput"] = {"port": opx_port.port_tuple}
 
@@ -580,18 +638,12 @@ class InSingleChannel(Channel):
         element_config["smearing"] = self.smearing
         element_config["time_of_flight"] = self.time_of_flight
 
-        if isinstance(self.opx_input, LFAnalogInputPort):
-            opx_port = self.opx_input
-        elif len(self.opx_input) == 2:
-            opx_port = OPXPlusAnalogInputPort(
-                *self.opx_input, offset=self.opx_input_offset
-            )
-            opx_port.apply_to_config(config)
-        else:
-            opx_port = LFFEMAnalogInputPort(
-                *self.opx_input, offset=self.opx_input_offset
-            )
-            opx_port.apply_to_config(config)
+        opx_port = _get_port(
+            self.opx_input,
+            (OPXPlusAnalogInputPort, LFFEMAnalogInputPort),
+            config,
+            offset=self.opx_input_offset,
+        )
 
         element_config["outputs"] = {"out1": opx_port.port_tuple}
 
@@ -1009,14 +1061,12 @@ class IQChannel(Channel):
         opx_outputs = [self.opx_output_I, self.opx_output_Q]
         offsets = [self.opx_output_offset_I, self.opx_output_offset_Q]
         for I_or_Q, opx_output, offset in zip("IQ", opx_outputs, offsets):
-            if isinstance(opx_output, LFAnalogOutputPort):
-                opx_port = opx_output
-            elif len(opx_output) == 2:
-                opx_port = OPXPlusAnalogOutputPort(*opx_output, offset=offset)
-                opx_port.apply_to_config(config)
-            else:
-                opx_port = LFFEMAnalogOutputPort(*opx_output, offset=offset)
-                opx_port.apply_to_config(config)
+            opx_port = _get_port(
+                opx_output,
+                (OPXPlusAnalogOutputPort, LFFEMAnalogOutputPort),
+                config,
+                offset=offset,
+            )
 
             if "mixInputs" in element_cfg:
                 element_cfg["mixInputs"][I_or_Q] = opx_port.port_tuple
@@ -1101,18 +1151,13 @@ class InIQChannel(Channel):
         offsets = [self.opx_input_offset_I, self.opx_input_offset_Q]
         input_gain = int(self.input_gain if self.input_gain is not None else 0)
         for k, (opx_input, offset) in enumerate(zip(opx_inputs, offsets), start=1):
-            if isinstance(opx_input, LFAnalogInputPort):
-                opx_port = opx_input
-            elif len(opx_input) == 2:
-                opx_port = OPXPlusAnalogInputPort(
-                    *opx_input, offset=offset, gain_db=input_gain
-                )
-                opx_port.apply_to_config(config)
-            else:
-                opx_port = LFFEMAnalogInputPort(
-                    *opx_input, offset=offset, gain_db=input_gain
-                )
-                opx_port.apply_to_config(config)
+            opx_port = _get_port(
+                opx_input,
+                (OPXPlusAnalogInputPort, LFFEMAnalogInputPort),
+                config,
+                offset=offset,
+                gain_db=input_gain,
+            )
             if not isinstance(self.frequency_converter_down, OctaveDownConverter):
                 element_cfg["outputs"][f"out{k}"] = opx_port.port_tuple
 
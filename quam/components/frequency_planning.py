@@ -0,0 +1,372 @@
+from dataclasses import dataclass, fields, is_dataclass, replace
+from typing import Iterable, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+
+from quam.components.channels import IQChannel
+from quam.components.hardware import FrequencyConverter
+from quam.core.quam_classes import QuamBase
+from quam.utils import string_reference as str_ref
+
+__all__ = ["FrequencyPlan", "get_frequency_plan"]
+
+# Maximum number of references followed to find the attribute storing a value
+MAX_REFERENCE_DEPTH = 16
+
+ValueSource = Tuple[QuamBase, str]
+
+
+def _get_value_source(obj: QuamBase, attr: str) -> Optional[ValueSource]:
+    """Get the object and attribute that store the value of an attribute
+
+    References are followed until an attribute is reached that stores a value. The LO
+    frequency of a `FrequencyConverter` is stored in its local oscillator.
+
+    Returns:
+        A tuple (obj, attr) of the attribute storing the value, or None if the value
+        is derived from other values, e.g. `IQChannel.inferred_RF_frequency`.
+    """
+    for _ in range(MAX_REFERENCE_DEPTH):
+        if isinstance(obj, FrequencyConverter) and attr == "LO_frequency":
+            obj, attr = obj.local_oscillator, "frequency"
+            continue
+
+        if not is_dataclass(obj) or attr not in [f.name for f in fields(obj)]:
+            return None
+
+        raw_value = obj.get_unreferenced_value(attr)
+        if not str_ref.is_reference(raw_value):
+            return obj, attr
+
+        parent_reference, attr = raw_value.rsplit("/", 1)
+        obj = str_ref.get_referenced_value(obj, f"{parent_reference}/", root=obj._root)
+    return None
+
+
+def _get_frequency(channel: IQChannel, attr: str) -> Optional[float]:
+    """Get a frequency of a channel, or None if it cannot be determined"""
+    try:
+        value = getattr(channel, attr)
+    except (AttributeError, ValueError):
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+@dataclass
+class FrequencyPlan:
+    """The RF, LO and intermediate frequencies of a set of IQ channels.
+
+    The frequencies are stored as arrays with one entry per channel. Channels whose
+    LO frequency is stored in the same attribute, e.g. channels sharing a
+    `LocalOscillator` or an `OctaveUpConverter`, belong to the same LO group and
+    always have the same LO frequency.
+
+    A frequency plan is usually created using `get_frequency_plan`, after which
+    `FrequencyPlan.solve` determines the LO frequencies that place all RF frequencies
+    within the IF bandwidth, and `FrequencyPlan.apply` writes the LO and intermediate
+    frequencies back to QuAM.
+
+    Args:
+        channels: The IQ channels.
+        RF_frequencies: The RF frequency of each channel.
+        LO_frequencies: The LO frequency of each channel.
+        intermediate_frequencies: The intermediate frequency of each channel.
+        LO_groups: The index in `LO_sources` of each channel.
+        LO_sources: The (obj, attr) attribute storing the LO frequency of each group.
+        IF_sources: The (obj, attr) attribute storing the intermediate frequency of
+            each channel, or None if the intermediate frequency is derived from the RF
+            and LO frequencies.
+
+    Example:
+        ```
+        plan = get_frequency_plan(machine)
+        plan = plan.solve(max_intermediate_frequency=350e6, sideband="lower")
+        plan.apply()
+        ```
+    """
+
+    channels: List[IQChannel]
+    RF_frequencies: np.ndarray
+    LO_frequencies: np.ndarray
+    intermediate_frequencies: np.ndarray
+    LO_groups: np.ndarray
+    LO_sources: List[ValueSource]
+    IF_sources: List[Optional[ValueSource]]
+
+    @property
+    def num_LO_groups(self) -> int:
+        return len(self.LO_sources)
+
+    def get_group_channels(self, group: int) -> List[IQChannel]:
+        """Get the channels that share the LO of a group"""
+        indices = np.flatnonzero(self.LO_groups == group)
+        return [self.channels[idx] for idx in indices]
+
+    def _get_LO_candidates(
+        self,
+        LO_low: np.ndarray,
+        LO_high: np.ndarray,
+        min_intermediate_frequency: float,
+        sideband: str,
+        LO_resolution: Optional[float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get candidate LO frequencies of each group
+
+        The candidates are the centre of the allowed LO range of each group, and, if
+        both sidebands are allowed, the closest LO frequencies on either side of each
+        RF frequency that keep the minimum intermediate frequency.
+
+        Returns:
+            Arrays of the candidate LO frequencies and their groups.
+        """
+        candidates = [(LO_low + LO_high) / 2]
+        groups = [np.arange(self.num_LO_groups)]
+        if sideband == "both" and min_intermediate_frequency > 0:
+            candidates += [
+                self.RF_frequencies - min_intermediate_frequency,
+                self.RF_frequencies + min_intermediate_frequency,
+            ]
+            groups += [self.LO_groups, self.LO_groups]
+        candidates = np.concatenate(candidates)
+        groups = np.concatenate(groups)
+
+        if LO_resolution is not None:
+            # Round the centres to the nearest grid point, and the frequencies next to
+            # RF frequencies away from the RF frequency
+            num_groups = self.num_LO_groups
+            num_channels = len(self.channels)
+            rounded = candidates / LO_resolution
+            rounded[:num_groups] = np.round(rounded[:num_groups])
+            rounded[num_groups : num_groups + num_channels] = np.floor(
+                rounded[num_groups : num_groups + num_channels]
+            )
+            rounded[num_groups + num_channels :] = np.ceil(
+                rounded[num_groups + num_channels :]
+            )
+            candidates = rounded * LO_resolution
+            # Also consider the grid points at the edges of the allowed LO range
+            candidates = np.concatenate(
+                [
+                    candidates,
+                    np.ceil(LO_low / LO_resolution) * LO_resolution,
+                    np.floor(LO_high / LO_resolution) * LO_resolution,
+                ]
+            )
+            groups = np.concatenate(
+                [groups, np.arange(num_groups), np.arange(num_groups)]
+            )
+        return candidates, groups
+
+    def solve(
+        self,
+        max_intermediate_frequency: float = 400e6,
+        min_intermediate_frequency: float = 0.0,
+        sideband: Literal["upper", "lower", "both"] = "both",
+        LO_range: Optional[Tuple[float, float]] = None,
+        LO_resolution: Optional[float] = None,
+    ) -> "FrequencyPlan":
+        """Determine the LO frequencies of all LO groups.
+
+        The RF frequencies are kept fixed, and the LO frequency of each group is chosen
+        such that the intermediate frequencies of all its channels satisfy the
+        constraints. Within the allowed range, the LO frequency is placed as close as
+        possible to the centre, maximising the margin to the IF bandwidth. All groups
+        are solved at once using array operations.
+
+        Args:
+            max_intermediate_frequency: The maximum absolute intermediate frequency.
+            min_intermediate_frequency: The minimum absolute intermediate frequency,
+                e.g. to keep the signals away from the LO leakage.
+            sideband: The sideband of the RF frequencies w.r.t. the LO frequency.
+                "upper" for RF above LO (positive IF), "lower" for RF below LO
+                (negative IF), or "both".
+            LO_range: Optional (min, max) LO frequency, e.g. (2e9, 18e9) for the Octave.
+            LO_resolution: Optional resolution of the LO frequency, in which case the
+                LO frequencies are multiples of the resolution.
+
+        Returns:
+            A new frequency plan with the solved LO and intermediate frequencies.
+
+        Raises:
+            ValueError: If no valid LO frequency exists for a group.
+        """
+        if sideband not in ["upper", "lower", "both"]:
+            raise ValueError(
+                f"Invalid sideband: {sideband}. Must be 'upper', 'lower' or 'both'"
+            )
+
+        RF_min = np.full(self.num_LO_groups, np.inf)
+        RF_max = np.full(self.num_LO_groups, -np.inf)
+        np.minimum.at(RF_min, self.LO_groups, self.RF_frequencies)
+        np.maximum.at(RF_max, self.LO_groups, self.RF_frequencies)
+
+        if sideband == "upper":
+            LO_low = RF_max - max_intermediate_frequency
+            LO_high = RF_min - min_intermediate_frequency
+        elif sideband == "lower":
+            LO_low = RF_max + min_intermediate_frequency
+            LO_high = RF_min + max_intermediate_frequency
+        else:
+            LO_low = RF_max - max_intermediate_frequency
+            LO_high = RF_min + max_intermediate_frequency
+        if LO_range is not None:
+            LO_low = np.maximum(LO_low, LO_range[0])
+            LO_high = np.minimum(LO_high, LO_range[1])
+
+        candidates, candidate_groups = self._get_LO_candidates(
+            LO_low, LO_high, min_intermediate_frequency, sideband, LO_resolution
+        )
+
+        # Candidates must lie within the allowed range of their group
+        valid = (candidates >= LO_low[candidate_groups] - 1e-6) & (
+            candidates <= LO_high[candidate_groups] + 1e-6
+        )
+
+        if sideband == "both" and min_intermediate_frequency > 0:
+            # Candidates may not lie within the minimum IF of any RF frequency of their
+            # group. Offsetting each group by a span larger than all frequencies allows
+            # a single sorted search over all groups.
+            span = 2 * (
+                np.abs(self.RF_frequencies).max(initial=0)
+                + max_intermediate_frequency
+                + 1
+            )
+            RF_keys = np.sort(self.LO_groups * span + self.RF_frequencies)
+            candidate_keys = candidate_groups * span + candidates
+            num_close = np.searchsorted(
+                RF_keys, candidate_keys + min_intermediate_frequency - 1e-6
+            ) - np.searchsorted(
+                RF_keys,
+                candidate_keys - min_intermediate_frequency + 1e-6,
+                side="right",
+            )
+            valid &= num_close == 0
+
+        # Select the valid candidate of each group closest to the centre
+        centres = (LO_low + LO_high) / 2
+        distances = np.where(
+            valid, np.abs(candidates - centres[candidate_groups]), np.inf
+        )
+        order = np.lexsort((distances, candidate_groups))
+        groups, first_idxs = np.unique(candidate_groups[order], return_index=True)
+        best = order[first_idxs]
+
+        infeasible = groups[~np.isfinite(distances[best])]
+        if len(infeasible):
+            group_descriptions = []
+            for group in infeasible:
+                names = [channel.name for channel in self.get_group_channels(group)]
+                group_descriptions.append(
+                    f"channels {names} with RF frequencies between "
+                    f"{RF_min[group] / 1e9:.6g} and {RF_max[group] / 1e9:.6g} GHz"
+                )
+            raise ValueError(
+                "Could not find an LO frequency satisfying the constraints for "
+                + "; ".join(group_descriptions)
+            )
+
+        group_LO_frequencies = candidates[best]
+        LO_frequencies = group_LO_frequencies[self.LO_groups]
+        return replace(
+            self,
+            LO_frequencies=LO_frequencies,
+            intermediate_frequencies=self.RF_frequencies - LO_frequencies,
+        )
+
+    def apply(self) -> None:
+        """Write the LO and intermediate frequencies back to QuAM.
+
+        The LO frequency of each group is written to the attribute that stores it, e.g.
+        `LocalOscillator.frequency` or `OctaveUpConverter.LO_frequency`. The
+        intermediate frequency of each channel is written to the attribute that stores
+        it, unless it is derived from the RF and LO frequencies. All values are
+        validated before any value is written.
+
+        Raises:
+            ValueError: If different values should be written to the same attribute.
+        """
+        updates = {}
+        group_LO_frequencies = np.zeros(self.num_LO_groups)
+        group_LO_frequencies[self.LO_groups] = self.LO_frequencies
+        for (obj, attr), LO_frequency in zip(self.LO_sources, group_LO_frequencies):
+            updates[(id(obj), attr)] = (obj, attr, float(LO_frequency))
+
+        for channel, source, intermediate_frequency in zip(
+            self.channels, self.IF_sources, self.intermediate_frequencies
+        ):
+            if source is None:
+                continue
+            obj, attr = source
+            key = (id(obj), attr)
+            intermediate_frequency = float(intermediate_frequency)
+            if key in updates and updates[key][2] != intermediate_frequency:
+                raise ValueError(
+                    f"Cannot apply frequency plan: the intermediate frequency of "
+                    f"{channel.name} is stored in {obj.__class__.__name__}.{attr}, "
+                    f"which should also be set to {updates[key][2]}"
+                )
+            updates[key] = (obj, attr, intermediate_frequency)
+
+        for obj, attr, value in updates.values():
+            setattr(obj, attr, value)
+
+
+def get_frequency_plan(
+    components: Union[QuamBase, Iterable[QuamBase]],
+) -> FrequencyPlan:
+    """Get the frequency plan of all IQ channels.
+
+    The RF frequency of each channel is the target frequency, and is kept fixed when
+    solving the plan. Channels whose RF frequency cannot be determined, or whose LO
+    frequency is not stored in an attribute, e.g. because it's inferred from the RF
+    and intermediate frequencies, are skipped.
+
+    Args:
+        components: A QuAM object, usually the QuamRoot, whose IQ channels to include,
+            or a sequence of IQ channels.
+
+    Returns:
+        The frequency plan of the channels.
+    """
+    if isinstance(components, QuamBase):
+        components = components.iterate_components()
+
+    channels, RF_frequencies, LO_frequencies, LO_groups = [], [], [], []
+    LO_sources, IF_sources = [], []
+    LO_source_groups = {}
+    for channel in components:
+        if not isinstance(channel, IQChannel):
+            continue
+
+        RF_frequency = _get_frequency(channel, "RF_frequency")
+        LO_frequency = _get_frequency(channel, "LO_frequency")
+        if RF_frequency is None:
+            continue
+        LO_source = _get_value_source(channel, "LO_frequency")
+        if LO_source is None:
+            continue
+
+        LO_key = (id(LO_source[0]), LO_source[1])
+        if LO_key not in LO_source_groups:
+            LO_source_groups[LO_key] = len(LO_sources)
+            LO_sources.append(LO_source)
+
+        channels.append(channel)
+        RF_frequencies.append(RF_frequency)
+        LO_frequencies.append(np.nan if LO_frequency is None else LO_frequency)
+        LO_groups.append(LO_source_groups[LO_key])
+        IF_sources.append(_get_value_source(channel, "intermediate_frequency"))
+
+    RF_frequencies = np.array(RF_frequencies, dtype=float)
+    LO_frequencies = np.array(LO_frequencies, dtype=float)
+    return FrequencyPlan(
+        channels=channels,
+        RF_frequencies=RF_frequencies,
+        LO_frequencies=LO_frequencies,
+        intermediate_frequencies=RF_frequencies - LO_frequencies,
+        LO_groups=np.array(LO_groups, dtype=int),
+        LO_sources=LO_sources,
+        IF_sources=IF_sources,
+    )
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import List
+from typing import List, Optional
 
 from quam.core import QuamComponent, quam_dataclass
 from quam.utils import string_reference as str_ref
@@ -47,6 +47,18 @@ class Mixer(QuamComponent):
         correction_gain (float, optional): The gain imbalance of the mixer.
             Default is 0, see `Mixer.IQ_imbalance` for details.
         correction_phase (float, optional): The phase imbalance of the mixer in radians.
+        correction_table (List[List[float]], optional): Calibration table of the mixer,
+            where each row is [intermediate_frequency, LO_frequency, gain, phase].
+            If specified, a correction entry is added to the QUA config for each row,
+            and `correction_gain` and `correction_phase` are ignored. The gain and
+            phase at other intermediate frequencies are linearly interpolated between
+            the calibration points with the LO frequency closest to the current LO
+            frequency, see `Mixer.get_correction`.
+        correction_intermediate_frequencies (List[float], optional): Additional
+            intermediate frequencies at the current LO frequency for which to add
+            correction entries, e.g. the frequencies of a frequency sweep, such that
+            the config doesn't need to be regenerated when updating the frequency.
+            The gain and phase are interpolated from the `correction_table`.
     """
 
     local_oscillator_frequency: float = "#../local_oscillator/frequency"
@@ -55,6 +67,9 @@ class Mixer(QuamComponent):
     correction_gain: float = 0
     correction_phase: float = 0
 
+    correction_table: List[List[float]] = None
+    correction_intermediate_frequencies: List[float] = None
+
     @property
     def name(self):
         frequency_converter = getattr(self, "parent", None)
@@ -70,23 +85,131 @@ class Mixer(QuamComponent):
 
         return f"{channel_name}{str_ref.DELIMITER}mixer"
 
+    def get_correction(
+        self, intermediate_frequencies, LO_frequency: Optional[float] = None
+    ) -> np.ndarray:
+        """Get the gain and phase imbalance at intermediate frequencies.
+
+        The gain and phase are linearly interpolated between the points of the
+        `correction_table` whose LO frequency is closest to `LO_frequency`. Outside the
+        range of calibrated intermediate frequencies, the gain and phase of the nearest
+        calibration point are used. Without a `correction_table`, `correction_gain`
+        and `correction_phase` are used for all intermediate frequencies.
+
+        Args:
+            intermediate_frequencies: The intermediate frequencies, a number or array.
+            LO_frequency: The LO frequency. Default is the LO frequency of the mixer.
+
+        Returns:
+            Array of shape (..., 2) with the gain and phase at each intermediate
+            frequency.
+        """
+        intermediate_frequencies = np.asarray(intermediate_frequencies, dtype=float)
+        if self.correction_table is None or not len(self.correction_table):
+            correction = [self.correction_gain, self.correction_phase]
+            return np.broadcast_to(
+                np.array(correction, dtype=float),
+                (*intermediate_frequencies.shape, 2),
+            ).copy()
+
+        if LO_frequency is None:
+            LO_frequency = self.local_oscillator_frequency
+
+        table = np.asarray(self.correction_table, dtype=float).reshape(-1, 4)
+        LO_frequencies = table[:, 1]
+        closest_LO = LO_frequencies[np.argmin(np.abs(LO_frequencies - LO_frequency))]
+        table = table[LO_frequencies == closest_LO]
+        table = table[np.argsort(table[:, 0], kind="stable")]
+
+        gain = np.interp(intermediate_frequencies, table[:, 0], table[:, 2])
+        phase = np.interp(intermediate_frequencies, table[:, 0], table[:, 3])
+        return np.stack([gain, phase], axis=-1)
+
     def apply_to_config(self, config: dict):
         """Adds this mixer to the QUA configuration.
 
+        If the mixer has a `correction_table`, a correction entry is added for the
+        current intermediate and LO frequency, each calibration point, and each of the
+        `correction_intermediate_frequencies`. Otherwise a single correction entry is
+        added for the current intermediate and LO frequency.
+
         See [`QuamComponent.apply_to_config`][quam.core.quam_classes.QuamComponent.apply_to_config]
         for details.
         """
-        correction_matrix = self.IQ_imbalance(
-            self.correction_gain, self.correction_phase
+        if self.correction_table is None:
+            correction_matrix = self.IQ_imbalance(
+                self.correction_gain, self.correction_phase
+            )
+
+            config["mixers"][self.name] = [
+                {
+                    "intermediate_frequency": self.intermediate_frequency,
+                    "lo_frequency": self.local_oscillator_frequency,
+                    "correction": correction_matrix,
+                }
+            ]
+            return
+
+        LO_frequency = self.local_oscillator_frequency
+        table = np.asarray(self.correction_table, dtype=float).reshape(-1, 4)
+
+        # The current IF and additional IFs are interpolated at the current LO
+        interpolated_IFs = np.array(
+            [
+                self.intermediate_frequency,
+                *(self.correction_intermediate_frequencies or []),
+            ],
+            dtype=float,
         )
+        interpolated_corrections = self.get_correction(interpolated_IFs, LO_frequency)
 
-        config["mixers"][self.name] = [
-            {
-                "intermediate_frequency": self.intermediate_frequency,
-                "lo_frequency": self.local_oscillator_frequency,
-                "correction": correction_matrix,
-            }
-        ]
+        intermediate_frequencies = np.concatenate([interpolated_IFs, table[:, 0]])
+        LO_frequencies = np.concatenate(
+            [np.full(len(interpolated_IFs), LO_frequency, dtype=float), table[:, 1]]
+        )
+        corrections = np.concatenate([interpolated_corrections, table[:, 2:]])
+        correction_matrices = self.IQ_imbalance_matrices(
+            corrections[:, 0], corrections[:, 1]
+        ).tolist()
+
+        # Keep the first entry of each (IF, LO) pair, i.e. the current frequencies
+        # and the additional IFs take precedence over calibration points
+        entries = {}
+        for intermediate_frequency, LO_frequency, correction_matrix in zip(
+            intermediate_frequencies.tolist(),
+            LO_frequencies.tolist(),
+            correction_matrices,
+        ):
+            entries.setdefault(
+                (intermediate_frequency, LO_frequency),
+                {
+                    "intermediate_frequency": intermediate_frequency,
+                    "lo_frequency": LO_frequency,
+                    "correction": correction_matrix,
+                },
+            )
+        config["mixers"][self.name] = list(entries.values())
+
+    @staticmethod
+    def IQ_imbalance_matrices(g, phi) -> np.ndarray:
+        """Vectorised version of `Mixer.IQ_imbalance`.
+
+        Args:
+            g: Array of relative gain imbalances between the I & Q ports.
+            phi: Array of relative phase imbalances between the I & Q ports (radians).
+
+        Returns:
+            Array of shape (..., 4) containing the correction matrix of each gain and
+            phase imbalance.
+        """
+        g = np.asarray(g, dtype=float)
+        phi = np.asarray(phi, dtype=float)
+        c = np.cos(phi)
+        s = np.sin(phi)
+        N = 1 / ((1 - g**2) * (2 * c**2 - 1))
+        return N[..., None] * np.stack(
+            [(1 - g) * c, (1 + g) * s, (1 - g) * s, (1 + g) * c], axis=-1
+        )
 
     @staticmethod
     def IQ_imbalance(g: float, phi: float) -> List[float]:
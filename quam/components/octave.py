@@ -6,7 +6,8 @@ from dataclasses import field
 from quam.components.ports.analog_outputs import LFAnalogOutputPort
 from quam.components.ports.base_ports import BasePort
 from quam.core import QuamComponent, quam_dataclass
-from quam.components.hardware import BaseFrequencyConverter, FrequencyConverter
+from quam.components.hardware import BaseFrequencyConverter, FrequencyConverter, Mixer
+from quam.components.octave_calibration import OctaveCalibrationDatabase
 from quam.components.channels import (
     Channel,
     IQChannel,
@@ -46,7 +47,9 @@ class Octave(QuamComponent):
         ip: The IP address of the Octave. Used in `Octave.get_octave_config()`
         port: The port number of the Octave. Used in `Octave.get_octave_config()`
         calibration_db_path: The path to the calibration database. If not specified, the
-            current working directory is used.
+            current working directory is used. If it is specified and contains a
+            local calibration database, see `Octave.get_calibration_database`, its
+            mixer corrections are added to the QUA config.
         RF_outputs: A dictionary of `OctaveUpConverter` objects. The keys are the
             output numbers (1-5).
         RF_inputs: A dictionary of `OctaveDownConverter` objects. The keys are the
@@ -97,6 +100,31 @@ class Octave(QuamComponent):
         for idx in range(1, 3):
             self.RF_inputs[idx] = OctaveDownConverter(id=idx, LO_frequency=None)
 
+    def get_calibration_database(self) -> Optional[OctaveCalibrationDatabase]:
+        """Get the local calibration database of the Octave.
+
+        The database is loaded from the file "octave_calibration.json" in
+        `Octave.calibration_db_path`, or from `Octave.calibration_db_path` itself if it
+        is a JSON file. The loaded database is cached until the file is modified.
+
+        Returns:
+            The calibration database, or None if `Octave.calibration_db_path` is not
+            specified or doesn't contain a calibration database.
+        """
+        if self.calibration_db_path is None:
+            return None
+
+        path = OctaveCalibrationDatabase._get_file_path(self.calibration_db_path)
+        if not path.is_file():
+            return None
+
+        cache_key = (str(path), path.stat().st_mtime_ns)
+        cached_key, database = self.__dict__.get("_calibration_database", (None, None))
+        if cached_key != cache_key:
+            database = OctaveCalibrationDatabase.load(path)
+            self.__dict__["_calibration_database"] = (cache_key, database)
+        return database
+
     # def get_octave_config(self) -> QmOctaveConfig:
     #     """Return a QmOctaveConfig object with the current Octave configuration."""
     #     # octave_config = QmOctaveConfig()
@@ -288,6 +316,65 @@ class OctaveUpConverter(OctaveFrequencyConverter):
             else:
                 output_config["Q_connection"] = tuple(self.channel.opx_output_Q)
 
+        self._add_calibration_to_config(config)
+
+    @property
+    def mixer_name(self) -> str:
+        """The name of the mixer of this RF output in the QUA config"""
+        return f"octave_{self.octave.name}_{self.id}"
+
+    def _add_calibration_to_config(self, config: Dict) -> None:
+        """Add the mixer corrections of the Octave calibration database to the config
+
+        The calibration entries with the LO frequency and output gain nearest to those
+        of this up-converter are added to `config["mixers"]` at the LO frequency of
+        this up-converter, such that the intermediate frequency can be changed to any
+        calibrated value without regenerating the config. The correction of the
+        channel's intermediate frequency is that of the nearest calibrated
+        intermediate frequency. Nothing is added if the Octave has no calibration
+        database, or if the channel is not an IQChannel.
+        """
+        database = self.octave.get_calibration_database()
+        if database is None or not isinstance(self.channel, IQChannel):
+            return
+
+        entries = database.get_entries(
+            self.octave.name, self.id, self.LO_frequency, self.gain, nearest=True
+        )
+        if not entries:
+            return
+
+        intermediate_frequency = self.channel.intermediate_frequency
+        nearest_entry = database.get(
+            self.octave.name,
+            self.id,
+            self.LO_frequency,
+            self.gain,
+            intermediate_frequency,
+            nearest=True,
+        )
+        intermediate_frequencies = [intermediate_frequency]
+        gains = [nearest_entry.correction_gain]
+        phases = [nearest_entry.correction_phase]
+        for entry in entries:
+            if entry.intermediate_frequency == intermediate_frequency:
+                continue
+            intermediate_frequencies.append(entry.intermediate_frequency)
+            gains.append(entry.correction_gain)
+            phases.append(entry.correction_phase)
+
+        correction_matrices = Mixer.IQ_imbalance_matrices(gains, phases).tolist()
+        config["mixers"][self.mixer_name] = [
+            {
+                "intermediate_frequency": intermediate_frequency,
+                "lo_frequency": self.LO_frequency,
+                "correction": correction_matrix,
+            }
+            for intermediate_frequency, correction_matrix in zip(
+                intermediate_frequencies, correction_matrices
+            )
+        ]
+
 
 @quam_dataclass
 class OctaveDownConverter(OctaveFrequencyConverter):
@@ -0,0 +1,289 @@
+from bisect import bisect_left, insort
+import json
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Union
+
+__all__ = ["OctaveCalibrationEntry", "OctaveCalibrationDatabase"]
+
+OCTAVE_CALIBRATION_FILENAME = "octave_calibration.json"
+OCTAVE_CALIBRATION_VERSION = 1
+
+ConverterKey = Tuple[str, int]
+
+
+class OctaveCalibrationEntry(NamedTuple):
+    """Calibration of an Octave RF output at an LO frequency, gain and IF.
+
+    Args:
+        LO_frequency: The LO frequency of the RF output in Hz.
+        output_gain: The gain of the RF output in dB, see `OctaveUpConverter.gain`.
+        intermediate_frequency: The intermediate frequency in Hz.
+        correction_gain: The relative gain imbalance between the I and Q ports, see
+            `Mixer.IQ_imbalance`.
+        correction_phase: The relative phase imbalance between the I and Q ports in
+            radians, see `Mixer.IQ_imbalance`.
+        offset_I: The DC offset of the I port that minimises LO leakage.
+        offset_Q: The DC offset of the Q port that minimises LO leakage.
+    """
+
+    LO_frequency: float
+    output_gain: float
+    intermediate_frequency: float
+    correction_gain: float
+    correction_phase: float
+    offset_I: float = 0.0
+    offset_Q: float = 0.0
+
+
+def _get_nearest(sorted_values: Sequence[float], value: float) -> float:
+    """Get the value in a non-empty sorted sequence closest to a value"""
+    idx = bisect_left(sorted_values, value)
+    if idx == 0:
+        return sorted_values[0]
+    if idx == len(sorted_values):
+        return sorted_values[-1]
+    before, after = sorted_values[idx - 1], sorted_values[idx]
+    return before if value - before <= after - value else after
+
+
+class _SortedIndex:
+    """Sorted keys with associated values, supporting O(log n) lookups"""
+
+    def __init__(self):
+        self.keys: List[float] = []
+        self.values: Dict[float, object] = {}
+
+    def setdefault(self, key: float, default):
+        if key not in self.values:
+            if self.keys and key < self.keys[-1]:
+                insort(self.keys, key)
+            else:
+                self.keys.append(key)
+            self.values[key] = default
+        return self.values[key]
+
+    def get(self, key: float, nearest: bool = False):
+        if key in self.values:
+            return self.values[key]
+        if not nearest or not self.keys:
+            raise KeyError(key)
+        return self.values[_get_nearest(self.keys, key)]
+
+
+class OctaveCalibrationDatabase:
+    """Local database of Octave RF output calibrations.
+
+    The database stores the mixer corrections and LO leakage offsets of Octave RF
+    outputs, identified by their Octave name and RF output id, for combinations of LO
+    frequency, output gain and intermediate frequency. It doesn't require a
+    connection to the Octave.
+
+    Entries are kept in a sorted index per LO frequency, output gain and intermediate
+    frequency, such that both exact and nearest-neighbour lookups take O(log n). A
+    nearest-neighbour lookup first selects the closest LO frequency, then the closest
+    output gain at that LO frequency, and finally the closest intermediate frequency.
+
+    The database is saved as a JSON file whose entries are sorted by the index keys, so
+    that it can be loaded without sorting.
+
+    Args:
+        path: Optional path of the JSON file, used by `OctaveCalibrationDatabase.save`.
+            If it's a directory, the file "octave_calibration.json" in that directory
+            is used.
+
+    Example:
+        ```
+        database = OctaveCalibrationDatabase("calibrations")
+        database.add("octave1", 1, OctaveCalibrationEntry(6e9, 0, 50e6, 0.01, 0.02))
+        database.save()
+        database.get("octave1", 1, 6e9, 0, 60e6, nearest=True)
+        ```
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = self._get_file_path(path) if path is not None else None
+        self._index: Dict[ConverterKey, _SortedIndex] = {}
+        self._num_entries = 0
+
+    @staticmethod
+    def _get_file_path(path: Union[str, Path]) -> Path:
+        path = Path(path)
+        if path.suffix != ".json":
+            path = path / OCTAVE_CALIBRATION_FILENAME
+        return path
+
+    def __len__(self) -> int:
+        return self._num_entries
+
+    @property
+    def converters(self) -> List[ConverterKey]:
+        """The (octave_name, RF_output_id) of all calibrated RF outputs"""
+        return list(self._index)
+
+    def add(self, octave_name: str, RF_output_id: int, entry: OctaveCalibrationEntry):
+        """Add a calibration entry, replacing any entry with the same keys.
+
+        Args:
+            octave_name: The name of the Octave.
+            RF_output_id: The RF output id of the Octave, i.e. `OctaveUpConverter.id`.
+            entry: The calibration entry.
+        """
+        entry = OctaveCalibrationEntry(*entry)
+        LO_index = self._index.setdefault((octave_name, RF_output_id), _SortedIndex())
+        gain_index = LO_index.setdefault(entry.LO_frequency, _SortedIndex())
+        IF_index = gain_index.setdefault(entry.output_gain, _SortedIndex())
+        if entry.intermediate_frequency in IF_index.values:
+            IF_index.values[entry.intermediate_frequency] = entry
+        else:
+            IF_index.setdefault(entry.intermediate_frequency, entry)
+            self._num_entries += 1
+
+    def _get_IF_index(
+        self,
+        octave_name: str,
+        RF_output_id: int,
+        LO_frequency: float,
+        output_gain: float,
+        nearest: bool,
+    ) -> _SortedIndex:
+        LO_index = self._index[(octave_name, RF_output_id)]
+        gain_index = LO_index.get(LO_frequency, nearest=nearest)
+        return gain_index.get(output_gain, nearest=nearest)
+
+    def get(
+        self,
+        octave_name: str,
+        RF_output_id: int,
+        LO_frequency: float,
+        output_gain: float,
+        intermediate_frequency: float,
+        nearest: bool = False,
+    ) -> OctaveCalibrationEntry:
+        """Get the calibration entry of an RF output.
+
+        Args:
+            octave_name: The name of the Octave.
+            RF_output_id: The RF output id of the Octave.
+            LO_frequency: The LO frequency in Hz.
+            output_gain: The output gain in dB.
+            intermediate_frequency: The intermediate frequency in Hz.
+            nearest: Whether to return the nearest entry if there is no exact match.
+
+        Returns:
+            The calibration entry.
+
+        Raises:
+            KeyError: If there is no (nearest) entry.
+        """
+        try:
+            IF_index = self._get_IF_index(
+                octave_name, RF_output_id, LO_frequency, output_gain, nearest
+            )
+            return IF_index.get(intermediate_frequency, nearest=nearest)
+        except KeyError:
+            raise KeyError(
+                f"No calibration of Octave {octave_name} RF output {RF_output_id} at "
+                f"LO frequency {LO_frequency}, output gain {output_gain} and "
+                f"intermediate frequency {intermediate_frequency}"
+            ) from None
+
+    def get_entries(
+        self,
+        octave_name: str,
+        RF_output_id: int,
+        LO_frequency: float,
+        output_gain: float,
+        nearest: bool = False,
+    ) -> List[OctaveCalibrationEntry]:
+        """Get the entries of all intermediate frequencies at an LO frequency and gain.
+
+        Args:
+            octave_name: The name of the Octave.
+            RF_output_id: The RF output id of the Octave.
+            LO_frequency: The LO frequency in Hz.
+            output_gain: The output gain in dB.
+            nearest: Whether to use the nearest LO frequency and output gain if there
+                is no exact match.
+
+        Returns:
+            The calibration entries sorted by intermediate frequency, or an empty list
+            if there are none.
+        """
+        try:
+            IF_index = self._get_IF_index(
+                octave_name, RF_output_id, LO_frequency, output_gain, nearest
+            )
+        except KeyError:
+            return []
+        return [IF_index.values[key] for key in IF_index.keys]
+
+    def iterate_entries(self):
+        """Iterate over all entries in sorted order
+
+        Yields:
+            Tuples (octave_name, RF_output_id, entry).
+        """
+        for (octave_name, RF_output_id), LO_index in self._index.items():
+            for LO_frequency in LO_index.keys:
+                gain_index = LO_index.values[LO_frequency]
+                for output_gain in gain_index.keys:
+                    IF_index = gain_index.values[output_gain]
+                    for intermediate_frequency in IF_index.keys:
+                        entry = IF_index.values[intermediate_frequency]
+                        yield octave_name, RF_output_id, entry
+
+    def to_dict(self) -> dict:
+        entries = {}
+        for octave_name, RF_output_id, entry in self.iterate_entries():
+            key = f"{octave_name}/{RF_output_id}"
+            entries.setdefault(key, []).append(list(entry))
+        return {"version": OCTAVE_CALIBRATION_VERSION, "entries": entries}
+
+    def save(self, path: Union[str, Path, None] = None) -> Path:
+        """Save the database to a JSON file.
+
+        Args:
+            path: The path of the JSON file or its directory. Default is the path of the
+                database.
+
+        Returns:
+            The path of the JSON file.
+        """
+        if path is not None:
+            self.path = self._get_file_path(path)
+        elif self.path is None:
+            raise ValueError(
+                "No path specified to save the Octave calibration database"
+            )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as f:
+            json.dump(self.to_dict(), f)
+        return self.path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "OctaveCalibrationDatabase":
+        """Load a database from a JSON file.
+
+        Args:
+            path: The path of the JSON file or its directory.
+
+        Returns:
+            The loaded database.
+        """
+        database = cls(path)
+        with database.path.open("r") as f:
+            contents = json.load(f)
+
+        version = contents.get("version")
+        if version != OCTAVE_CALIBRATION_VERSION:
+            raise ValueError(
+                f"Unsupported Octave calibration database version {version} in "
+                f"{database.path}"
+            )
+
+        for key, rows in contents["entries"].items():
+            octave_name, RF_output_id = key.rsplit("/", 1)
+            for row in rows:
+                database.add(octave_name, int(RF_output_id), row)
+        return database
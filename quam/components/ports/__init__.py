@@ -4,6 +4,7 @@ from .base_ports import *
 from .digital_inputs import *
 from .digital_outputs import *
 from .ports_containers import *
+from .wiring_index import *
 
 __all__ = [
     *analog_outputs.__all__,
@@ -12,4 +13,5 @@ __all__ = [
     *digital_inputs.__all__,
     *digital_outputs.__all__,
     *ports_containers.__all__,
+    *wiring_index.__all__,
 ]
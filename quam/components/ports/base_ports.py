@@ -1,11 +1,12 @@
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, Tuple, Union
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Tuple, Type, Union
 
 from quam.core import QuamComponent, quam_dataclass
 
 
-__all__ = ["BasePort", "OPXPlusPort", "FEMPort"]
+__all__ = ["BasePort", "OPXPlusPort", "FEMPort", "get_port_flyweight"]
 
 
 @quam_dataclass
@@ -125,3 +126,61 @@ class FEMPort(BasePort, ABC):
         ports_cfg = fem_cfg.setdefault(f"{self.port_type}s", {})
         port_cfg = ports_cfg.setdefault(self.port_id, {})
         return port_cfg
+
+
+def _freeze_port_property(value: Any) -> Any:
+    """Convert a port property to a hashable value, lists are converted to tuples"""
+    if isinstance(value, str) or not hasattr(value, "__iter__"):
+        return value
+    if isinstance(value, dict) or hasattr(value, "keys"):
+        return ("__dict__",) + tuple(
+            (key, _freeze_port_property(val)) for key, val in value.items()
+        )
+    return tuple(_freeze_port_property(elem) for elem in value)
+
+
+def _thaw_port_property(value: Any) -> Any:
+    """Convert a value frozen by `_freeze_port_property` back to a list or dict"""
+    if not isinstance(value, tuple):
+        return value
+    if value[:1] == ("__dict__",):
+        return {key: _thaw_port_property(val) for key, val in value[1:]}
+    return [_thaw_port_property(elem) for elem in value]
+
+
+@lru_cache(maxsize=4096)
+def _get_cached_port(
+    port_cls: Type[BasePort], port_tuple: tuple, frozen_properties: tuple
+) -> BasePort:
+    port_properties = {key: _thaw_port_property(val) for key, val in frozen_properties}
+    return port_cls(*port_tuple, **port_properties)
+
+
+def get_port_flyweight(
+    port_cls: Type[BasePort], port_tuple: tuple, **port_properties
+) -> BasePort:
+    """Get a shared port object for a port tuple and its properties.
+
+    Channels whose ports are specified as tuples, e.g. `("con1", 1)`, create a port
+    object to add the port to the config. Instead of instantiating a new port on each
+    call, port objects are interned, keyed by the port class, port tuple and port
+    properties. The returned port is shared and should therefore not be modified.
+
+    Args:
+        port_cls: The port class, e.g. `OPXPlusAnalogOutputPort`.
+        port_tuple: The port tuple, either `(controller_id, port_id)` or
+            `(controller_id, fem_id, port_id)`.
+        **port_properties: Additional keyword arguments of the port class, e.g.
+            `offset`. Lists are compared by value.
+
+    Returns:
+        The port object.
+    """
+    frozen_properties = tuple(
+        (key, _freeze_port_property(val)) for key, val in port_properties.items()
+    )
+    try:
+        hash(frozen_properties)
+    except TypeError:
+        return port_cls(*port_tuple, **port_properties)
+    return _get_cached_port(port_cls, tuple(port_tuple), frozen_properties)
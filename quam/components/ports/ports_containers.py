@@ -1,4 +1,19 @@
-from typing import ClassVar, Dict, Optional, TypeVar, Union
+from collections import Counter
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from dataclasses import field
 from quam.components.ports.base_ports import FEMPort
 from quam.core import quam_dataclass, QuamComponent
@@ -16,9 +31,20 @@ from .analog_inputs import (
 from .digital_outputs import OPXPlusDigitalOutputPort, FEMDigitalOutputPort
 from .digital_inputs import OPXPlusDigitalInputPort
 
-
 __all__ = ["OPXPlusPortsContainer", "FEMPortsContainer"]
 
+# Number of ports of each port type, used for automatic port allocation
+OPX_PLUS_NUM_PORTS = {
+    "analog_output": 10,
+    "analog_input": 2,
+    "digital_output": 10,
+    "digital_input": 2,
+}
+FEM_NUM_PORTS = {
+    "LF": {"analog_output": 8, "analog_input": 2, "digital_output": 8},
+    "MW": {"mw_output": 8, "mw_input": 2, "digital_output": 8},
+}
+
 OPXPlusPortTypes = Union[
     OPXPlusAnalogInputPort,
     OPXPlusAnalogOutputPort,
@@ -34,8 +60,210 @@ FEMPortTypes = Union[
 ]
 
 
+@lru_cache(maxsize=4096)
+def _parse_port_reference(port_reference: str, num_port_elems: int) -> tuple:
+    """Parse a port reference into (port_type, controller_id, [fem_id,] port_id)
+
+    The port reference should end with "{port_type}s/{controller_id}/{port_id}" for
+    two port elements, or "{port_type}s/{controller_id}/{fem_id}/{port_id}" for three
+    port elements. Parsed references are cached.
+    """
+    elems = port_reference.split("/")
+    port_type, controller_id, *port_ids = elems[-(num_port_elems + 1) :]
+
+    if controller_id.isdigit():
+        controller_id = int(controller_id)
+    return (port_type[:-1], controller_id, *map(int, port_ids))
+
+
+def _get_port_index(ports_container: QuamComponent) -> Dict[tuple, Any]:
+    """Get the flat index `(port_type, controller_id, [fem_id,] port_id) -> port`
+
+    The index is filled when ports are retrieved or created, such that subsequent
+    lookups need only a single dict access instead of nested `QuamDict` lookups. It
+    is cleared whenever the structure of the ports container or any of its
+    descendants changes, e.g. when a port is replaced or removed, see
+    `QuamBase._structure_changed`.
+    """
+    # Bypass the reference checks of attribute access for speed
+    instance_dict = object.__getattribute__(ports_container, "__dict__")
+    subtree_version = instance_dict.get("_subtree_version", 0)
+    version, port_index = instance_dict.get("_port_index", (None, None))
+    if version != subtree_version:
+        port_index = {}
+        instance_dict["_port_index"] = (subtree_version, port_index)
+    return port_index
+
+
+def _allocate_ports(
+    requirements: Mapping[str, Sequence[str]],
+    free_ports: Dict[tuple, Dict[str, List[int]]],
+) -> Dict[str, List[Tuple[str, tuple]]]:
+    """Assign free ports of controllers / FEMs to port requirements.
+
+    All ports of a requirement are assigned to the same device. Requirements are
+    first placed first-fit in decreasing order of their number of ports, such that
+    e.g. IQ pairs are placed before single ports fragment the devices. This greedy pass
+    is fast but can fail for requirements of mixed port types, e.g. when an IQ pair is
+    placed on the only device with a free input that a readout requirement needs. In
+    that case a depth-first search over the devices of each requirement is performed,
+    which finds an assignment whenever one exists, but may take exponential time.
+
+    Args:
+        requirements: Mapping from a name to the port types it requires.
+        free_ports: Mapping from each device, in order of preference, to a mapping
+            from port type to the free port ids in descending order. The assigned port
+            ids are removed from the lists.
+
+    Returns:
+        Mapping from each name to a list of (port_type, port_tuple) tuples, in the
+        order of `requirements`.
+
+    Raises:
+        ValueError: If the requirements cannot be placed on the devices.
+    """
+    names = sorted(requirements, key=lambda name: -len(requirements[name]))
+    demands = []
+    for name in names:
+        port_types = requirements[name]
+        if isinstance(port_types, str):
+            raise TypeError(
+                f"Port requirement of {name} must be a sequence of port types, not a "
+                f"string: {port_types}"
+            )
+        demands.append(tuple(sorted(Counter(port_types).items())))
+
+    devices = list(free_ports)
+    capacities = [
+        {port_type: len(port_ids) for port_type, port_ids in free_ports[dev].items()}
+        for dev in devices
+    ]
+
+    placement = _place_first_fit(demands, [dict(cap) for cap in capacities])
+    if isinstance(placement, int):
+        name = names[placement]
+        if not any(_fits(cap, demands[placement]) for cap in capacities):
+            raise ValueError(
+                f"Could not allocate ports {list(requirements[name])} for {name}: no "
+                "controller / FEM has sufficient free ports"
+            )
+        placement = _place_depth_first(demands, capacities)
+        if placement is None:
+            raise ValueError(
+                f"Could not allocate ports {list(requirements[name])} for {name}: the "
+                "controllers / FEMs have insufficient free ports for all requirements"
+            )
+
+    allocations = {}
+    for name, idx in zip(names, placement):
+        device = devices[idx]
+        device_ports = free_ports[device]
+        allocations[name] = [
+            (port_type, (*device, device_ports[port_type].pop()))
+            for port_type in requirements[name]
+        ]
+    return {name: allocations[name] for name in requirements}
+
+
+def _fits(capacity: Dict[str, int], demand: Tuple[Tuple[str, int], ...]) -> bool:
+    """Whether a device with free port counts `capacity` can fit a demand"""
+    return all(capacity.get(port_type, 0) >= num for port_type, num in demand)
+
+
+def _place_first_fit(
+    demands: List[Tuple[Tuple[str, int], ...]], capacities: List[Dict[str, int]]
+) -> Union[List[int], int]:
+    """Place each demand on the first device that fits it.
+
+    Since the free ports of a device only decrease, a device that cannot fit a demand
+    is skipped for all subsequent identical demands.
+
+    Returns:
+        The device index of each demand, or the index of the first demand that could
+        not be placed. The capacities are updated in place.
+    """
+    first_candidates: Dict[tuple, int] = {}
+    placement = []
+    for demand_idx, demand in enumerate(demands):
+        idx = first_candidates.get(demand, 0)
+        while idx < len(capacities) and not _fits(capacities[idx], demand):
+            idx += 1
+        if idx == len(capacities):
+            return demand_idx
+        first_candidates[demand] = idx
+
+        for port_type, num in demand:
+            capacities[idx][port_type] -= num
+        placement.append(idx)
+    return placement
+
+
+def _place_depth_first(
+    demands: List[Tuple[Tuple[str, int], ...]], capacities: List[Dict[str, int]]
+) -> Optional[List[int]]:
+    """Place the demands on devices by backtracking search.
+
+    Devices are tried in order of preference. Devices with identical free ports are
+    interchangeable, so only the first of them is tried per demand, and combinations
+    of free ports from which the remaining demands are known not to fit are skipped.
+    The search is iterative to support many requirements.
+
+    Returns:
+        The device index of each demand, or None if no placement exists.
+    """
+
+    def get_state() -> tuple:
+        return tuple(sorted(tuple(sorted(cap.items())) for cap in capacities))
+
+    def iter_candidates(demand):
+        tried = set()
+        for idx, capacity in enumerate(capacities):
+            key = tuple(sorted(capacity.items()))
+            if key not in tried and _fits(capacity, demand):
+                tried.add(key)
+                yield idx
+
+    def update(idx, demand, sign):
+        for port_type, num in demand:
+            capacities[idx][port_type] += sign * num
+
+    failed_states = set()
+    placement: List[int] = []
+    candidates = [iter_candidates(demands[0])]
+    while candidates:
+        level = len(candidates) - 1
+        if len(placement) > level:
+            update(placement.pop(), demands[level], 1)
+
+        idx = next(candidates[-1], None)
+        if idx is None:
+            failed_states.add((level, get_state()))
+            candidates.pop()
+            continue
+
+        update(idx, demands[level], -1)
+        placement.append(idx)
+        if len(placement) == len(demands):
+            return placement
+        if (level + 1, get_state()) not in failed_states:
+            candidates.append(iter_candidates(demands[level + 1]))
+    return None
+
+
+def _get_used_port_ids(
+    used_ports: Optional[Iterable[Tuple[str, tuple]]],
+) -> Dict[Tuple[str, tuple], set]:
+    """Group the keys (port_type, port_tuple) of used ports by port type and device"""
+    used_port_ids = {}
+    for port_type, port_tuple in used_ports or ():
+        key = (port_type, tuple(port_tuple[:-1]))
+        used_port_ids.setdefault(key, set()).add(port_tuple[-1])
+    return used_port_ids
+
+
 @quam_dataclass
 class OPXPlusPortsContainer(QuamComponent):
+    num_port_elems: ClassVar[int] = 2
     analog_outputs: Dict[Union[str, int], Dict[int, OPXPlusAnalogOutputPort]] = field(
         default_factory=dict
     )
@@ -57,10 +285,17 @@ class OPXPlusPortsContainer(QuamComponent):
         create: bool = False,
         **kwargs,
     ):
+        port_key = (port_type, controller_id, port_id)
+        port = _get_port_index(self).get(port_key)
+        if port is not None:
+            return port
+
         controllers = getattr(self, f"{port_type}s")
 
         try:
-            return controllers[controller_id][port_id]
+            port = controllers[controller_id][port_id]
+            _get_port_index(self)[port_key] = port
+            return port
         except KeyError:
             if not create:
                 raise KeyError(
@@ -82,7 +317,9 @@ class OPXPlusPortsContainer(QuamComponent):
         else:
             raise ValueError(f"Invalid port type: {port_type}")
 
-        return ports[port_id]
+        port = ports[port_id]
+        _get_port_index(self)[port_key] = port
+        return port
 
     def reference_to_port(
         self,
@@ -95,16 +332,71 @@ class OPXPlusPortsContainer(QuamComponent):
             if reference is None:
                 raise ValueError("Cannot get port from reference {port_reference}")
             port_reference = reference
-        elems = port_reference.split("/")
-        port_type, controller_id, port_id = elems[-3:]
-
-        port_type = port_type[:-1]
-        if controller_id.isdigit():
-            controller_id = int(controller_id)
-        port_id = int(port_id)
+        port_key = _parse_port_reference(port_reference, type(self).num_port_elems)
+        port = _get_port_index(self).get(port_key)
+        if port is not None:
+            return port
 
+        port_type, controller_id, port_id = port_key
         return self._get_port(controller_id, port_id, port_type, create=create)
 
+    def allocate_ports(
+        self,
+        requirements: Mapping[str, Sequence[str]],
+        controllers: Collection[Union[str, int]],
+        used_ports: Optional[Iterable[Tuple[str, tuple]]] = None,
+        create_ports: bool = True,
+    ) -> Dict[str, List[str]]:
+        """Automatically assign free ports to channels.
+
+        All ports of a requirement, e.g. the I and Q ports of an IQ channel, are
+        assigned to the same controller. Ports that already exist in this container,
+        or that are in `used_ports`, are not assigned.
+
+        Args:
+            requirements: Mapping from a name, e.g. the channel name, to the port types
+                it requires. Port types are "analog_output", "analog_input",
+                "digital_output" and "digital_input", e.g.
+                `{"q1.xy": ["analog_output", "analog_output"]}`.
+            controllers: The controllers to assign ports of, in order of preference.
+            used_ports: Optional keys `(port_type, port_tuple)` of ports that are
+                already used, e.g. `WiringIndex.used_ports`.
+            create_ports: Whether to create the assigned ports in this container.
+                Creating the port objects dominates the allocation time, so this can
+                be disabled to only determine the port references.
+
+        Returns:
+            Mapping from each name to the references of the assigned ports, which can
+            be used as the port attributes of channels.
+
+        Raises:
+            ValueError: If there are insufficient free ports.
+        """
+        used_port_ids = _get_used_port_ids(used_ports)
+
+        free_ports = {}
+        for controller_id in controllers:
+            free_ports[(controller_id,)] = device_ports = {}
+            for port_type, num_ports in OPX_PLUS_NUM_PORTS.items():
+                existing_ports = getattr(self, f"{port_type}s").get(controller_id, {})
+                used_ids = used_port_ids.get((port_type, (controller_id,)), ())
+                device_ports[port_type] = [
+                    port_id
+                    for port_id in range(num_ports, 0, -1)
+                    if port_id not in existing_ports and port_id not in used_ids
+                ]
+
+        base_reference = "#" if self.parent is None else self.get_reference()
+        references = {}
+        for name, ports in _allocate_ports(requirements, free_ports).items():
+            references[name] = []
+            for port_type, (controller_id, port_id) in ports:
+                reference = f"{base_reference}/{port_type}s/{controller_id}/{port_id}"
+                if create_ports:
+                    self.reference_to_port(reference, create=True)
+                references[name].append(reference)
+        return references
+
     def get_analog_output(
         self,
         controller_id: Union[str, int],
@@ -178,10 +470,17 @@ class FEMPortsContainer(QuamComponent):
         create: bool = False,
         **kwargs,
     ):
+        port_key = (port_type, controller_id, fem_id, port_id)
+        port = _get_port_index(self).get(port_key)
+        if port is not None:
+            return port
+
         controllers = getattr(self, f"{port_type}s")
 
         try:
-            return controllers[controller_id][fem_id][port_id]
+            port = controllers[controller_id][fem_id][port_id]
+            _get_port_index(self)[port_key] = port
+            return port
         except KeyError:
             if not create:
                 raise KeyError(
@@ -224,7 +523,9 @@ class FEMPortsContainer(QuamComponent):
         else:
             raise ValueError(f"Invalid port type: {port_type}")
 
-        return ports[port_id]
+        port = ports[port_id]
+        _get_port_index(self)[port_key] = port
+        return port
 
     def reference_to_port(
         self,
@@ -238,17 +539,91 @@ class FEMPortsContainer(QuamComponent):
                 raise ValueError("Cannot get port from reference {port_reference}")
             port_reference = reference
 
-        elems = port_reference.split("/")
-        port_type, controller_id, fem_id, port_id = elems[-4:]
-
-        port_type = port_type[:-1]
-        if controller_id.isdigit():
-            controller_id = int(controller_id)
-        fem_id = int(fem_id)
-        port_id = int(port_id)
+        port_key = _parse_port_reference(port_reference, type(self).num_port_elems)
+        port = _get_port_index(self).get(port_key)
+        if port is not None:
+            return port
 
+        port_type, controller_id, fem_id, port_id = port_key
         return self._get_port(controller_id, fem_id, port_id, port_type, create=create)
 
+    def allocate_ports(
+        self,
+        requirements: Mapping[str, Sequence[str]],
+        fems: Mapping[Union[str, int], Mapping[int, str]],
+        used_ports: Optional[Iterable[Tuple[str, tuple]]] = None,
+        create_ports: bool = True,
+    ) -> Dict[str, List[str]]:
+        """Automatically assign free FEM ports to channels.
+
+        All ports of a requirement, e.g. the I and Q ports of an IQ channel, are
+        assigned to the same FEM, which must be an LF-FEM for "analog_output" and
+        "analog_input" ports, and an MW-FEM for "mw_output" and "mw_input" ports.
+        Ports that already exist in this container, or that are in `used_ports`, are
+        not assigned.
+
+        Args:
+            requirements: Mapping from a name, e.g. the channel name, to the port types
+                it requires. Port types are "analog_output", "analog_input",
+                "mw_output", "mw_input" and "digital_output", e.g.
+                `{"q1.z": ["analog_output"], "q1.xy": ["mw_output"]}`.
+            fems: Mapping from controller id to a mapping from FEM id to the FEM type,
+                either "LF" or "MW", e.g. `{"con1": {1: "LF", 2: "MW"}}`. FEMs are
+                assigned in this order of preference.
+            used_ports: Optional keys `(port_type, port_tuple)` of ports that are
+                already used, e.g. `WiringIndex.used_ports`.
+            create_ports: Whether to create the assigned ports in this container.
+                Creating the port objects dominates the allocation time, so this can
+                be disabled to only determine the port references.
+
+        Returns:
+            Mapping from each name to the references of the assigned ports, which can
+            be used as the port attributes of channels.
+
+        Raises:
+            ValueError: If there are insufficient free ports.
+        """
+        used_port_ids = _get_used_port_ids(used_ports)
+
+        free_ports = {}
+        for controller_id, controller_fems in fems.items():
+            for fem_id, fem_type in controller_fems.items():
+                if fem_type not in FEM_NUM_PORTS:
+                    raise ValueError(
+                        f"Invalid type of FEM ({controller_id}, {fem_id}): {fem_type}. "
+                        f"Must be one of {list(FEM_NUM_PORTS)}"
+                    )
+                free_ports[(controller_id, fem_id)] = device_ports = {}
+                for port_type, num_ports in FEM_NUM_PORTS[fem_type].items():
+                    existing_ports = (
+                        getattr(self, f"{port_type}s")
+                        .get(controller_id, {})
+                        .get(fem_id, {})
+                    )
+                    # Ports objects of MW-FEMs have port type analog_output/input
+                    used_key = port_type.replace("mw_", "analog_")
+                    used_ids = used_port_ids.get(
+                        (used_key, (controller_id, fem_id)), ()
+                    )
+                    device_ports[port_type] = [
+                        port_id
+                        for port_id in range(num_ports, 0, -1)
+                        if port_id not in existing_ports and port_id not in used_ids
+                    ]
+
+        base_reference = "#" if self.parent is None else self.get_reference()
+        references = {}
+        for name, ports in _allocate_ports(requirements, free_ports).items():
+            references[name] = []
+            for port_type, (controller_id, fem_id, port_id) in ports:
+                reference = (
+                    f"{base_reference}/{port_type}s/{controller_id}/{fem_id}/{port_id}"
+                )
+                if create_ports:
+                    self.reference_to_port(reference, create=True)
+                references[name].append(reference)
+        return references
+
     def get_analog_output(
         self,
         controller_id: Union[str, int],
@@ -0,0 +1,340 @@
+from dataclasses import fields, is_dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from quam.components.ports.analog_inputs import (
+    LFFEMAnalogInputPort,
+    OPXPlusAnalogInputPort,
+)
+from quam.components.ports.analog_outputs import (
+    LFFEMAnalogOutputPort,
+    OPXPlusAnalogOutputPort,
+)
+from quam.components.ports.base_ports import BasePort, get_port_flyweight
+from quam.components.ports.digital_outputs import (
+    FEMDigitalOutputPort,
+    OPXPlusDigitalOutputPort,
+)
+from quam.core.quam_classes import QuamBase, QuamDict, QuamList
+from quam.utils import string_reference as str_ref
+
+__all__ = ["WiringIndex"]
+
+
+PortKey = Tuple[str, tuple]
+PortUser = Tuple[QuamBase, str]
+Port = Union[BasePort, tuple]
+
+# Attributes of channels that specify a port, and the port type of a port tuple
+PORT_ATTRS = {
+    "opx_output": "analog_output",
+    "opx_output_I": "analog_output",
+    "opx_output_Q": "analog_output",
+    "opx_input": "analog_input",
+    "opx_input_I": "analog_input",
+    "opx_input_Q": "analog_input",
+}
+
+# Port classes of an OPX+ port tuple and an OPX1000 FEM port tuple, see `_get_port`
+PORT_CLASSES = {
+    "analog_output": (OPXPlusAnalogOutputPort, LFFEMAnalogOutputPort),
+    "analog_input": (OPXPlusAnalogInputPort, LFFEMAnalogInputPort),
+    "digital_output": (OPXPlusDigitalOutputPort, FEMDigitalOutputPort),
+}
+
+# Channel attributes that set port properties when a port is a port tuple
+PORT_PROPERTY_ATTRS = {
+    "opx_output": {
+        "offset": "opx_output_offset",
+        "feedforward_filter": "filter_fir_taps",
+        "feedback_filter": "filter_iir_taps",
+    },
+    "opx_output_I": {"offset": "opx_output_offset_I"},
+    "opx_output_Q": {"offset": "opx_output_offset_Q"},
+    "opx_input": {"offset": "opx_input_offset"},
+    "opx_input_I": {"offset": "opx_input_offset_I", "gain_db": "input_gain"},
+    "opx_input_Q": {"offset": "opx_input_offset_Q", "gain_db": "input_gain"},
+}
+DIGITAL_PORT_PROPERTY_ATTRS = {"shareable": "shareable", "inverted": "inverted"}
+
+
+def _is_port_tuple(value) -> bool:
+    """Check whether a value is a port tuple, i.e. (con, port) or (con, fem, port)"""
+    if not isinstance(value, (tuple, list, QuamList)) or len(value) not in [2, 3]:
+        return False
+    return all(isinstance(elem, int) for elem in list(value)[1:])
+
+
+class WiringIndex:
+    """Index of the controller / FEM ports used by the channels of a QuAM.
+
+    The index maps each port to the components that use it, and is built in a single
+    pass over all components. Ports can be specified by channels as port tuples, e.g.
+    `("con1", 1, 2)`, as references to ports of a `FEMPortsContainer` or
+    `OPXPlusPortsContainer`, or as `BasePort` objects.
+
+    Each port is identified by a key `(port_type, port_tuple)`, e.g.
+    `("analog_output", ("con1", 1, 2))`, where the port type is one of
+    "analog_output", "analog_input", "digital_output" and "digital_input".
+
+    The index can be updated incrementally using `WiringIndex.add_component` and
+    `WiringIndex.remove_component` when channels are added, removed or rewired.
+
+    Args:
+        root: The QuAM object whose components to index, usually the QuamRoot.
+            If None, an empty index is created.
+
+    Example:
+        ```
+        wiring = WiringIndex(machine)
+        wiring.get_users(("con1", 1, 2), port_type="analog_output")
+        wiring.conflicts  # Ports used by components with different port settings
+        wiring.get_occupancy()  # Used ports per controller / FEM
+        ```
+    """
+
+    def __init__(self, root: Optional[QuamBase] = None):
+        # Port users are stored as (component, attr, port) tuples, where port is the
+        # port object or port tuple
+        self._users: Dict[PortKey, List[Tuple[QuamBase, str, Port]]] = {}
+        self._component_ports: Dict[int, List[PortKey]] = {}
+        self._defined_ports: Dict[PortKey, BasePort] = {}
+
+        if root is not None:
+            for component in root.iterate_components():
+                self.add_component(component)
+
+    @staticmethod
+    def get_port_key(
+        port: Union[BasePort, Sequence[Union[str, int]]],
+        port_type: Optional[str] = None,
+    ) -> PortKey:
+        """Get the key of a port in the index.
+
+        Args:
+            port: A port object or port tuple.
+            port_type: The port type, required if `port` is a port tuple.
+
+        Returns:
+            The port key `(port_type, port_tuple)`.
+        """
+        if isinstance(port, BasePort):
+            return port.port_type, tuple(port.port_tuple)
+        if port_type is None:
+            raise ValueError(f"The port type must be specified for port tuple {port}")
+        return port_type, tuple(port)
+
+    def _get_component_ports(
+        self, component: QuamBase
+    ) -> List[Tuple[str, PortKey, Port]]:
+        """Get the ports used by a component
+
+        Returns:
+            A list of (attr, port_key, port) tuples, where port is the port object or
+            port tuple.
+        """
+        from quam.components.channels import DigitalOutputChannel
+
+        if isinstance(component, (QuamDict, QuamList)) or not is_dataclass(component):
+            return []
+
+        component_ports = []
+        for data_field in fields(component):
+            attr = data_field.name
+            if attr not in PORT_ATTRS:
+                continue
+
+            value = component.__dict__.get(attr)
+            if str_ref.is_reference(value):
+                try:
+                    value = getattr(component, attr)
+                except (AttributeError, KeyError, ValueError):
+                    continue
+
+            if isinstance(value, BasePort):
+                component_ports.append((attr, self.get_port_key(value), value))
+            elif _is_port_tuple(value):
+                if isinstance(component, DigitalOutputChannel):
+                    port_type = "digital_output"
+                else:
+                    port_type = PORT_ATTRS[attr]
+                port_key = self.get_port_key(value, port_type=port_type)
+                component_ports.append((attr, port_key, tuple(value)))
+        return component_ports
+
+    @staticmethod
+    def _get_port_properties(
+        component: QuamBase, attr: str, port_key: PortKey, port: Port
+    ) -> dict:
+        """Get the properties a component sets for a port in the QUA config.
+
+        For a port tuple, these are the properties of the port object created by the
+        channel when it's added to the config, see `get_port_flyweight`.
+        """
+        from quam.components.channels import DigitalOutputChannel
+
+        if isinstance(port, BasePort):
+            return port.get_port_properties()
+
+        port_type = port_key[0]
+        if isinstance(component, DigitalOutputChannel):
+            property_attrs = DIGITAL_PORT_PROPERTY_ATTRS
+        else:
+            property_attrs = PORT_PROPERTY_ATTRS[attr]
+
+        port_properties = {}
+        for port_property, channel_attr in property_attrs.items():
+            value = getattr(component, channel_attr, None)
+            if value is None:
+                continue
+            if isinstance(value, QuamList):
+                value = list(value)
+            port_properties[port_property] = value
+
+        port_classes = PORT_CLASSES[port_type]
+        port_cls = port_classes[0] if len(port) == 2 else port_classes[1]
+        port_obj = get_port_flyweight(port_cls, port, **port_properties)
+        return port_obj.get_port_properties()
+
+    def add_component(self, component: QuamBase) -> None:
+        """Add the ports used by a component to the index.
+
+        Port objects, e.g. those in a ports container, are registered as defined
+        ports, see `WiringIndex.unused_ports`. If the component is already indexed,
+        it is first removed, such that this can be used to update a rewired channel.
+
+        Args:
+            component: The QuAM component, e.g. a channel or port.
+        """
+        if id(component) in self._component_ports:
+            self.remove_component(component)
+
+        if isinstance(component, BasePort):
+            self._defined_ports[self.get_port_key(component)] = component
+
+        port_keys = []
+        for attr, port_key, port in self._get_component_ports(component):
+            self._users.setdefault(port_key, []).append((component, attr, port))
+            port_keys.append(port_key)
+        self._component_ports[id(component)] = port_keys
+
+    def remove_component(self, component: QuamBase) -> None:
+        """Remove the ports used by a component from the index.
+
+        Args:
+            component: The QuAM component, e.g. a channel or port.
+        """
+        if isinstance(component, BasePort):
+            self._defined_ports.pop(self.get_port_key(component), None)
+
+        for port_key in self._component_ports.pop(id(component), []):
+            users = [user for user in self._users[port_key] if user[0] is not component]
+            if users:
+                self._users[port_key] = users
+            else:
+                self._users.pop(port_key)
+
+    def get_users(
+        self,
+        port: Union[BasePort, Sequence[Union[str, int]]],
+        port_type: Optional[str] = None,
+    ) -> List[PortUser]:
+        """Get the components that use a port.
+
+        Args:
+            port: A port object or port tuple.
+            port_type: The port type, required if `port` is a port tuple.
+
+        Returns:
+            A list of (component, attr) tuples, where attr is the attribute of the
+            component that specifies the port, e.g. "opx_output_I".
+        """
+        users = self._users.get(self.get_port_key(port, port_type), [])
+        return [(component, attr) for component, attr, _ in users]
+
+    @property
+    def used_ports(self) -> List[PortKey]:
+        """The keys of all ports that are used by at least one component"""
+        return list(self._users)
+
+    @property
+    def conflicts(self) -> Dict[PortKey, List[PortUser]]:
+        """Ports that are used by multiple components with different port settings.
+
+        Ports can be shared by multiple components, e.g. the output and input ports of
+        a feedline that are used by frequency-multiplexed readout resonators. A port
+        is only a conflict if its users configure it differently, e.g. with different
+        DC offsets, in which case generating the QUA config would overwrite the
+        settings of one user with those of another. Properties that are only set by
+        some of the users aren't compared. Note that the I and Q ports of a single IQ
+        channel are distinct ports.
+
+        Returns:
+            A dictionary mapping the key of each conflicting port to all its users.
+        """
+        conflicts = {}
+        for port_key, users in self._users.items():
+            user_components = {id(component) for component, _, _ in users}
+            if len(user_components) < 2:
+                continue
+
+            port_config = {}
+            for component, attr, port in users:
+                port_properties = self._get_port_properties(
+                    component, attr, port_key, port
+                )
+                if any(
+                    key in port_config and value != port_config[key]
+                    for key, value in port_properties.items()
+                ):
+                    conflicts[port_key] = [
+                        (component, attr) for component, attr, _ in users
+                    ]
+                    break
+                port_config.update(port_properties)
+        return conflicts
+
+    @property
+    def unused_ports(self) -> List[BasePort]:
+        """Port objects in QuAM, e.g. in a ports container, that aren't used"""
+        return [
+            port
+            for port_key, port in self._defined_ports.items()
+            if port_key not in self._users
+        ]
+
+    def get_occupancy(self) -> Dict[tuple, Dict[str, List[int]]]:
+        """Get the used ports per controller / FEM.
+
+        Returns:
+            A dictionary mapping each device, either `(controller,)` for an OPX+ or
+            `(controller, fem)` for an OPX1000 FEM, to a dictionary mapping each port
+            type to the sorted ids of the used ports.
+        """
+        occupancy = {}
+        for port_type, port_tuple in self._users:
+            device_ports = occupancy.setdefault(port_tuple[:-1], {})
+            device_ports.setdefault(port_type, []).append(port_tuple[-1])
+        for device_ports in occupancy.values():
+            for port_ids in device_ports.values():
+                port_ids.sort()
+        return occupancy
+
+    def get_free_ports(
+        self, device: tuple, port_type: str, port_ids: Iterable[int]
+    ) -> List[int]:
+        """Get the ports of a controller / FEM that aren't used.
+
+        Args:
+            device: Either `(controller,)` for an OPX+ or `(controller, fem)` for an
+                OPX1000 FEM.
+            port_type: The port type, e.g. "analog_output".
+            port_ids: The ids of all the ports of this type on the device.
+
+        Returns:
+            The ids of the unused ports, in the order of `port_ids`.
+        """
+        return [
+            port_id
+            for port_id in port_ids
+            if (port_type, (*device, port_id)) not in self._users
+        ]
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, partial
 import numbers
 import warnings
-from typing import Any, ClassVar, Dict, List, Union, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Union, Tuple
 import numpy as np
 
 from quam.core import QuamComponent, quam_dataclass
@@ -18,8 +22,27 @@ __all__ = [
     "GaussianPulse",
     "FlatTopGaussianPulse",
     "ConstantReadoutPulse",
+    "convert_integration_weights",
+    "compress_integration_weights",
+    "drag_gaussian_waveform",
+    "flattop_gaussian_waveform",
+    "calculate_waveforms",
+    "precompute_waveforms",
+    "defer_waveforms",
+    "single_precision_waveforms",
 ]
 
+# Waveforms calculated by `precompute_waveforms`, mapping the id of each pulse to a
+# (pulse, waveform) tuple. A context variable is used such that nested contexts and
+# configs generated concurrently in different threads don't interfere.
+_precomputed_waveforms: ContextVar[Optional[Dict[int, Tuple[Any, Any]]]] = ContextVar(
+    "precomputed_waveforms", default=None
+)
+# Whether waveforms are added as lazy waveforms, see `defer_waveforms`
+_lazy_waveforms: ContextVar[bool] = ContextVar("lazy_waveforms", default=False)
+# Whether waveforms are stored in single precision, see `single_precision_waveforms`
+_single_precision: ContextVar[bool] = ContextVar("single_precision", default=False)
+
 
 @quam_dataclass
 class Pulse(QuamComponent):
@@ -42,7 +65,8 @@ class Pulse(QuamComponent):
     Args:
         operation (str): The operation of the pulse, either "control" or "measurement".
             Default is "control".
-        length (int): The length of the pulse in samples.
+        length (int): The length of the pulse in ns, which equals the number of
+            samples for the default sampling rate of 1 GS/s, see `Pulse.sampling_rate`.
         digital_marker (str, list, optional): The digital marker to use for the pulse.
             Can be a string, in which case it is a reference to a digital marker in the
             config, or a list of tuples of (sample, length) pairs. Default is None.
@@ -85,7 +109,7 @@ class Pulse(QuamComponent):
         if self.id is not None:
             name = self.id
         else:
-            name = self.parent.get_attr_name(self)
+            name = self._attr_name_in_parent
 
         return f"{self.channel.name}{str_ref.DELIMITER}{name}"
 
@@ -101,6 +125,19 @@ class Pulse(QuamComponent):
     def digital_marker_name(self):
         return f"{self.name}{str_ref.DELIMITER}dm"
 
+    @property
+    def sampling_rate(self) -> float:
+        """The sampling rate of the waveform in samples per second.
+
+        This is the sampling rate of the channel's output port, see
+        `Channel.sampling_rate`, or 1 GS/s if the pulse isn't attached to a channel.
+        The pulse length is always in ns, so a waveform has
+        `length * sampling_rate / 1e9` samples.
+        """
+        if self.channel is None:
+            return 1e9
+        return self.channel.sampling_rate
+
     def calculate_waveform(self) -> Union[float, complex, List[float], List[complex]]:
         """Calculate the waveform of the pulse.
 
@@ -116,6 +153,9 @@ class Pulse(QuamComponent):
             - a single complex number for a constant IQ waveform,
             - a list of floats for an arbitrary single-channel waveform,
             - a list of complex numbers for an arbitrary IQ waveform,
+
+            Within `single_precision_waveforms`, arbitrary waveforms are returned as
+            float32 or complex64 arrays.
         """
         waveform = self.waveform_function()
 
@@ -126,8 +166,34 @@ class Pulse(QuamComponent):
             else:
                 waveform = waveform[0] + 1.0j * waveform[1]
 
+        if _single_precision.get():
+            waveform = _to_single_precision(waveform)
         return waveform
 
+    @classmethod
+    def calculate_waveforms_batch(
+        cls, pulses: Sequence["Pulse"]
+    ) -> List[Union[float, complex, np.ndarray]]:
+        """Calculate the waveforms of multiple pulses of this class at once.
+
+        All pulses must be instances of this class and have the same length and
+        sampling rate.
+        By default, `Pulse.calculate_waveform` is called for each pulse. Subclasses can
+        override this to evaluate all waveforms in a single vectorised call, in which
+        case the result for each pulse must equal that of `calculate_waveform`.
+
+        Note that the batched evaluation is only used by `calculate_waveforms` if the
+        class that defines `waveform_function` also defines this method, such that
+        subclasses overriding `waveform_function` aren't evaluated incorrectly.
+
+        Args:
+            pulses: The pulses whose waveforms to calculate.
+
+        Returns:
+            The waveforms, in the same order as `pulses`.
+        """
+        return [pulse.calculate_waveform() for pulse in pulses]
+
     def waveform_function(
         self,
     ) -> Union[
@@ -155,6 +221,41 @@ class Pulse(QuamComponent):
         """
         ...
 
+    @property
+    def segment_labels(self) -> Optional[List[str]]:
+        """Labels of the segments if the pulse is added to the config piecewise.
+
+        By default a pulse is added to the config as a single pulse, in which case this
+        is None. Pulses that are split into segments, e.g. a rise, a constant plateau
+        and a fall, return the segment labels, see `Pulse.waveform_segments`.
+        """
+        return None
+
+    @property
+    def segment_pulse_mapping(self) -> Dict[str, str]:
+        """Mapping from segment label to the name of its pulse in the config"""
+        return {
+            label: f"{self.name}{str_ref.DELIMITER}{label}{str_ref.DELIMITER}pulse"
+            for label in self.segment_labels or []
+        }
+
+    def waveform_segments(
+        self,
+    ) -> Optional[Dict[str, Tuple[int, Union[float, complex, np.ndarray]]]]:
+        """Calculate the piecewise representation of the waveform.
+
+        Only implemented for pulses with `segment_labels`, whose segments are added to
+        the config as separate pulses. This allows e.g. a long constant plateau to be
+        represented by a constant waveform instead of storing all its samples.
+        `Pulse.calculate_waveform` still returns the complete waveform.
+
+        Returns:
+            None if the pulse isn't segmented, otherwise a dict mapping each segment
+            label to a tuple of (length, waveform), where the waveform can be any of
+            the types returned by `Pulse.calculate_waveform`.
+        """
+        return None
+
     def _config_add_pulse(self, config: Dict[str, Any]):
         """Add the pulse to the config
 
@@ -178,21 +279,118 @@ class Pulse(QuamComponent):
         For an IQ waveform, two config entries are added to
         `config["waveforms"]["{channel_name}.{pulse_name}.wf.I"]` and with suffix `Q`.
 
+        Arbitrary waveform samples are added as float numpy arrays. These are
+        converted to lists by `quam.utils.config.convert_config_arrays_to_lists` at
+        the end of `QuamRoot.generate_config`.
+
         Raises:
             ValueError: If the waveform type (single or IQ) does not match the parent
                 channel type (SingleChannel, IQChannel, InOutIQChannel).
         """
 
-        from quam.components.channels import SingleChannel, IQChannel
-
-        pulse_config = config["pulses"][self.pulse_name]
+        if _lazy_waveforms.get():
+            self._config_add_lazy_waveforms(config)
+            return
 
-        waveform = self.calculate_waveform()
+        precomputed_waveforms = _precomputed_waveforms.get()
+        pulse, waveform = (precomputed_waveforms or {}).get(id(self), (None, None))
+        if pulse is not self:
+            waveform = self.calculate_waveform()
         if waveform is None:
             return
 
+        self._config_add_waveform(
+            config,
+            waveform,
+            pulse_name=self.pulse_name,
+            waveform_name=self.waveform_name,
+        )
+
+    def _config_add_waveform(
+        self,
+        config: Dict[str, Any],
+        waveform: Union[float, complex, np.ndarray],
+        pulse_name: str,
+        waveform_name: str,
+    ):
+        """Add a waveform to the config and register it in a pulse config entry
+
+        Args:
+            config: The QUA config.
+            waveform: The waveform, as returned by `Pulse.calculate_waveform`.
+            pulse_name: The name of the config pulse that uses the waveform.
+            waveform_name: The name of the config waveform. For IQ waveforms, the
+                suffixes "I" and "Q" are appended.
+        """
+        pulse_config = config["pulses"][pulse_name]
         pulse_config["waveforms"] = {}
 
+        waveform_entries = self._get_waveform_config_entries(waveform)
+        for suffix, waveform_entry in waveform_entries.items():
+            full_waveform_name = waveform_name
+            if suffix != "single":
+                full_waveform_name += f"{str_ref.DELIMITER}{suffix}"
+
+            config["waveforms"][full_waveform_name] = waveform_entry
+            pulse_config["waveforms"][suffix] = full_waveform_name
+
+    def _config_add_lazy_waveforms(self, config: Dict[str, Any]):
+        """Add lazy waveforms to the config, whose samples are calculated on access
+
+        The waveform names are determined from the channel type, such that the
+        waveform doesn't need to be calculated. See
+        [`LazyWaveform`][quam.utils.config.LazyWaveform] for details.
+        """
+        from quam.components.channels import IQChannel
+        from quam.utils.config import LazyWaveform
+
+        waveform_entries = {}
+        single_precision = _single_precision.get()
+
+        def get_waveform_entry(suffix):
+            if not waveform_entries:
+                with single_precision_waveforms(single_precision):
+                    waveform = self.calculate_waveform()
+                    if waveform is None:
+                        raise ValueError(
+                            f"Pulse '{self.name}' does not have a waveform"
+                        )
+                    entries = self._get_waveform_config_entries(waveform)
+                waveform_entries.update(entries)
+            return waveform_entries[suffix]
+
+        pulse_config = config["pulses"][self.pulse_name]
+        pulse_config["waveforms"] = {}
+
+        suffixes = ["I", "Q"] if isinstance(self.channel, IQChannel) else ["single"]
+        for suffix in suffixes:
+            waveform_name = self.waveform_name
+            if suffix != "single":
+                waveform_name += f"{str_ref.DELIMITER}{suffix}"
+
+            config["waveforms"][waveform_name] = LazyWaveform(
+                partial(get_waveform_entry, suffix)
+            )
+            pulse_config["waveforms"][suffix] = waveform_name
+
+    def _get_waveform_config_entries(
+        self, waveform: Union[float, complex, np.ndarray]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Convert a waveform to config waveform entries
+
+        Args:
+            waveform: The waveform, as returned by `Pulse.calculate_waveform`.
+
+        Returns:
+            A dict mapping the waveform suffix ("single", or "I" and "Q") to the
+            corresponding config waveform entry.
+
+        Raises:
+            ValueError: If the waveform type (single or IQ) does not match the parent
+                channel type (SingleChannel, IQChannel, InOutIQChannel).
+        """
+        from quam.components.channels import SingleChannel, IQChannel
+
         if isinstance(waveform, numbers.Number):
             wf_type = "constant"
             if isinstance(waveform, complex):
@@ -203,13 +401,25 @@ class Pulse(QuamComponent):
                 waveforms = {"single": waveform}
 
         elif isinstance(waveform, (list, np.ndarray)):
+            # Samples are kept as contiguous float arrays, these are only converted to
+            # lists at the end of `QuamRoot.generate_config`
             wf_type = "arbitrary"
+            waveform = np.asarray(waveform)
+            single_precision = _single_precision.get()
+            if single_precision:
+                waveform = _to_single_precision(waveform)
             if np.iscomplexobj(waveform):
-                waveforms = {"I": list(waveform.real), "Q": list(waveform.imag)}
-            elif isinstance(self.channel, IQChannel):
-                waveforms = {"I": waveform, "Q": np.zeros_like(waveform)}
+                waveforms = {
+                    "I": np.ascontiguousarray(waveform.real),
+                    "Q": np.ascontiguousarray(waveform.imag),
+                }
             else:
-                waveforms = {"single": list(waveform)}
+                dtype = np.float32 if single_precision else float
+                waveform = waveform.astype(dtype, copy=False)
+                if isinstance(self.channel, IQChannel):
+                    waveforms = {"I": waveform, "Q": np.zeros_like(waveform)}
+                else:
+                    waveforms = {"single": waveform}
         else:
             raise ValueError("unsupported return type")
 
@@ -225,30 +435,28 @@ class Pulse(QuamComponent):
                 f" '{self.channel.name}'"
             )
 
-        for suffix, waveform in waveforms.items():
-            waveform_name = self.waveform_name
-            if suffix != "single":
-                waveform_name += f"{str_ref.DELIMITER}{suffix}"
-
-            sample_label = "sample" if wf_type == "constant" else "samples"
-
-            config["waveforms"][waveform_name] = {
-                "type": wf_type,
-                sample_label: waveform,
-            }
-            pulse_config["waveforms"][suffix] = waveform_name
+        sample_label = "sample" if wf_type == "constant" else "samples"
+        return {
+            suffix: {"type": wf_type, sample_label: waveform}
+            for suffix, waveform in waveforms.items()
+        }
 
-    def _config_add_digital_markers(self, config):
+    def _config_add_digital_markers(self, config, pulse_name: str = None):
         """Add the digital marker to the config
 
         The config entry is added to
         `config["digital_waveforms"]["{channel_name}.{pulse_name}.dm"]` and also
         registered in
-        `config["pulses"]["{channel_name}.{pulse_name}.pulse"]["digital_marker"]`.
+        `config["pulses"]["{channel_name}.{pulse_name}.pulse"]["digital_marker"]`,
+        or in `config["pulses"][pulse_name]["digital_marker"]` if `pulse_name` is
+        provided.
 
         If the digital marker is a string, it is assumed to be a reference to a
         digital marker already defined in the config.
         """
+        if pulse_name is None:
+            pulse_name = self.pulse_name
+
         if isinstance(self.digital_marker, str):
             # Use a common config digital marker
             if self.digital_marker not in config["digital_waveforms"]:
@@ -263,17 +471,51 @@ class Pulse(QuamComponent):
             }
             digital_marker_name = self.digital_marker_name
 
-        config["pulses"][self.pulse_name]["digital_marker"] = digital_marker_name
+        config["pulses"][pulse_name]["digital_marker"] = digital_marker_name
+
+    def _config_add_waveform_segments(self, config: Dict[str, Any]):
+        """Add each waveform segment to the config as a separate pulse
+
+        For each segment label, the pulse is added to
+        `config["pulses"]["{channel_name}.{pulse_name}.{segment_label}.pulse"]`, and
+        its waveform to
+        `config["waveforms"]["{channel_name}.{pulse_name}.{segment_label}.wf"]`.
+        """
+        assert self.operation in ["control", "measurement"]
+
+        pulse_mapping = self.segment_pulse_mapping
+        for label, (length, waveform) in self.waveform_segments().items():
+            pulse_name = pulse_mapping[label]
+            config["pulses"][pulse_name] = {
+                "operation": self.operation,
+                "length": length,
+            }
+            waveform_name = (
+                f"{self.name}{str_ref.DELIMITER}{label}{str_ref.DELIMITER}wf"
+            )
+            self._config_add_waveform(
+                config, waveform, pulse_name=pulse_name, waveform_name=waveform_name
+            )
+
+            if self.digital_marker:
+                self._config_add_digital_markers(config, pulse_name=pulse_name)
 
     def apply_to_config(self, config: dict) -> None:
         """Adds this pulse, waveform, and digital marker to the QUA configuration.
 
+        If the pulse has `segment_labels`, each segment is instead added as a separate
+        pulse, see `Pulse.waveform_segments`.
+
         See [`QuamComponent.apply_to_config`][quam.core.quam_classes.QuamComponent.apply_to_config]
         for details.
         """
         if self.channel is None:
             return
 
+        if self.segment_labels is not None:
+            self._config_add_waveform_segments(config)
+            return
+
         self._config_add_pulse(config)
         self._config_add_waveforms(config)
 
@@ -317,13 +559,19 @@ class BaseReadoutPulse(Pulse, ABC):
 
         Returns:
             Dict containing keys "real", "imag", "minus_real", "minus_imag".
-            Values are lists of tuples of (weight, length) pairs.
+            Values are lists of tuples of (weight, length) pairs, or equivalently
+            2D arrays whose columns are the weights and lengths.
         """
         ...
 
     def _config_add_integration_weights(self, config: dict):
         """Add the integration weights to the config"""
         integration_weights = self.integration_weights_function()
+        if _single_precision.get():
+            integration_weights = {
+                key: np.asarray(weights, dtype=np.float32).reshape(-1, 2)
+                for key, weights in integration_weights.items()
+            }
 
         config["integration_weights"][self.integration_weights_names[0]] = {
             "cosine": integration_weights["real"],
@@ -370,29 +618,283 @@ class ReadoutPulse(BaseReadoutPulse, ABC):
               match the pulse length
         integration_weights_angle (float, optional): The rotation angle for the
             integration weights in radians.
+        integration_weights_tolerance (float, optional): If set, integration weights
+            given as a list of floats are compressed into segments such that each
+            weight deviates at most by this tolerance from its segment weight, see
+            `compress_integration_weights`. If None (default), only consecutive
+            equal weights are combined, see `convert_integration_weights`.
+        integration_weights_granularity (int, optional): The granularity of the
+            segment lengths in ns when `integration_weights_tolerance` is set.
+            Must be a multiple of 4 ns. Default is 4 ns.
     """
 
     integration_weights: Union[List[float], List[Tuple[float, int]]] = None
     integration_weights_angle: float = 0
+    integration_weights_tolerance: float = None
+    integration_weights_granularity: int = 4
+
+    def integration_weights_function(self) -> Dict[str, np.ndarray]:
+        """Calculate the integration weights, rotated by `integration_weights_angle`.
+
+        The integration weights are cached per combination of integration weights,
+        angle and pulse length, such that readout pulses with identical weights share
+        the same arrays. The returned arrays are therefore read-only, but a new dict
+        is returned on each call.
+
+        Returns:
+            Dict containing keys "real", "imag", "minus_real", "minus_imag".
+            Values are 2D arrays of shape (N, 2), where each row is a
+            (weight, length) pair.
+        """
+        integration_weights = _calculate_integration_weights(
+            self._get_integration_weights_key(),
+            float(self.integration_weights_angle),
+            self.length,
+            self.integration_weights_tolerance,
+            self.integration_weights_granularity,
+        )
+        return dict(zip(INTEGRATION_WEIGHTS_KEYS, integration_weights))
 
-    def integration_weights_function(self) -> List[Tuple[Union[complex, float], int]]:
-        from qualang_tools.config import convert_integration_weights
+    def get_integration_weights_compression(self) -> Tuple[int, float]:
+        """Get the number of integration weights segments and the achieved error.
 
-        phase = np.exp(1j * self.integration_weights_angle)
+        The error is the maximum deviation between the per-sample integration
+        weights and the weights of their segments, which is bounded by
+        `integration_weights_tolerance` if it is set, see
+        `compress_integration_weights`. The error is 0 for constant integration
+        weights and for integration weights given as (weight, length) pairs.
 
+        Returns:
+            A tuple of the number of segments and the achieved error.
+        """
+        segments, error = _calculate_integration_weights_segments(
+            self._get_integration_weights_key(),
+            self.length,
+            self.integration_weights_tolerance,
+            self.integration_weights_granularity,
+        )
+        return len(segments), error
+
+    def _get_integration_weights_key(
+        self,
+    ) -> Optional[Tuple[Tuple[int, ...], bytes]]:
+        """Get the hashable key of the integration weights used for caching"""
         if self.integration_weights is None or not len(self.integration_weights):
-            integration_weights = [(1, self.length)]
-        elif isinstance(self.integration_weights[0], float):
-            integration_weights = convert_integration_weights(self.integration_weights)
+            return None
+        weights_array = np.asarray(self.integration_weights, dtype=float)
+        return (weights_array.shape, weights_array.tobytes())
+
+
+INTEGRATION_WEIGHTS_KEYS = ("real", "imag", "minus_real", "minus_imag")
+
+
+@lru_cache(maxsize=1024)
+def _calculate_integration_weights_segments(
+    weights_key: Optional[Tuple[Tuple[int, ...], bytes]],
+    length: int,
+    tolerance: Optional[float] = None,
+    granularity: int = 4,
+) -> Tuple[np.ndarray, float]:
+    """Calculate the (weight, length) segments of the weights of a `ReadoutPulse`.
+
+    The result is cached, and therefore contains a read-only array.
+
+    Args:
+        weights_key: The shape and bytes of the float array of integration weights,
+            or None for constant integration weights over the full pulse length.
+        length: The pulse length in samples.
+        tolerance: The tolerance for compressing per-sample integration weights,
+            see `compress_integration_weights`. If None, the weights are converted
+            using `convert_integration_weights`.
+        granularity: The segment length granularity in ns used for compression.
+
+    Returns:
+        A tuple containing
+        - A read-only (N, 2) array of (weight, length) segments.
+        - The maximum deviation between the per-sample weights and their segment
+          weights, or 0 if the weights aren't per-sample weights.
+    """
+    if weights_key is None:
+        segments, error = np.array([[1.0, length]]), 0.0
+    else:
+        shape, weights_bytes = weights_key
+        weights_array = np.frombuffer(weights_bytes, dtype=float).reshape(shape)
+        if weights_array.ndim == 1 and tolerance is not None:
+            segments, error = compress_integration_weights(
+                weights_array, tolerance=tolerance, granularity=granularity
+            )
+        elif weights_array.ndim == 1:
+            segments = convert_integration_weights(weights_array)
+            segment_samples = (segments[:, 1] // 4).astype(int)
+            sample_weights = np.repeat(segments[:, 0], segment_samples)
+            error = float(np.max(np.abs(sample_weights - weights_array)))
         else:
-            integration_weights = self.integration_weights
+            segments, error = weights_array.reshape(-1, 2), 0.0
 
-        return {
-            "real": [(phase.real * w, l) for w, l in integration_weights],
-            "imag": [(phase.imag * w, l) for w, l in integration_weights],
-            "minus_real": [(-phase.real * w, l) for w, l in integration_weights],
-            "minus_imag": [(-phase.imag * w, l) for w, l in integration_weights],
-        }
+    segments.flags.writeable = False
+    return segments, error
+
+
+@lru_cache(maxsize=1024)
+def _calculate_integration_weights(
+    weights_key: Optional[Tuple[Tuple[int, ...], bytes]],
+    angle: float,
+    length: int,
+    tolerance: Optional[float] = None,
+    granularity: int = 4,
+) -> Tuple[np.ndarray, ...]:
+    """Calculate the rotated integration weights of a `ReadoutPulse`.
+
+    The result is cached, and therefore only contains read-only arrays.
+
+    Args:
+        weights_key: The shape and bytes of the float array of integration weights,
+            or None for constant integration weights over the full pulse length.
+        angle: The rotation angle of the integration weights in radians.
+        length: The pulse length in samples.
+        tolerance: The tolerance for compressing per-sample integration weights,
+            see `compress_integration_weights`. If None, the weights are converted
+            using `convert_integration_weights`.
+        granularity: The segment length granularity in ns used for compression.
+
+    Returns:
+        Tuple of read-only (N, 2) arrays of (weight, length) rows, corresponding to
+        the keys "real", "imag", "minus_real", "minus_imag".
+    """
+    segments, _ = _calculate_integration_weights_segments(
+        weights_key, length, tolerance, granularity
+    )
+
+    phase = np.exp(1j * angle)
+    weights, lengths = segments[:, 0], segments[:, 1]
+
+    integration_weights = (
+        np.column_stack((phase.real * weights, lengths)),
+        np.column_stack((phase.imag * weights, lengths)),
+        np.column_stack((-phase.real * weights, lengths)),
+        np.column_stack((-phase.imag * weights, lengths)),
+    )
+    for weights_array in integration_weights:
+        weights_array.flags.writeable = False
+    return integration_weights
+
+
+def convert_integration_weights(
+    integration_weights: Sequence[float],
+    max_segments: int = 100,
+    accuracy: float = 2**-15,
+) -> np.ndarray:
+    """Convert per-sample integration weights to (weight, length) segments.
+
+    Vectorised equivalent of `qualang_tools.config.convert_integration_weights`.
+    Each integration weight corresponds to a clock cycle (4 ns). The weights are
+    rounded to the fixed-point accuracy of the OPX, after which consecutive equal
+    weights are combined into a single segment.
+    If this results in more than `max_segments` segments, the segments whose weights
+    are closest are iteratively merged using a length-weighted average.
+
+    Args:
+        integration_weights: The integration weights, one per clock cycle.
+        max_segments: The maximum number of segments. Default is 100.
+        accuracy: The accuracy of the integration weights. Default is 2^-15, which is
+            the accuracy of the OPX integration weights.
+
+    Returns:
+        An (N, 2) array where each row is a (weight, length) segment, the length
+        being in ns.
+    """
+    weights = np.round(np.asarray(integration_weights, dtype=float) / accuracy)
+    weights *= accuracy
+
+    segment_ends = np.append(np.flatnonzero(np.diff(weights)), len(weights) - 1)
+    lengths = 4 * np.diff(segment_ends, prepend=-1)
+    segments = np.column_stack((weights[segment_ends], lengths.astype(float)))
+
+    while len(segments) > max_segments:
+        idx = np.argmin(np.abs(np.diff(segments[:, 0])))
+        (weight1, length1), (weight2, length2) = segments[idx], segments[idx + 1]
+        segments[idx, 0] = (weight1 * length1 + weight2 * length2) / (length1 + length2)
+        segments[idx, 1] = length1 + length2
+        segments = np.delete(segments, idx + 1, axis=0)
+
+    return segments
+
+
+def compress_integration_weights(
+    integration_weights: Sequence[float],
+    tolerance: float,
+    granularity: int = 4,
+    accuracy: float = 2**-15,
+) -> Tuple[np.ndarray, float]:
+    """Compress per-sample integration weights into segments with bounded error.
+
+    Consecutive weights are greedily merged into a segment as long as all of them
+    are within `tolerance` of the segment weight, which is the midpoint between the
+    minimum and maximum weight of the segment. Segment boundaries are only placed at
+    multiples of `granularity`, such that all segment lengths except possibly the
+    last are multiples of it.
+
+    Args:
+        integration_weights: The integration weights, one per clock cycle (4 ns).
+        tolerance: The maximum allowed deviation of a weight from its segment
+            weight. A tolerance of 0 only merges identical weights.
+        granularity: The granularity of the segment lengths in ns. Must be a
+            positive multiple of 4 ns. Default is 4 ns.
+        accuracy: The accuracy to which the segment weights are rounded. Default is
+            2^-15, which is the accuracy of the OPX integration weights.
+
+    Returns:
+        A tuple containing
+        - An (N, 2) array where each row is a (weight, length) segment, the length
+          being in ns. The number of segments is therefore `len(segments)`.
+        - The achieved maximum deviation between the original weights and their
+          segment weights. Due to the rounding of the segment weights to
+          `accuracy`, this can exceed `tolerance` by at most `accuracy / 2`.
+
+    Raises:
+        ValueError: If the tolerance is negative, or the granularity isn't a positive
+            multiple of 4 ns.
+    """
+    if tolerance < 0:
+        raise ValueError(f"Integration weights tolerance must be >= 0, not {tolerance}")
+    if granularity <= 0 or granularity % 4:
+        raise ValueError(
+            "Integration weights granularity must be a multiple of 4 ns, not "
+            f"{granularity}"
+        )
+
+    weights = np.asarray(integration_weights, dtype=float)
+    if not len(weights):
+        return np.empty((0, 2)), 0.0
+
+    block_size = granularity // 4
+    block_starts = np.arange(0, len(weights), block_size)
+    block_max = np.maximum.reduceat(weights, block_starts)
+    block_min = np.minimum.reduceat(weights, block_starts)
+
+    segment_starts = [0]
+    segment_max, segment_min = block_max[0], block_min[0]
+    for block_idx in range(1, len(block_starts)):
+        new_max = max(segment_max, block_max[block_idx])
+        new_min = min(segment_min, block_min[block_idx])
+        if new_max - new_min > 2 * tolerance:
+            segment_starts.append(block_idx)
+            new_max, new_min = block_max[block_idx], block_min[block_idx]
+        segment_max, segment_min = new_max, new_min
+
+    sample_starts = block_starts[segment_starts]
+    segment_weights = (
+        np.maximum.reduceat(weights, sample_starts)
+        + np.minimum.reduceat(weights, sample_starts)
+    ) / 2
+    segment_weights = np.round(segment_weights / accuracy) * accuracy
+    segment_lengths = 4 * np.diff(sample_starts, append=len(weights))
+
+    sample_weights = np.repeat(segment_weights, segment_lengths // 4)
+    max_error = float(np.max(np.abs(weights - sample_weights)))
+
+    segments = np.column_stack((segment_weights, segment_lengths.astype(float)))
+    return segments, max_error
 
 
 @quam_dataclass
@@ -432,23 +934,30 @@ class DragPulse(Pulse):
     subtracted: bool = True
 
     def waveform_function(self):
-        from qualang_tools.config.waveform_tools import drag_gaussian_pulse_waveforms
+        return DragPulse.calculate_waveforms_batch([self])[0]
 
-        I, Q = drag_gaussian_pulse_waveforms(
-            amplitude=self.amplitude,
-            length=self.length,
-            sigma=self.sigma,
-            alpha=self.alpha,
-            anharmonicity=self.anharmonicity,
-            detuning=self.detuning,
-            subtracted=self.subtracted,
-        )
-        I, Q = np.array(I), np.array(Q)
+    @classmethod
+    def calculate_waveforms_batch(
+        cls, pulses: Sequence["DragPulse"]
+    ) -> List[np.ndarray]:
+        """Calculate the waveforms of multiple DRAG pulses with the same length.
 
-        I_rot = I * np.cos(self.axis_angle) - Q * np.sin(self.axis_angle)
-        Q_rot = I * np.sin(self.axis_angle) + Q * np.cos(self.axis_angle)
-
-        return I_rot + 1.0j * Q_rot
+        All waveforms are calculated in a single broadcasted call, and each returned
+        waveform is a view of a row of the resulting 2D array.
+        """
+        waveforms = _drag_gaussian_waveforms(
+            amplitudes=[pulse.amplitude for pulse in pulses],
+            length=pulses[0].length,
+            sigmas=[pulse.sigma for pulse in pulses],
+            alphas=[pulse.alpha for pulse in pulses],
+            anharmonicities=[pulse.anharmonicity for pulse in pulses],
+            detunings=[pulse.detuning for pulse in pulses],
+            subtracted=[pulse.subtracted for pulse in pulses],
+            sampling_rate=pulses[0].sampling_rate,
+        )
+        axis_angles = np.array([pulse.axis_angle for pulse in pulses], dtype=float)
+        waveforms *= np.exp(1j * axis_angles)[:, np.newaxis]
+        return list(waveforms)
 
 
 @quam_dataclass
@@ -536,17 +1045,50 @@ class GaussianPulse(Pulse):
     subtracted: bool = True
 
     def waveform_function(self):
-        t = np.arange(self.length, dtype=int)
-        center = (self.length - 1) / 2
-        waveform = self.amplitude * np.exp(-((t - center) ** 2) / (2 * self.sigma**2))
+        return GaussianPulse.calculate_waveforms_batch([self])[0]
 
-        if self.subtracted:
-            waveform = waveform - waveform[-1]
+    @classmethod
+    def calculate_waveforms_batch(
+        cls, pulses: Sequence["GaussianPulse"]
+    ) -> List[np.ndarray]:
+        """Calculate the waveforms of multiple Gaussian pulses with the same length.
 
-        if self.axis_angle is not None:
-            waveform = waveform * np.exp(1j * self.axis_angle)
+        All waveforms are calculated in a single broadcasted call, and each returned
+        waveform is a view of a row of the resulting 2D array.
+        """
+        amplitudes = np.array([pulse.amplitude for pulse in pulses], dtype=float)
+        sigmas = np.array([pulse.sigma for pulse in pulses], dtype=float)
+        subtracted = np.array([pulse.subtracted for pulse in pulses], dtype=bool)
+
+        length = pulses[0].length
+        samples_per_ns = pulses[0].sampling_rate / 1e9
+        if samples_per_ns == 1:
+            t = np.arange(length, dtype=int)
+        else:
+            t = np.arange(round(length * samples_per_ns)) / samples_per_ns
+        center = (length - 1 / samples_per_ns) / 2
+        waveforms = amplitudes[:, np.newaxis] * np.exp(
+            -((t - center) ** 2) / (2 * sigmas[:, np.newaxis] ** 2)
+        )
+        waveforms[subtracted] -= waveforms[subtracted, -1:]
 
-        return waveform
+        rotated = [pulse.axis_angle is not None for pulse in pulses]
+        if not any(rotated):
+            return list(waveforms)
+
+        axis_angles = np.array(
+            [
+                pulse.axis_angle if pulse.axis_angle is not None else 0.0
+                for pulse in pulses
+            ]
+        )
+        waveforms_rotated = waveforms * np.exp(1j * axis_angles)[:, np.newaxis]
+        return [
+            waveform_rotated if is_rotated else waveform
+            for waveform, waveform_rotated, is_rotated in zip(
+                waveforms, waveforms_rotated, rotated
+            )
+        ]
 
 
 @quam_dataclass
@@ -563,15 +1105,22 @@ class FlatTopGaussianPulse(Pulse):
         flat_length (int): The length of the pulse's flat top in samples.
             The rise and fall lengths are calculated from the total length and the
             flat length.
+        segmented (bool): If True, the pulse is added to the config as three separate
+            pulses: the Gaussian rise, a constant flat top, and the Gaussian fall.
+            This avoids storing the samples of a long flat top. The corresponding
+            channel operations are "{label}.rise", "{label}.flat" and "{label}.fall",
+            which should be played consecutively. The flat top and rise / fall
+            lengths should then satisfy the pulse length constraints of the hardware.
+            Default is False.
     """
 
     amplitude: float
     axis_angle: float = None
     flat_length: int
+    segmented: bool = False
 
-    def waveform_function(self):
-        from qualang_tools.config.waveform_tools import flattop_gaussian_waveform
-
+    @property
+    def rise_fall_length(self) -> int:
         rise_fall_length = (self.length - self.flat_length) // 2
         if not self.flat_length + 2 * rise_fall_length == self.length:
             raise ValueError(
@@ -579,16 +1128,336 @@ class FlatTopGaussianPulse(Pulse):
                 f" a multiple of 2 ({self.length} - {self.flat_length} ="
                 f" {self.length - self.flat_length})"
             )
+        return rise_fall_length
 
+    def waveform_function(self):
         waveform = flattop_gaussian_waveform(
             amplitude=self.amplitude,
             flat_length=self.flat_length,
-            rise_fall_length=rise_fall_length,
-            return_part="all",
+            rise_fall_length=self.rise_fall_length,
+            sampling_rate=self.sampling_rate,
         )
-        waveform = np.array(waveform)
 
         if self.axis_angle is not None:
             waveform = waveform * np.exp(1j * self.axis_angle)
 
         return waveform
+
+    @property
+    def segment_labels(self) -> Optional[List[str]]:
+        if not self.segmented:
+            return None
+        return ["rise", "flat", "fall"]
+
+    def waveform_segments(
+        self,
+    ) -> Optional[Dict[str, Tuple[int, Union[float, complex, np.ndarray]]]]:
+        if not self.segmented:
+            return None
+
+        rise_fall_length = self.rise_fall_length
+        rise_samples = int(rise_fall_length * self.sampling_rate / 1e9)
+        rise = flattop_gaussian_waveform(
+            amplitude=self.amplitude,
+            flat_length=0,
+            rise_fall_length=rise_fall_length,
+            sampling_rate=self.sampling_rate,
+        )[:rise_samples]
+        flat = self.amplitude
+
+        if self.axis_angle is not None:
+            rise = rise * np.exp(1j * self.axis_angle)
+            flat = flat * np.exp(1j * self.axis_angle)
+
+        return {
+            "rise": (rise_fall_length, rise),
+            "flat": (self.flat_length, flat),
+            "fall": (rise_fall_length, rise[::-1].copy()),
+        }
+
+
+def drag_gaussian_waveform(
+    amplitude: float,
+    length: int,
+    sigma: float,
+    alpha: float,
+    anharmonicity: float,
+    detuning: float = 0.0,
+    subtracted: bool = True,
+    sampling_rate: float = 1e9,
+) -> np.ndarray:
+    """Calculate the complex waveform of a Gaussian-based DRAG pulse.
+
+    Vectorised equivalent of `qualang_tools.config.waveform_tools.
+    drag_gaussian_pulse_waveforms`, see `DragPulse` for details on the arguments.
+    The waveform has `length * sampling_rate / 1e9` samples.
+
+    Returns:
+        The complex waveform, whose real and imaginary parts are the I and Q
+        waveforms, respectively.
+
+    Raises:
+        ValueError: If `alpha` is nonzero and `anharmonicity` is zero or equal to
+            `detuning`.
+    """
+    return _drag_gaussian_waveforms(
+        amplitudes=[amplitude],
+        length=length,
+        sigmas=[sigma],
+        alphas=[alpha],
+        anharmonicities=[anharmonicity],
+        detunings=[detuning],
+        subtracted=[subtracted],
+        sampling_rate=sampling_rate,
+    )[0]
+
+
+def _drag_gaussian_waveforms(
+    amplitudes: Sequence[float],
+    length: int,
+    sigmas: Sequence[float],
+    alphas: Sequence[float],
+    anharmonicities: Sequence[float],
+    detunings: Sequence[float],
+    subtracted: Sequence[bool],
+    sampling_rate: float = 1e9,
+) -> np.ndarray:
+    """Calculate the complex waveforms of DRAG pulses with the same length.
+
+    Returns:
+        A 2D complex array, where each row is the waveform of a single pulse.
+    """
+    for alpha, anharmonicity, detuning in zip(alphas, anharmonicities, detunings):
+        if alpha != 0 and anharmonicity == 0:
+            raise ValueError("Cannot create a DRAG pulse with `anharmonicity=0`")
+        elif alpha != 0 and anharmonicity == detuning:
+            raise ValueError(
+                "The complex envelope for the DRAG waveform cannot be created if"
+                " anharmonicity = detuning and alpha != 0."
+            )
+
+    amplitudes = np.array(amplitudes, dtype=float)[:, np.newaxis]
+    sigmas = np.array(sigmas, dtype=float)[:, np.newaxis]
+    alphas = np.array(alphas, dtype=float)
+    anharmonicities = np.array(anharmonicities, dtype=float)
+    detunings = np.array(detunings, dtype=float)
+    subtracted = np.array(subtracted, dtype=bool)
+
+    samples_per_ns = sampling_rate / 1e9
+    t = np.arange(round(length * samples_per_ns)) / samples_per_ns
+    t_centered = t - (length - 1 / samples_per_ns) / 2
+    gauss_waves = amplitudes * np.exp(-(t_centered**2) / (2 * sigmas**2))
+    gauss_der_waves = (-1e9 * t_centered / sigmas**2) * gauss_waves
+
+    gauss_waves[subtracted] -= gauss_waves[subtracted, -1:]
+
+    # The DRAG component vanishes if anharmonicity == detuning, as alpha must be 0
+    has_drag = anharmonicities != detunings
+    drag_factors = np.zeros(len(alphas))
+    drag_factors[has_drag] = alphas[has_drag] / (
+        2 * np.pi * anharmonicities[has_drag] - 2 * np.pi * detunings[has_drag]
+    )
+    waveforms = gauss_waves + 1j * (drag_factors[:, np.newaxis] * gauss_der_waves)
+
+    detuned = detunings != 0
+    if np.any(detuned):
+        waveforms[detuned] *= np.exp(
+            1j * 2 * np.pi * detunings[detuned, np.newaxis] * 1e-9 * t
+        )
+
+    return waveforms
+
+
+def flattop_gaussian_waveform(
+    amplitude: float,
+    flat_length: int,
+    rise_fall_length: int,
+    sampling_rate: float = 1e9,
+) -> np.ndarray:
+    """Calculate the waveform of a flat-top pulse with Gaussian rise and fall.
+
+    Vectorised equivalent of `qualang_tools.config.waveform_tools.
+    flattop_gaussian_waveform`. The rise is the first half of a Gaussian with
+    length `2 * rise_fall_length` and standard deviation `rise_fall_length / 5`.
+
+    Args:
+        amplitude: The amplitude of the flat top in volts.
+        flat_length: The length of the flat top in ns.
+        rise_fall_length: The length of both the rise and the fall in ns.
+        sampling_rate: The sampling rate in samples per second. Default is 1 GS/s.
+
+    Returns:
+        The waveform, with `(flat_length + 2 * rise_fall_length) * sampling_rate / 1e9`
+        samples.
+    """
+    samples_per_ns = sampling_rate / 1e9
+    rise_samples = int(rise_fall_length * samples_per_ns)
+    flat_samples = int(flat_length * samples_per_ns)
+
+    n = np.arange(rise_samples, dtype=float) - (rise_samples - 0.5)
+    sigma = rise_fall_length / 5 * samples_per_ns
+    rise = amplitude * np.exp(-(n**2) / (2 * sigma**2))
+
+    waveform = np.empty(flat_samples + 2 * rise_samples)
+    waveform[:rise_samples] = rise
+    waveform[rise_samples : rise_samples + flat_samples] = amplitude
+    waveform[rise_samples + flat_samples :] = rise[::-1]
+    return waveform
+
+
+def _to_single_precision(waveform):
+    """Convert an arbitrary waveform to a float32 or complex64 array
+
+    Constant waveforms are returned unchanged.
+    """
+    if not isinstance(waveform, (list, np.ndarray)):
+        return waveform
+    waveform = np.asarray(waveform)
+    dtype = np.complex64 if np.iscomplexobj(waveform) else np.float32
+    return waveform.astype(dtype, copy=False)
+
+
+def _supports_batch_calculation(pulse_cls: type) -> bool:
+    """Check whether a pulse class evaluates its waveforms in batches.
+
+    This is the case if the class that defines `waveform_function` also defines
+    `calculate_waveforms_batch`.
+    """
+    for cls in pulse_cls.__mro__:
+        if "waveform_function" in vars(cls):
+            return "calculate_waveforms_batch" in vars(cls)
+    return False
+
+
+def calculate_waveforms(
+    pulses: Sequence[Pulse], workers: Optional[int] = None
+) -> List[Union[float, complex, np.ndarray]]:
+    """Calculate the waveforms of multiple pulses, optionally in parallel.
+
+    Pulses of the same class, length and sampling rate are grouped, and the
+    waveforms of each group are calculated in a single call to
+    `Pulse.calculate_waveforms_batch` if the class supports vectorised batch
+    evaluation, e.g. `GaussianPulse` and `DragPulse`. This is particularly efficient
+    when many variants of a pulse are evaluated, e.g. for an amplitude sweep.
+
+    Args:
+        pulses: The pulses whose waveforms to calculate.
+        workers: The number of threads used to calculate the waveforms. If None
+            (default), the waveforms are calculated sequentially.
+
+    Returns:
+        The waveforms, in the same order as `pulses`. Each waveform equals the output
+        of `Pulse.calculate_waveform`.
+    """
+    # Read once, as the thread pool workers don't share the context of the caller
+    single_precision = _single_precision.get()
+
+    pulse_groups = {}
+    for idx, pulse in enumerate(pulses):
+        if _supports_batch_calculation(type(pulse)):
+            group_key = (type(pulse), pulse.length, pulse.sampling_rate)
+        else:
+            group_key = idx
+        pulse_groups.setdefault(group_key, []).append(idx)
+
+    def calculate_group_waveforms(pulse_indices):
+        group_pulses = [pulses[idx] for idx in pulse_indices]
+        pulse_cls = type(group_pulses[0])
+        with single_precision_waveforms(single_precision):
+            if not _supports_batch_calculation(pulse_cls):
+                return [pulse.calculate_waveform() for pulse in group_pulses]
+            return pulse_cls.calculate_waveforms_batch(group_pulses)
+
+    groups = list(pulse_groups.values())
+    if workers is None or workers <= 1 or len(groups) <= 1:
+        group_waveforms = [calculate_group_waveforms(group) for group in groups]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            group_waveforms = list(executor.map(calculate_group_waveforms, groups))
+
+    waveforms = [None] * len(pulses)
+    for pulse_indices, pulse_waveforms in zip(groups, group_waveforms):
+        for idx, waveform in zip(pulse_indices, pulse_waveforms):
+            if single_precision:
+                waveform = _to_single_precision(waveform)
+            waveforms[idx] = waveform
+    return waveforms
+
+
+@contextmanager
+def precompute_waveforms(pulses: Sequence[Pulse], workers: Optional[int] = None):
+    """Context manager within which precomputed waveforms are added to the config.
+
+    The waveforms of all pulses are calculated upon entering, optionally in parallel
+    using a thread pool. Within the context, `Pulse.apply_to_config` uses these
+    waveforms instead of calling `Pulse.calculate_waveform` again.
+    This is used by `QuamRoot.generate_config`.
+
+    The precomputed waveforms are only visible in the current thread or context, and
+    within nested contexts, the waveforms of the outer contexts remain available. The
+    waveforms are stored together with their pulse, such that they are never used by
+    a different pulse with the same id.
+
+    Args:
+        pulses: The pulses whose waveforms to precompute.
+        workers: The number of threads used to calculate the waveforms. If None
+            (default), the waveforms are calculated sequentially.
+    """
+    waveforms = calculate_waveforms(pulses, workers=workers)
+    precomputed_waveforms = dict(_precomputed_waveforms.get() or {})
+    for pulse, waveform in zip(pulses, waveforms):
+        precomputed_waveforms[id(pulse)] = (pulse, waveform)
+    token = _precomputed_waveforms.set(precomputed_waveforms)
+    try:
+        yield
+    finally:
+        _precomputed_waveforms.reset(token)
+
+
+@contextmanager
+def defer_waveforms():
+    """Context manager within which lazy waveforms are added to the config.
+
+    Within the context, `Pulse.apply_to_config` adds a
+    [`LazyWaveform`][quam.utils.config.LazyWaveform] to `config["waveforms"]` instead
+    of calculating the waveform, such that the samples are only calculated when the
+    waveform entry is accessed. This is used by
+    `QuamRoot.generate_config(lazy_waveforms=True)`.
+
+    Note that the lazy waveforms are calculated from the pulses at the time they are
+    accessed, so modifying a pulse before its waveform is accessed changes the
+    waveform in the config. Lazy waveforms that are already accessed, e.g. using
+    `quam.utils.config.materialise_waveforms`, are no longer modified.
+
+    Like `precompute_waveforms`, the setting only applies to the current thread or
+    context, and is restored to its previous value upon exiting.
+    """
+    token = _lazy_waveforms.set(True)
+    try:
+        yield
+    finally:
+        _lazy_waveforms.reset(token)
+
+
+@contextmanager
+def single_precision_waveforms(enabled: bool = True):
+    """Context manager within which waveforms are stored in single precision.
+
+    Within the context, `Pulse.calculate_waveform` and `calculate_waveforms` return
+    arbitrary waveforms as float32 (or complex64 for IQ waveforms) arrays, and the
+    waveform samples and integration weights added to the config are float32 arrays.
+    This halves the memory of large arbitrary waveform libraries, while the
+    precision still far exceeds the DAC resolution. This is used by
+    `QuamRoot.generate_config(single_precision=True)`.
+
+    Like `precompute_waveforms`, the setting only applies to the current thread or
+    context, and is restored to its previous value upon exiting.
+
+    Args:
+        enabled: Whether to store waveforms in single precision. Default is True.
+    """
+    token = _single_precision.set(enabled)
+    try:
+        yield
+    finally:
+        _single_precision.reset(token)
@@ -0,0 +1,286 @@
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from quam.components.channels import IQChannel, MWChannel, SingleChannel
+from quam.components.frequency_planning import _get_frequency
+from quam.components.hardware import FrequencyConverter, LocalOscillator
+from quam.components.octave import OctaveUpConverter
+from quam.components.ports.base_ports import BasePort
+from quam.core.quam_classes import QuamBase
+
+__all__ = ["SpectralLine", "get_spectral_lines", "find_spectral_collisions"]
+
+
+@dataclass(frozen=True, eq=False)
+class SpectralLine:
+    """A frequency at which a signal is present.
+
+    Args:
+        frequency: The frequency in Hz.
+        kind: The kind of signal, one of
+            - "RF": The RF signal of an IQ channel.
+            - "image": The mixer image of an IQ channel, mirrored around the LO.
+            - "LO": LO leakage of a local oscillator, Octave up-converter or MW-FEM
+              up-converter.
+            - "IF": The intermediate frequency of a channel, at the output port.
+        source: Description of the origin, e.g. the channel name.
+        component: The QuAM component the frequency originates from.
+        domain: Only spectral lines in the same domain can collide. This is
+            ("RF", line_idx) for RF frequencies, where line_idx identifies the output
+            line, see `get_spectral_lines`, and ("IF", port_tuple) for intermediate
+            frequencies, such that these only collide with intermediate frequencies of
+            the same port.
+    """
+
+    frequency: float
+    kind: str
+    source: str
+    component: QuamBase
+    domain: Hashable = "RF"
+
+
+def _get_source_name(component: QuamBase) -> str:
+    """Get a description of a component, preferably its name"""
+    try:
+        return component.name
+    except AttributeError:
+        pass
+    try:
+        return component.get_reference()
+    except AttributeError:
+        return component.__class__.__name__
+
+
+def _get_port_tuple(channel: QuamBase, attr: str) -> Union[tuple, None]:
+    port = getattr(channel, attr, None)
+    if isinstance(port, BasePort):
+        return tuple(port.port_tuple)
+    if isinstance(port, (tuple, list)):
+        return tuple(port)
+    return None
+
+
+class _OutputLines:
+    """Groups of components connected to the same output line.
+
+    Components are connected if they share an output port or frequency converter,
+    which are represented by hashable keys. The groups are determined using a
+    union-find structure of the keys.
+    """
+
+    def __init__(self):
+        self._parents: Dict[Hashable, Hashable] = {}
+        self._line_idxs: Dict[Hashable, int] = {}
+
+    def _find(self, key: Hashable) -> Hashable:
+        parent = self._parents.setdefault(key, key)
+        while parent != key:
+            grandparent = self._parents[parent]
+            self._parents[key] = grandparent
+            key, parent = parent, grandparent
+        return key
+
+    def connect(self, keys: List[Hashable]):
+        """Connect all keys to the same output line"""
+        if not keys:
+            return
+        root = self._find(keys[0])
+        for key in keys[1:]:
+            self._parents[self._find(key)] = root
+
+    def get_domain(self, keys: List[Hashable]) -> Tuple[str, int]:
+        """Get the RF domain of the output line of a component"""
+        root = self._find(keys[0])
+        return ("RF", self._line_idxs.setdefault(root, len(self._line_idxs)))
+
+
+def _get_output_line_keys(component: QuamBase) -> List[Hashable]:
+    """Get the output ports and frequency converters of a component.
+
+    Objects are represented by their id, which is only used while the components are
+    being grouped into output lines.
+    """
+    if isinstance(component, MWChannel):
+        port = _get_port_tuple(component, "opx_output")
+        return [("port", port)] if port is not None else []
+    elif isinstance(component, IQChannel):
+        keys = []
+        for attr in ["opx_output_I", "opx_output_Q"]:
+            port = _get_port_tuple(component, attr)
+            if port is not None:
+                keys.append(("port", port))
+        converter = getattr(component, "frequency_converter_up", None)
+        if isinstance(converter, QuamBase):
+            keys.append(("component", id(converter)))
+        if isinstance(converter, FrequencyConverter):
+            local_oscillator = getattr(converter, "local_oscillator", None)
+            if isinstance(local_oscillator, QuamBase):
+                keys.append(("component", id(local_oscillator)))
+        return keys
+    elif isinstance(component, (LocalOscillator, OctaveUpConverter)):
+        return [("component", id(component))]
+    return []
+
+
+def _get_channel_spectral_lines(
+    component: QuamBase, output_lines: _OutputLines
+) -> List[SpectralLine]:
+    """Get the spectral lines originating from a single component"""
+    lines = []
+    if isinstance(component, IQChannel):
+        name = _get_source_name(component)
+        RF_frequency = _get_frequency(component, "RF_frequency")
+        LO_frequency = _get_frequency(component, "LO_frequency")
+        intermediate_frequency = _get_frequency(component, "intermediate_frequency")
+        if RF_frequency is not None:
+            domain = output_lines.get_domain(_get_output_line_keys(component))
+            lines.append(SpectralLine(RF_frequency, "RF", name, component, domain))
+            if LO_frequency is not None:
+                image_frequency = 2 * LO_frequency - RF_frequency
+                lines.append(
+                    SpectralLine(image_frequency, "image", name, component, domain)
+                )
+        port = _get_port_tuple(component, "opx_output_I")
+        if intermediate_frequency is not None and port is not None:
+            domain = ("IF", port)
+            lines.append(
+                SpectralLine(abs(intermediate_frequency), "IF", name, component, domain)
+            )
+    elif isinstance(component, SingleChannel):
+        intermediate_frequency = _get_frequency(component, "intermediate_frequency")
+        port = _get_port_tuple(component, "opx_output")
+        if intermediate_frequency is not None and port is not None:
+            name = _get_source_name(component)
+            domain = ("IF", port)
+            lines.append(
+                SpectralLine(abs(intermediate_frequency), "IF", name, component, domain)
+            )
+    elif isinstance(component, (LocalOscillator, OctaveUpConverter)):
+        attr = "frequency" if isinstance(component, LocalOscillator) else "LO_frequency"
+        frequency = _get_frequency(component, attr)
+        if frequency is not None:
+            name = _get_source_name(component)
+            domain = output_lines.get_domain(_get_output_line_keys(component))
+            lines.append(SpectralLine(frequency, "LO", name, component, domain))
+    return lines
+
+
+def _get_MW_upconverter_lines(
+    channels: Iterable[MWChannel], output_lines: _OutputLines
+) -> List[SpectralLine]:
+    """Get the LO lines of the MW-FEM up-converters used by MW channels
+
+    Up-converters shared by multiple channels result in a single spectral line.
+    """
+    lines = {}
+    for channel in channels:
+        port = getattr(channel, "opx_output", None)
+        if not isinstance(port, BasePort):
+            continue
+        upconverter = channel.upconverter
+        if getattr(port, "upconverters", None):
+            frequency = port.upconverters.get(upconverter)
+        else:
+            frequency = getattr(port, "upconverter_frequency", None)
+        key = (tuple(port.port_tuple), upconverter)
+        if frequency is None or key in lines:
+            continue
+        source = f"{_get_source_name(port)} upconverter {upconverter}"
+        domain = output_lines.get_domain(_get_output_line_keys(channel))
+        lines[key] = SpectralLine(float(frequency), "LO", source, port, domain)
+    return list(lines.values())
+
+
+def get_spectral_lines(
+    components: Union[QuamBase, Iterable[QuamBase]],
+) -> List[SpectralLine]:
+    """Get the frequencies of all signals generated by QuAM components.
+
+    The following spectral lines are collected:
+    - `IQChannel`: The RF frequency and mixer image, and the intermediate frequency
+      at its I output port.
+    - `SingleChannel`: The intermediate frequency at its output port.
+    - `MWChannel`: The LO frequency of its MW-FEM up-converter.
+    - `LocalOscillator` and `OctaveUpConverter`: The LO frequency.
+
+    RF frequencies, mixer images and LO frequencies can only collide if they are on
+    the same output line. Components are on the same output line if they are
+    connected through shared output ports or frequency converters, e.g. readout
+    resonators on a shared feedline, or channels sharing a local oscillator. A local
+    oscillator that isn't used by any of the components forms its own output line.
+
+    Frequencies that cannot be determined, e.g. because a reference is missing, are
+    skipped.
+
+    Args:
+        components: A QuAM object, usually the QuamRoot, whose components to include,
+            or a sequence of components.
+
+    Returns:
+        A list of spectral lines.
+    """
+    if isinstance(components, QuamBase):
+        components = components.iterate_components()
+    components = list(components)
+
+    output_lines = _OutputLines()
+    for component in components:
+        output_lines.connect(_get_output_line_keys(component))
+
+    lines, MW_channels = [], []
+    for component in components:
+        if isinstance(component, MWChannel):
+            MW_channels.append(component)
+        else:
+            lines.extend(_get_channel_spectral_lines(component, output_lines))
+    lines.extend(_get_MW_upconverter_lines(MW_channels, output_lines))
+    return lines
+
+
+def find_spectral_collisions(
+    lines: List[SpectralLine], threshold: float
+) -> List[Tuple[SpectralLine, SpectralLine]]:
+    """Find all pairs of spectral lines in the same domain that are close together.
+
+    The spectral lines are sorted by domain and frequency, after which the lines
+    within the threshold of each line are found using a binary search. The
+    complexity is therefore O(n log n + k) for n lines and k collisions, instead of
+    the O(n^2) of comparing all pairs.
+
+    Args:
+        lines: The spectral lines, see `get_spectral_lines`.
+        threshold: The maximum frequency difference in Hz of colliding lines.
+
+    Returns:
+        A list of colliding pairs of spectral lines, each pair sorted by frequency. The
+        pairs are sorted by domain and the frequency of the first line.
+    """
+    if not lines:
+        return []
+
+    domain_idxs = {}
+    domains = np.array(
+        [domain_idxs.setdefault(line.domain, len(domain_idxs)) for line in lines]
+    )
+    frequencies = np.array([line.frequency for line in lines], dtype=float)
+
+    # Offsetting each domain by a span larger than all frequencies allows a single
+    # sorted sweep over all domains
+    span = 2 * (np.abs(frequencies).max() + threshold + 1)
+    keys = domains * span + frequencies
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    # Lines collide with all subsequent lines up to the first one beyond the threshold
+    ends = np.searchsorted(sorted_keys, sorted_keys + threshold, side="right")
+    counts = ends - np.arange(len(lines)) - 1
+    first_idxs = np.repeat(np.arange(len(lines)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second_idxs = first_idxs + 1 + offsets
+
+    return [
+        (lines[order[idx1]], lines[order[idx2]])
+        for idx1, idx2 in zip(first_idxs, second_idxs)
+    ]
@@ -0,0 +1,385 @@
+from dataclasses import MISSING, fields, is_dataclass
+import typing
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from quam.core.quam_classes import (
+    QuamBase,
+    QuamComponent,
+    _get_type_hints,
+    convert_dict_and_list,
+)
+from quam.utils import string_reference, validate_obj_type
+from quam.utils.dataclass import REQUIRED
+from quam.utils.reference_class import ReferenceClass
+
+__all__ = ["build_components"]
+
+
+# Types for which validating a single value validates all values of that type
+_ATOMIC_TYPES = (bool, int, float, complex, str, type(None))
+
+
+class _TableNode:
+    """A component or dict in the tree of columns of a table"""
+
+    def __init__(self, path: str, cls: Optional[type] = None):
+        self.path = path
+        self.cls = cls
+        self.is_dict = False
+        self.columns: Dict[str, List[Any]] = {}
+        self.children: Dict[str, "_TableNode"] = {}
+
+    def get_child(self, attr: str) -> "_TableNode":
+        if attr in self.columns:
+            raise ValueError(
+                f"'{self.path}{attr}' is both a column and a nested component"
+            )
+        if attr not in self.children:
+            self.children[attr] = _TableNode(f"{self.path}{attr}/")
+        return self.children[attr]
+
+
+def _get_column(values: Any) -> Optional[List[Any]]:
+    """Convert the values of a column to a list, or return None for a constant"""
+    if isinstance(values, np.ndarray) and values.ndim > 0:
+        return values.tolist()
+    elif isinstance(values, list):
+        return values
+    return None
+
+
+def _parse_table(
+    cls: type,
+    table: Mapping[str, Any],
+    components: Mapping[str, type],
+    num_rows: Optional[int],
+) -> Tuple[_TableNode, int]:
+    """Group the columns of a table into a tree of nested components"""
+    root = _TableNode("", cls)
+    for path, component_cls in components.items():
+        node = root
+        for attr in path.strip("/").split("/"):
+            node = node.get_child(attr)
+        node.cls = component_cls
+
+    constants = []
+    for name, values in table.items():
+        *path, attr = name.strip("/").split("/")
+        node = root
+        for elem in path:
+            node = node.get_child(elem)
+        if attr in node.children:
+            raise ValueError(f"'{name}' is both a column and a nested component")
+
+        column = _get_column(values)
+        if column is None:
+            if isinstance(values, np.ndarray):
+                values = values.item()
+            constants.append((node, attr, values))
+            continue
+
+        if num_rows is None:
+            num_rows = len(column)
+        elif len(column) != num_rows:
+            raise ValueError(
+                f"Column '{name}' has {len(column)} rows, expected {num_rows} rows"
+            )
+        node.columns[attr] = column
+
+    if num_rows is None:
+        raise ValueError(
+            "Could not determine the number of components as the table has no "
+            "columns, please provide num_rows"
+        )
+
+    for node, attr, value in constants:
+        node.columns[attr] = [value] * num_rows
+
+    return root, num_rows
+
+
+def _resolve_classes(node: _TableNode, annotation: Any = None):
+    """Determine the classes of nested components from the attribute annotations"""
+    if node.cls is None:
+        if typing.get_origin(annotation) is dict or annotation is dict:
+            node.is_dict = True
+        elif (
+            isinstance(annotation, type)
+            and issubclass(annotation, QuamBase)
+            and is_dataclass(annotation)
+        ):
+            node.cls = annotation
+        else:
+            raise TypeError(
+                f"Could not determine the class of '{node.path.rstrip('/')}' from its "
+                f"type annotation {annotation}, please specify it in `components`"
+            )
+    elif not (
+        isinstance(node.cls, type)
+        and issubclass(node.cls, QuamBase)
+        and is_dataclass(node.cls)
+    ):
+        raise TypeError(
+            f"Cannot build '{node.path.rstrip('/') or node.cls}' as {node.cls} is "
+            "not a QuAM dataclass"
+        )
+
+    for attr, child in node.children.items():
+        if node.is_dict:
+            dict_args = typing.get_args(annotation)
+            child_annotation = dict_args[1] if dict_args else None
+        else:
+            child_annotation = _get_type_hints(node.cls).get(attr)
+        _resolve_classes(child, child_annotation)
+
+
+def _is_required(field) -> bool:
+    if field.default is not MISSING and field.default is not REQUIRED:
+        return False
+    return field.default_factory is MISSING
+
+
+def _validate_column(
+    values: Sequence[Any], required_type: type, allow_none: bool, str_repr: str
+):
+    """Validate the type of all values in a column.
+
+    References are skipped. If the required type is a plain class, atomic values and
+    QuAM objects are only validated once per type, such that the cost is independent
+    of the number of rows for most columns. Otherwise, e.g. for `Literal` or `Union`
+    annotations, the validity can depend on the value itself, and each unique value
+    is validated.
+    """
+    is_plain_class = isinstance(required_type, type)
+    validated_types = set()
+    validated_values = set()
+    for value in values:
+        value_type = type(value)
+        if value_type in validated_types:
+            continue
+        if value_type is str and string_reference.is_reference(value):
+            continue
+
+        value_key = None
+        if not is_plain_class and value_type in _ATOMIC_TYPES:
+            value_key = (value_type, value)
+            if value_key in validated_values:
+                continue
+
+        validate_obj_type(
+            value, required_type, allow_none=allow_none, str_repr=str_repr
+        )
+        if value_key is not None:
+            validated_values.add(value_key)
+        elif is_plain_class and (
+            value_type in _ATOMIC_TYPES or issubclass(value_type, QuamBase)
+        ):
+            validated_types.add(value_type)
+
+
+def _contains_quam_objects(column: List[Any]) -> bool:
+    return any(
+        issubclass(value_type, QuamBase) for value_type in set(map(type, column))
+    )
+
+
+def _validate_children(columns: Mapping[str, List[Any]], cls_name: str):
+    """Verify that QuAM objects in columns can be attached to the new components"""
+    child_ids = set()
+    for attr, column in columns.items():
+        if not _contains_quam_objects(column):
+            continue
+        for value in column:
+            if not isinstance(value, QuamBase):
+                continue
+            value_dict = object.__getattribute__(value, "__dict__")
+            if value_dict.get("parent") is not None or id(value) in child_ids:
+                raise AttributeError(
+                    f"Cannot add {value.__class__.__name__} to {cls_name}.{attr} as it "
+                    "already has a parent or is used by multiple components"
+                )
+            child_ids.add(id(value))
+
+
+def _build_objects(
+    cls: type,
+    columns: Dict[str, List[Any]],
+    num_rows: int,
+    validate_type: bool,
+    str_repr: str,
+) -> List[QuamBase]:
+    """Instantiate a QuAM dataclass for each row of columns of attribute values"""
+    cls_fields = fields(cls)
+    init_attrs = {field.name for field in cls_fields if field.init}
+    unknown_attrs = [attr for attr in columns if attr not in init_attrs]
+    if unknown_attrs:
+        raise TypeError(f"{str_repr} has no attributes {unknown_attrs}")
+
+    attr_columns = {}
+    for field in cls_fields:
+        if field.name in columns:
+            attr_columns[field.name] = columns[field.name]
+        elif not _is_required(field) and field.default_factory is MISSING:
+            attr_columns[field.name] = [field.default] * num_rows
+        elif not _is_required(field):
+            attr_columns[field.name] = [
+                field.default_factory() for _ in range(num_rows)
+            ]
+        elif field.init:
+            raise TypeError(
+                f"Please provide {str_repr}.{field.name} as it is a required arg"
+            )
+
+    if validate_type:
+        annotations = _get_type_hints(cls)
+        for attr, column in columns.items():
+            _validate_column(
+                column,
+                annotations[attr],
+                allow_none=not _is_required(cls.__dataclass_fields__[attr]),
+                str_repr=f"{str_repr}.{attr}",
+            )
+    _validate_children(columns, str_repr)
+
+    if cls.__setattr__ is not QuamComponent.__setattr__:
+        # Custom attribute handling, so use the regular instantiation
+        return [
+            cls(**{attr: column[row] for attr, column in columns.items()})
+            for row in range(num_rows)
+        ]
+
+    # Equivalent to `QuamComponent.__setattr__`, but determining per column whether
+    # values need to be converted or are QuAM objects that need a parent. Attributes
+    # are accessed via `object.__getattribute__` to skip the reference checks.
+    quam_attrs = []
+    for attr, column in attr_columns.items():
+        value_types = set(map(type, column))
+        if any(
+            issubclass(value_type, (dict, list, np.ndarray))
+            for value_type in value_types
+        ):
+            column = [
+                convert_dict_and_list(value, cls_or_obj=cls, attr=attr)
+                for value in column
+            ]
+            attr_columns[attr] = column
+        if _contains_quam_objects(column):
+            quam_attrs.append(attr)
+
+    has_custom_post_init = cls.__post_init__ is not ReferenceClass.__post_init__
+    objs = []
+    for row in range(num_rows):
+        obj = cls.__new__(cls)
+        obj_dict = object.__getattribute__(obj, "__dict__")
+        for attr, column in attr_columns.items():
+            obj_dict[attr] = column[row]
+        for attr in quam_attrs:
+            value = obj_dict[attr]
+            if isinstance(value, QuamBase):
+                object.__getattribute__(value, "__dict__")["parent"] = obj
+        if has_custom_post_init:
+            obj.__post_init__()
+        else:
+            obj_dict["_initialized"] = True
+        objs.append(obj)
+    return objs
+
+
+def _build_node(node: _TableNode, num_rows: int, validate_type: bool) -> List[Any]:
+    columns = dict(node.columns)
+    for attr, child in node.children.items():
+        columns[attr] = _build_node(child, num_rows, validate_type)
+
+    if node.is_dict:
+        return [
+            {key: column[row] for key, column in columns.items()}
+            for row in range(num_rows)
+        ]
+
+    str_repr = node.path.rstrip("/") or node.cls.__name__
+    return _build_objects(node.cls, columns, num_rows, validate_type, str_repr)
+
+
+def build_components(
+    cls: type,
+    table: Mapping[str, Any],
+    components: Optional[Mapping[str, type]] = None,
+    num_rows: Optional[int] = None,
+    validate_type: bool = True,
+) -> List[QuamBase]:
+    """Build many QuAM components at once from a table of attribute values.
+
+    The table contains a column of values for each attribute, such that each row
+    corresponds to a component. The result is identical to instantiating the
+    components one by one, e.g. `cls(**row)` for each row with nested components also
+    instantiated, but is considerably faster for a large number of components. This is
+    because the type validation and the conversion of dicts and lists are determined
+    per column instead of per attribute value, and the attributes and parents of the
+    components are set directly instead of via `QuamComponent.__setattr__`.
+
+    Attributes of nested components, such as channels of a qubit, frequency converters
+    of a channel and pulses in `Channel.operations`, are specified by columns whose
+    name is the path of the attribute, e.g. "xy/frequency_converter_up/mixer/id".
+    The class of a nested component is determined from its type annotation, unless it
+    is specified in `components`, e.g. `{"xy/frequency_converter_up":
+    FrequencyConverter}`. A nested attribute annotated as a dict, such as
+    `Channel.operations`, results in a dict with an entry for each nested name.
+
+    Args:
+        cls: The QuAM class of the components.
+        table: The columns of attribute values, where the keys are the attribute
+            (paths) and the values are lists or 1D numpy arrays with a value for each
+            component. Numpy arrays are converted to lists of Python values. Any other
+            value, e.g. a number, string or port tuple, is used for all components.
+            Attributes that are themselves lists should therefore be specified as a
+            list of lists.
+        components: Optional classes of nested components, where the keys are the
+            attribute paths. This is required if the class can't be determined from
+            the type annotation, or if a nested component doesn't have any columns.
+        num_rows: The number of components. Only required if the table has no
+            columns but only values used for all components.
+        validate_type: Whether to validate the type of each column against the type
+            annotation of the attribute, see `quam.utils.validate_obj_type`. Values of
+            the same atomic type, e.g. float, are only validated once per column.
+
+    Returns:
+        A list with a component for each row. The components don't have a parent yet.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+        TypeError: If an attribute doesn't exist, a required attribute is missing, a
+            value has the wrong type, or the class of a nested component can't be
+            determined.
+        AttributeError: If a QuAM object in the table already has a parent or is used
+            by multiple components.
+
+    Example:
+        ```
+        qubits = build_components(
+            Transmon,
+            {
+                "id": np.arange(100),
+                "xy/opx_output_I": [("con1", 2 * idx + 1) for idx in range(100)],
+                "xy/opx_output_Q": [("con1", 2 * idx + 2) for idx in range(100)],
+                "xy/intermediate_frequency": 100e6,
+                "xy/frequency_converter_up/local_oscillator/frequency": LO_frequencies,
+                "xy/operations/X180/length": 40,
+                "xy/operations/X180/amplitude": amplitudes,
+                "xy/operations/X180/sigma": 8,
+                "xy/operations/X180/axis_angle": 0.0,
+            },
+            components={
+                "xy/frequency_converter_up": FrequencyConverter,
+                "xy/frequency_converter_up/mixer": Mixer,
+                "xy/frequency_converter_up/local_oscillator": LocalOscillator,
+                "xy/operations/X180": pulses.GaussianPulse,
+            },
+        )
+        machine.qubits.update({qubit.name: qubit for qubit in qubits})
+        ```
+    """
+    root, num_rows = _parse_table(cls, table, components or {}, num_rows)
+    _resolve_classes(root)
+    return _build_node(root, num_rows, validate_type)
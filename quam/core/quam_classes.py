@@ -17,10 +17,14 @@ from typing import (
     get_origin,
     get_args,
     Optional,
+    Tuple,
 )
-from functools import partial
+from functools import lru_cache, partial
 from dataclasses import dataclass, fields, is_dataclass, MISSING
 from collections import UserDict, UserList
+import numbers
+
+import numpy as np
 
 from quam.serialisation import AbstractSerialiser, JSONSerialiser
 from quam.utils import (
@@ -30,8 +34,15 @@ from quam.utils import (
     get_full_class_path,
     type_is_optional,
     generate_config_final_actions,
+    convert_config_arrays_to_lists,
+    get_config_fingerprint,
+    get_config_delta,
+    get_config_fingerprint_tree,
+    deduplicate_integration_weights,
+    check_waveform_memory,
+    get_config_footprint,
 )
-from quam.core.quam_instantiation import instantiate_quam_class
+from quam.core.quam_instantiation import instantiate_quam_class, union_types
 from .qua_config_template import qua_config_template
 
 
@@ -41,10 +52,17 @@ __all__ = [
     "QuamComponent",
     "QuamDict",
     "QuamList",
+    "QuamNumericList",
     "quam_dataclass",
 ]
 
 
+@lru_cache(maxsize=None)
+def _get_type_hints(cls: type) -> Dict[str, type]:
+    """Get the type hints of a class, cached as these don't change after creation."""
+    return get_type_hints(cls)
+
+
 def _get_value_annotation(cls_or_obj: Union[type, object], attr: str) -> type:
     """Get the type annotation for the values in a QuamDict or QuamList.
 
@@ -57,7 +75,7 @@ def _get_value_annotation(cls_or_obj: Union[type, object], attr: str) -> type:
 
     cls = cls_or_obj if isinstance(cls_or_obj, type) else cls_or_obj.__class__
 
-    annotated_attrs = get_type_hints(cls)
+    annotated_attrs = _get_type_hints(cls)
     if attr not in annotated_attrs:
         return None
 
@@ -69,12 +87,51 @@ def _get_value_annotation(cls_or_obj: Union[type, object], attr: str) -> type:
     return None
 
 
+def _get_numeric_list_type(cls_or_obj: Union[type, object], attr: str) -> type:
+    """Get the element type of an attribute annotated as a numeric list.
+
+    If the attribute is defined as List[float], this will return float.
+    If the attribute is defined as List[int], this will return int.
+    The list can also be part of a union, e.g. Optional[List[float]].
+    In all other cases, this will return None.
+    """
+    if cls_or_obj is None or attr is None:
+        return None
+
+    cls = cls_or_obj if isinstance(cls_or_obj, type) else cls_or_obj.__class__
+
+    attr_annotation = _get_type_hints(cls).get(attr)
+    if get_origin(attr_annotation) in union_types:
+        candidate_annotations = get_args(attr_annotation)
+    else:
+        candidate_annotations = [attr_annotation]
+
+    for annotation in candidate_annotations:
+        if get_origin(annotation) == list and get_args(annotation) in [
+            (float,),
+            (int,),
+        ]:
+            return get_args(annotation)[0]
+    return None
+
+
 def convert_dict_and_list(value, cls_or_obj=None, attr=None):
-    """Convert a dict or list to a QuamDict or QuamList if possible."""
+    """Convert a dict or list to a QuamDict or QuamList if possible.
+
+    Lists and numpy arrays of an attribute annotated as List[float] or List[int] are
+    converted to a QuamNumericList if all elements are numbers of that type.
+    """
     if isinstance(value, dict):
         value_annotation = _get_value_annotation(cls_or_obj=cls_or_obj, attr=attr)
         return QuamDict(value, value_annotation=value_annotation)
-    elif type(value) == list:
+    elif type(value) == list or isinstance(value, np.ndarray):
+        numeric_type = _get_numeric_list_type(cls_or_obj=cls_or_obj, attr=attr)
+        if numeric_type is not None:
+            numeric_array = _to_numeric_array(value, numeric_type)
+            if numeric_array is not None:
+                return QuamNumericList(numeric_array, value_annotation=numeric_type)
+        if isinstance(value, np.ndarray):
+            return value
         value_annotation = _get_value_annotation(cls_or_obj=cls_or_obj, attr=attr)
         return QuamList(value, value_annotation=value_annotation)
     else:
@@ -112,6 +169,8 @@ def sort_quam_components(components: List["QuamComponent"], max_attempts=5) -> L
 
             if "after" in component.config_settings:
                 for after_component in component.config_settings["after"]:
+                    if not any(after_component is elem for elem in sorted_components):
+                        continue
                     after_component_idx = sorted_components.index(after_component)
                     if after_component_idx < component_idx:
                         continue
@@ -121,6 +180,8 @@ def sort_quam_components(components: List["QuamComponent"], max_attempts=5) -> L
 
             if "before" in component.config_settings:
                 for before_component in component.config_settings["before"]:
+                    if not any(before_component is elem for elem in sorted_components):
+                        continue
                     before_component_idx = sorted_components.index(before_component)
                     if before_component_idx > component_idx:
                         continue
@@ -139,6 +200,71 @@ def sort_quam_components(components: List["QuamComponent"], max_attempts=5) -> L
     return sorted_components
 
 
+def _iterate_referenced_children(quam_obj: "QuamBase") -> Iterator["QuamBase"]:
+    """Iterate over the direct QuamBase children of a QuamBase object.
+
+    Contrary to `QuamBase.iterate_components`, references are followed, such that
+    components that are referenced (e.g. a port or frequency converter) are included.
+    """
+    if isinstance(quam_obj, QuamDict):
+        values = (quam_obj[key] for key in quam_obj.data)
+    elif isinstance(quam_obj, QuamList):
+        values = (quam_obj[idx] for idx in range(len(quam_obj.data)))
+    else:
+        values = quam_obj.get_attrs(
+            follow_references=True, include_defaults=True
+        ).values()
+
+    for value in values:
+        if isinstance(value, QuamBase):
+            yield value
+
+
+def get_config_dependencies(components: Sequence["QuamBase"]) -> List["QuamComponent"]:
+    """Collect all QuamComponent objects needed to add components to the QUA config.
+
+    The dependencies of a component are all the QuamComponent objects nested in it,
+    including those that are referenced, such as pulses, ports, mixers and frequency
+    converters. Components listed in `config_settings["after"]` (e.g. the `Octave` of
+    an Octave frequency converter) are also included, but their nested components are
+    not, as they aren't needed by the selected components.
+
+    Args:
+        components: The QuamBase objects whose dependencies to collect.
+            Any nested QuamComponents are also included.
+
+    Returns:
+        A list of QuamComponent objects, ordered depth-first as in
+        `QuamBase.iterate_components`.
+    """
+    dependencies = []
+    added_ids = set()
+    visited_ids = set()
+
+    def add_component(component):
+        if id(component) not in added_ids:
+            added_ids.add(id(component))
+            dependencies.append(component)
+
+    to_visit = list(reversed(components))
+    while to_visit:
+        quam_obj = to_visit.pop()
+        if id(quam_obj) in visited_ids:
+            continue
+        visited_ids.add(id(quam_obj))
+
+        if isinstance(quam_obj, QuamComponent):
+            add_component(quam_obj)
+            config_settings = quam_obj.config_settings or {}
+            for after_component in config_settings.get("after", []):
+                if after_component is not None:
+                    add_component(after_component)
+
+        to_visit.extend(reversed(list(_iterate_referenced_children(quam_obj))))
+
+    return dependencies
+
+
 def _quam_dataclass(cls=None, **kwargs):
     """Dataclass for QuAM classes.
 
@@ -179,6 +305,22 @@ quam_dataclass = dataclass
 exec("quam_dataclass = _quam_dataclass")
 
 
+def _increment_structure_version(obj: Any):
+    """Increment the structure version of an object and the subtree versions of it
+    and its ancestors, see `QuamBase._structure_changed`."""
+    # Bypass the reference checks of attribute access for speed
+    obj_dict = object.__getattribute__(obj, "__dict__")
+    obj_dict["_structure_version"] = obj_dict.get("_structure_version", 0) + 1
+
+    while obj_dict is not None:
+        obj_dict["_subtree_version"] = obj_dict.get("_subtree_version", 0) + 1
+        parent = obj_dict.get("parent")
+        try:
+            obj_dict = object.__getattribute__(parent, "__dict__")
+        except AttributeError:  # No parent, or a parent that isn't a QuAM object
+            obj_dict = None
+
+
 class ParentDescriptor:
     """Descriptor for the parent attribute of QuamBase.
 
@@ -204,6 +346,9 @@ class ParentDescriptor:
         return None
 
     def __set__(self, instance, value):
+        # Invalidates the cached values of the instance and of its previous ancestors
+        _increment_structure_version(instance)
+
         if value is None:
             instance.__dict__.pop("parent", None)
             return
@@ -214,6 +359,61 @@ class ParentDescriptor:
                 f"Cannot overwrite parent attribute of {cls}. " f"To modify {cls}.parent, first set {cls}.parent = None"
             )
         instance.__dict__["parent"] = value
+        # Invalidates the cached values that depend on the subtree of the new ancestors
+        _increment_structure_version(instance)
+
+
+class structure_cached_property:
+    """Property whose value is cached until the structure around an object changes.
+
+    This is used for values that are derived from the position of an object in QuAM,
+    e.g. the attribute name of an object in its parent, which otherwise require a
+    scan of all attributes of the parent each time they are accessed. The cached value
+    is invalidated whenever the object's parent or id is set, or an entry of the parent
+    is replaced, removed or reordered, see `QuamBase._structure_changed`. Errors are
+    not cached.
+
+    Note:
+        The value should only depend on the object itself, its parent and the
+        position of the object in its parent, and on `string_reference.DELIMITER`.
+        In particular, it should not depend on the name or any other property of the
+        parent, as changes to these do not invalidate the cached value.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attr_name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attr_name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # Bypass the reference checks of attribute access for speed
+        instance_dict = object.__getattribute__(instance, "__dict__")
+        parent = instance_dict.get("parent")
+        try:
+            parent_dict = object.__getattribute__(parent, "__dict__")
+            parent_version = parent_dict.get("_structure_version", 0)
+        except AttributeError:  # No parent, or a parent that isn't a QuAM object
+            parent_version = None
+        cache_key = (
+            instance_dict.get("_structure_version", 0),
+            parent_version,
+            string_reference.DELIMITER,
+        )
+
+        cache = instance_dict.setdefault("_structure_cache", {})
+        cached_key, value = cache.get(self.attr_name, (None, None))
+        if cached_key == cache_key:
+            return value
+
+        value = self.func(instance)
+        cache[self.attr_name] = (cache_key, value)
+        return value
 
 
 class QuamBase(ReferenceClass):
@@ -239,6 +439,12 @@ class QuamBase(ReferenceClass):
 
     config_settings: ClassVar[Dict[str, Any]] = None
 
+    # Incremented whenever the parent, id or entries of an object change, see
+    # `structure_cached_property`. Set per object in `QuamBase._structure_changed`.
+    _structure_version: ClassVar[int] = 0
+    # Incremented whenever the structure of an object or any of its descendants changes
+    _subtree_version: ClassVar[int] = 0
+
     def __init__(self):
         # This prohibits instantiating without it being a dataclass
         # This means that we have to subclass this class and make it a dataclass
@@ -251,6 +457,30 @@ class QuamBase(ReferenceClass):
             else:
                 raise TypeError(f"Cannot instantiate {self.__class__.__name__}. " "Please make it a dataclass.")
 
+    def _structure_changed(self):
+        """Invalidate the cached values that depend on the structure of this object.
+
+        This increments the structure version of this object, which invalidates the
+        values cached by `structure_cached_property` of this object and its direct
+        children. The subtree version of this object and all its ancestors is also
+        incremented.
+        """
+        _increment_structure_version(self)
+
+    @structure_cached_property
+    def _attr_name_in_parent(self) -> Union[str, int]:
+        """The attribute name, key or index of this object in its parent.
+
+        Equivalent to `self.parent.get_attr_name(self)`, but cached.
+
+        Raises:
+            AttributeError: If the object has no parent or isn't found in its parent.
+        """
+        parent = self.parent
+        if parent is None:
+            raise AttributeError(f"{self.__class__.__name__} has no parent")
+        return parent.get_attr_name(self)
+
     def _get_attr_names(self) -> List[str]:
         """Get names of all dataclass attributes of this object.
 
@@ -549,6 +779,9 @@ class QuamRoot(QuamBase):
         super().__post_init__()
 
     def __setattr__(self, name, value):
+        if name == "id" or isinstance(self.__dict__.get(name), QuamBase):
+            self._structure_changed()
+
         converted_val = convert_dict_and_list(value, cls_or_obj=self, attr=name)
         super().__setattr__(name, converted_val)
 
@@ -633,11 +866,67 @@ class QuamRoot(QuamBase):
             validate_type=validate_type,
         )
 
-    def generate_config(self) -> Dict[str, Any]:
+    def generate_config(
+        self,
+        arrays_to_lists: bool = True,
+        workers: Optional[int] = None,
+        components: Optional[Sequence[Union["QuamBase", str]]] = None,
+        return_fingerprint: bool = False,
+        deduplicate_weights: bool = False,
+        lazy_waveforms: bool = False,
+        waveform_memory_budget: Optional[int] = None,
+        single_precision: bool = False,
+    ) -> Union[Dict[str, Any], Tuple[Dict[str, Any], str]]:
         """Generate the QUA configuration from the QuAM object.
 
+        Args:
+            arrays_to_lists: Whether to convert the waveform samples and integration
+                weights, which are numpy arrays during config generation, to lists.
+                Can be set to False if the consumer of the config accepts numpy arrays.
+                Default is True.
+            workers: The number of threads used to precompute the waveforms of all
+                pulses before the config is assembled. If None (default), waveforms
+                are calculated sequentially. The resulting config is identical in
+                both cases. Pulses of the same class and length are evaluated in
+                batches, see `quam.components.pulses.calculate_waveforms`.
+            components: Optional selection of components to generate the config for,
+                e.g. a single qubit or channel. Each entry is either a QuamBase object
+                or an absolute reference string, which may contain wildcards, e.g.
+                "#/qubits/q*/xy". Only these components and their dependencies are
+                added to the config. If None (default), all components are added.
+            return_fingerprint: Whether to also return a stable fingerprint of the
+                config, see `quam.utils.config.get_config_fingerprint`. Identical
+                configs have identical fingerprints, which can be used to skip
+                re-uploading an unchanged config. Default is False.
+            deduplicate_weights: Whether to only keep a single copy of identical
+                integration weights, e.g. for multiplexed readout pulses, see
+                `quam.utils.config.deduplicate_integration_weights`.
+                Default is False.
+            lazy_waveforms: Whether to add the waveforms as
+                [`LazyWaveform`][quam.utils.config.LazyWaveform] entries, whose samples
+                are only calculated when accessed. This speeds up generating configs
+                that are only inspected, e.g. to validate elements or frequencies.
+                The samples are calculated from the pulses when first accessed, so
+                pulses modified in the meantime affect the config. Use
+                `quam.utils.config.materialise_waveforms` to calculate all samples,
+                e.g. before serialising the config. Default is False.
+            waveform_memory_budget: Optional maximum number of arbitrary waveform
+                samples per controller / FEM. A warning is raised for each controller
+                or FEM whose waveforms exceed it, see
+                `quam.utils.config.check_waveform_memory`. Note that waveforms of
+                ports with a 2 GS/s sampling rate have two samples per ns.
+            single_precision: Whether to store the waveform samples and integration
+                weights as float32 instead of float64 arrays, halving their memory.
+                The deviation w.r.t. float64 values is far below the DAC resolution.
+                When converted to lists, each float32 value is converted to the
+                Python float with the same value. See
+                `quam.components.pulses.single_precision_waveforms`.
+                Default is False.
+
         Returns:
             A dictionary with the QUA configuration.
+            If `return_fingerprint` is True, a tuple of the QUA configuration and its
+            fingerprint is returned instead.
 
         Note:
             This function collects all the nested QuamComponent objects and calls
@@ -645,16 +934,239 @@ class QuamRoot(QuamBase):
         """
         qua_config = deepcopy(qua_config_template)
 
-        quam_components = list(self.iterate_components())
+        if components is None:
+            quam_components = list(self.iterate_components())
+        else:
+            quam_components = get_config_dependencies(
+                self._resolve_components(components)
+            )
         sorted_components = sort_quam_components(quam_components)
 
-        for quam_component in sorted_components:
-            quam_component.apply_to_config(qua_config)
+        from quam.components.pulses import (
+            Pulse,
+            defer_waveforms,
+            precompute_waveforms,
+            single_precision_waveforms,
+        )
+
+        precision_context = single_precision_waveforms(single_precision)
+
+        if lazy_waveforms:
+            waveforms_context = defer_waveforms()
+        else:
+            pulses = [
+                component
+                for component in sorted_components
+                if isinstance(component, Pulse)
+                and component.channel is not None
+                and component.segment_labels is None
+            ]
+            waveforms_context = precompute_waveforms(pulses, workers=workers)
+
+        with precision_context, waveforms_context:
+            for quam_component in sorted_components:
+                quam_component.apply_to_config(qua_config)
 
         generate_config_final_actions(qua_config)
 
+        if deduplicate_weights:
+            deduplicate_integration_weights(qua_config)
+
+        if waveform_memory_budget is not None:
+            check_waveform_memory(qua_config, max_samples=waveform_memory_budget)
+
+        if return_fingerprint:
+            fingerprint = get_config_fingerprint(qua_config)
+
+        if arrays_to_lists:
+            convert_config_arrays_to_lists(qua_config)
+
+        if return_fingerprint:
+            return qua_config, fingerprint
         return qua_config
 
+    def generate_config_delta(
+        self,
+        previous_config: Dict[str, Any],
+        arrays_to_lists: bool = True,
+        components: Optional[Sequence[Union["QuamBase", str]]] = None,
+        return_config: bool = False,
+    ) -> Union[Dict[str, Dict[str, Any]], Tuple[Dict[str, Dict[str, Any]], ...]]:
+        """Generate the changes of the QUA configuration w.r.t. a previous config.
+
+        This can be used to send a minimal update when only a few pulses or
+        frequencies have changed, see `quam.utils.config.get_config_delta` for
+        details. To compute the next delta without regenerating the config, use
+        `return_config=True` and pass the returned fingerprint tree as the previous
+        config of the next call.
+
+        Args:
+            previous_config: The previous QUA configuration, or its fingerprint tree
+                as returned by `quam.utils.config.get_config_fingerprint_tree`.
+            arrays_to_lists: Whether to convert numpy arrays in the added and changed
+                entries to lists, see `QuamRoot.generate_config`. Default is True.
+            components: Optional selection of components to generate the config
+                for, see `QuamRoot.generate_config`.
+            return_config: Whether to also return the new QUA configuration and its
+                fingerprint tree. Default is False.
+
+        Returns:
+            A dictionary with, for each config section (e.g. "elements"), a
+            dictionary with the "added", "removed" and "changed" entries.
+            If `return_config` is True, a tuple of the delta, the new QUA
+            configuration and its fingerprint tree is returned instead.
+        """
+        qua_config = self.generate_config(
+            arrays_to_lists=arrays_to_lists, components=components
+        )
+        fingerprint_tree = get_config_fingerprint_tree(qua_config)
+        config_delta = get_config_delta(
+            previous_config, qua_config, fingerprint_tree=fingerprint_tree
+        )
+        if return_config:
+            return config_delta, qua_config, fingerprint_tree
+        return config_delta
+
+    def get_config_footprint(
+        self, components: Optional[Sequence[Union["QuamBase", str]]] = None
+    ) -> Dict[str, Dict[Any, Dict[str, int]]]:
+        """Analyse the memory footprint of the QUA configuration.
+
+        The configuration is generated, and the number of waveform samples,
+        integration weights segments and digital waveform entries is determined per
+        element, pulse and controller / FEM, see
+        `quam.utils.config.get_config_footprint` for details.
+
+        Pulses are keyed by their QuAM reference, e.g. "#/qubits/q0/xy/operations/X",
+        and sorted such that the largest contributors come first. Config pulses that
+        don't originate from a QuAM pulse keep their config name.
+
+        Args:
+            components: Optional selection of components to analyse, see
+                `QuamRoot.generate_config`.
+
+        Returns:
+            A dictionary with the entries "elements", "pulses", "devices" and
+            "savings", see `quam.utils.config.get_config_footprint`.
+        """
+        from quam.components.pulses import Pulse
+
+        qua_config = self.generate_config(arrays_to_lists=False, components=components)
+        footprint = get_config_footprint(qua_config)
+
+        pulse_references = {}
+        for component in self.iterate_components():
+            if not isinstance(component, Pulse) or component.channel is None:
+                continue
+            reference = component.get_reference()
+            pulse_references[component.pulse_name] = reference
+            for pulse_name in component.segment_pulse_mapping.values():
+                pulse_references[pulse_name] = reference
+
+        pulse_footprints = {}
+        for pulse_name, pulse_footprint in footprint["pulses"].items():
+            reference = pulse_references.get(pulse_name, pulse_name)
+            if reference not in pulse_footprints:
+                pulse_footprints[reference] = dict(pulse_footprint)
+                continue
+            for quantity, size in pulse_footprint.items():
+                pulse_footprints[reference][quantity] += size
+
+        footprint["pulses"] = dict(
+            sorted(
+                pulse_footprints.items(),
+                key=lambda item: tuple(item[1].values()),
+                reverse=True,
+            )
+        )
+        return footprint
+
+    def get_spectral_collisions(
+        self,
+        threshold: float,
+        components: Optional[Sequence[Union["QuamBase", str]]] = None,
+    ) -> List[Tuple[Any, Any]]:
+        """Find signal frequencies of QuAM components that are close together.
+
+        The RF frequencies and mixer images of IQ channels, the LO frequencies of local
+        oscillators, Octave up-converters and MW-FEM up-converters, and the intermediate
+        frequencies of channels sharing an output port are collected, see
+        `quam.components.get_spectral_lines`. All pairs whose frequencies differ by at
+        most the threshold are then found using a sort-based sweep, see
+        `quam.components.find_spectral_collisions`. RF, image and LO frequencies only
+        collide if they are on the same output line, i.e. their components are
+        connected through shared output ports or frequency converters.
+
+        Args:
+            threshold: The maximum frequency difference in Hz of colliding signals.
+            components: Optional selection of components to analyse, including their
+                nested components, see `QuamRoot.generate_config`.
+
+        Returns:
+            A list of pairs of colliding `SpectralLine` objects, each containing the
+            frequency, kind ("RF", "image", "LO" or "IF") and source of a signal.
+        """
+        from quam.components.spectral_collisions import (
+            find_spectral_collisions,
+            get_spectral_lines,
+        )
+
+        if components is None:
+            selected_components = self.iterate_components()
+        else:
+            selected_components = {}
+            for component in self._resolve_components(components):
+                for nested_component in component.iterate_components():
+                    selected_components.setdefault(
+                        id(nested_component), nested_component
+                    )
+            selected_components = selected_components.values()
+
+        lines = get_spectral_lines(selected_components)
+        return find_spectral_collisions(lines, threshold)
+
+    def _resolve_components(
+        self, components: Sequence[Union["QuamBase", str]]
+    ) -> List["QuamBase"]:
+        """Resolve a selection of components, which may contain reference strings.
+
+        Args:
+            components: QuamBase objects or absolute reference strings, which may
+                contain wildcards, e.g. "#/qubits/q*/xy".
+
+        Returns:
+            A list of the selected QuamBase objects.
+
+        Raises:
+            ValueError: If a reference string is not absolute or doesn't point to a
+                QuamBase object.
+            TypeError: If an entry is neither a QuamBase object nor a string.
+        """
+        resolved_components = []
+        for component in components:
+            if isinstance(component, QuamBase):
+                resolved_components.append(component)
+                continue
+            elif not isinstance(component, str):
+                raise TypeError(
+                    f"Cannot select component {component} of type {type(component)}"
+                )
+
+            if not string_reference.is_absolute_reference(component):
+                raise ValueError(
+                    f"Component selection {component} is not an absolute reference"
+                )
+
+            values = string_reference.get_referenced_values(self, component, root=self)
+            for value in values:
+                if not isinstance(value, QuamBase):
+                    raise ValueError(
+                        f"Component selection {component} points to {value}, which is "
+                        "not a QuAM object"
+                    )
+            resolved_components.extend(values)
+        return resolved_components
+
     def get_unreferenced_value(self, attr: str):
         return getattr(self, attr)
 
@@ -671,6 +1183,9 @@ class QuamComponent(QuamBase):
     """
 
     def __setattr__(self, name, value):
+        if name == "id" or isinstance(self.__dict__.get(name), QuamBase):
+            self._structure_changed()
+
         converted_val = convert_dict_and_list(value, cls_or_obj=self, attr=name)
         super().__setattr__(name, converted_val)
 
@@ -757,11 +1272,17 @@ class QuamDict(UserDict, QuamBase):
     def __setitem__(self, key, value):
         value = convert_dict_and_list(value)
         self._is_valid_setattr(key, value, error_on_False=True)
+        if isinstance(self.data.get(key), QuamBase):
+            self._structure_changed()
         super().__setitem__(key, value)
 
         if isinstance(value, QuamBase):
             value.parent = self
 
+    def __delitem__(self, key):
+        self._structure_changed()
+        super().__delitem__(key)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, dict):
             return self.data == other
@@ -916,12 +1437,38 @@ class QuamList(UserList, QuamBase):
         return elem
 
     def __setitem__(self, i, item):
+        self._structure_changed()
         converted_item = convert_dict_and_list(item)
         super().__setitem__(i, converted_item)
 
         if isinstance(converted_item, QuamBase):
             converted_item.parent = self
 
+    # Methods that remove or reorder elements change the names of the other elements
+    def __delitem__(self, i):
+        self._structure_changed()
+        super().__delitem__(i)
+
+    def pop(self, i: int = -1) -> Any:
+        self._structure_changed()
+        return super().pop(i)
+
+    def remove(self, item: Any) -> None:
+        self._structure_changed()
+        super().remove(item)
+
+    def clear(self) -> None:
+        self._structure_changed()
+        super().clear()
+
+    def reverse(self) -> None:
+        self._structure_changed()
+        super().reverse()
+
+    def sort(self, /, *args, **kwds) -> None:
+        self._structure_changed()
+        super().sort(*args, **kwds)
+
     def __iadd__(self, other: Iterable):
         converted_other = [convert_dict_and_list(elem) for elem in other]
         return super().__iadd__(converted_other)
@@ -935,6 +1482,7 @@ class QuamList(UserList, QuamBase):
         return super().append(converted_item)
 
     def insert(self, i: int, item: Any) -> None:
+        self._structure_changed()
         converted_item = convert_dict_and_list(item)
 
         if isinstance(converted_item, QuamBase):
@@ -1059,3 +1607,258 @@ class QuamList(UserList, QuamBase):
                     val.print_summary(indent=indent + 2)
                 else:
                     print(" " * (indent + 2) + f"{k}: {val}")
+
+
+def _is_numeric_element(value, numeric_type: type) -> bool:
+    """Check whether a value can be stored in a QuamNumericList of a numeric type.
+
+    Integers can be stored in a float list, but floats can't be stored in an int list.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    if numeric_type is int:
+        return isinstance(value, numbers.Integral)
+    return isinstance(value, numbers.Real)
+
+
+def _to_numeric_array(values, numeric_type: type) -> Optional[np.ndarray]:
+    """Convert values to a 1D numpy array of a numeric type.
+
+    Returns:
+        The numpy array, or None if any of the values isn't a number of the given type.
+    """
+    dtype = np.int64 if numeric_type is int else np.float64
+    if isinstance(values, np.ndarray):
+        allowed_kinds = "iu" if numeric_type is int else "iuf"
+        if values.ndim != 1 or values.dtype.kind not in allowed_kinds:
+            return None
+        return values.astype(dtype, copy=False)
+
+    if not all(_is_numeric_element(value, numeric_type) for value in values):
+        return None
+    try:
+        return np.array(values, dtype=dtype)
+    except OverflowError:
+        return None
+
+
+def _numeric_list_method(method_name: str):
+    """Create a QuamNumericList method that applies the UserList method to a list.
+
+    The array data is temporarily converted to a list, and afterwards converted back
+    to an array if all elements are still numbers of the list type.
+    """
+    list_method = getattr(UserList, method_name)
+
+    def method(self, *args, **kwargs):
+        args = [
+            arg._values() if isinstance(arg, QuamNumericList) else arg for arg in args
+        ]
+        self.data = list(self._values())
+        try:
+            return list_method(self, *args, **kwargs)
+        finally:
+            self._pack()
+
+    method.__name__ = method_name
+    method.__doc__ = list_method.__doc__
+    return method
+
+
+@quam_dataclass
+class QuamNumericList(QuamList):
+    """A QuAM list of numbers, backed by a numpy array.
+
+    Lists of attributes annotated as `List[float]` or `List[int]`, e.g.
+    `SingleChannel.filter_fir_taps`, are automatically converted to a
+    `QuamNumericList` if all elements are numbers of that type. Elements are stored
+    in a float64 or int64 numpy array, which avoids the per-element conversion and
+    reference handling of a regular `QuamList`:
+    - Indexing returns Python numbers, slicing returns a numpy view without copying
+    - Slices can be assigned in bulk, e.g. `taps[:] = np.zeros(len(taps))`
+    - `np.asarray(numeric_list)` returns the underlying array without copying
+    - Appending is amortised O(1), as the array is a view of a buffer that grows
+      geometrically. Inserting elsewhere than at the end copies the array, which is
+      O(n) like inserting in a list.
+    - Serialisation produces the same list of numbers as a `QuamList`, except that
+      integer elements of a float list are stored and serialised as floats, e.g.
+      `[1, 0.5]` becomes `[1.0, 0.5]`.
+
+    If an element is added that isn't a number of the list type, e.g. a reference
+    string, the elements are stored in a regular list and the `QuamNumericList`
+    behaves like a `QuamList`.
+    """
+
+    def __init__(self, *args, value_annotation: type = float):
+        self._value_annotation = value_annotation
+        # Array with spare capacity of which `data` is a view, see `append`
+        self._buffer = None
+        UserList.__init__(self)
+        self.data = _to_numeric_array([], value_annotation)
+        if args:
+            self.extend(*args)
+
+    @property
+    def is_array_backed(self) -> bool:
+        """Whether the elements are stored in a numpy array"""
+        return isinstance(self.data, np.ndarray)
+
+    def _values(self) -> list:
+        """The elements as a list of Python objects"""
+        if self.is_array_backed:
+            return self.data.tolist()
+        return self.data
+
+    def _pack(self):
+        """Store the elements in a numpy array if all are numbers of the list type"""
+        if self.is_array_backed:
+            return
+        numeric_array = _to_numeric_array(self.data, self._value_annotation)
+        if numeric_array is not None:
+            self.data = numeric_array
+
+    def _unpack(self):
+        """Store the elements in a list, e.g. before adding a non-numeric element"""
+        if self.is_array_backed:
+            self.data = self.data.tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.data, dtype=dtype)
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, UserList):
+            value = value.data
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        return self._values() == value
+
+    def __repr__(self) -> str:
+        return repr(self._values())
+
+    def __iter__(self):
+        return iter(self._values())
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self) -> "QuamNumericList":
+        return type(self)(self.data, value_annotation=self._value_annotation)
+
+    def __add__(self, other: Iterable) -> "QuamNumericList":
+        values = self._values() + list(other)
+        return type(self)(values, value_annotation=self._value_annotation)
+
+    def __radd__(self, other: Iterable) -> "QuamNumericList":
+        values = list(other) + self._values()
+        return type(self)(values, value_annotation=self._value_annotation)
+
+    def __mul__(self, n: int) -> "QuamNumericList":
+        return type(self)(self._values() * n, value_annotation=self._value_annotation)
+
+    __rmul__ = __mul__
+
+    def __getitem__(self, i):
+        if not self.is_array_backed:
+            return super().__getitem__(i)
+        elem = self.data[i]
+        if isinstance(i, slice):
+            return elem
+        return elem.item()
+
+    def __setitem__(self, i, item):
+        if self.is_array_backed:
+            if isinstance(i, slice):
+                items = _to_numeric_array(np.asarray(item), self._value_annotation)
+                if items is not None and len(items) == len(self.data[i]):
+                    self.data[i] = items
+                    return
+            elif _is_numeric_element(item, self._value_annotation):
+                self.data[i] = item
+                return
+
+        self._unpack()
+        if isinstance(i, slice):
+            UserList.__setitem__(self, i, [convert_dict_and_list(e) for e in item])
+        else:
+            super().__setitem__(i, item)
+        self._pack()
+
+    def __iadd__(self, other: Iterable):
+        self.extend(other)
+        return self
+
+    def append(self, item: Any) -> None:
+        if not (
+            self.is_array_backed and _is_numeric_element(item, self._value_annotation)
+        ):
+            self._unpack()
+            super().append(item)
+            return
+
+        # The data is a view of the first elements of a buffer with spare capacity,
+        # such that appending only copies the elements when the buffer is full
+        buffer = self._buffer
+        size = len(self.data)
+        if buffer is None or self.data.base is not buffer or size >= len(buffer):
+            buffer = np.empty(max(8, 2 * size), dtype=self.data.dtype)
+            buffer[:size] = self.data
+            self._buffer = buffer
+        buffer[size] = item
+        self.data = buffer[: size + 1]
+
+    def insert(self, i: int, item: Any) -> None:
+        if i >= len(self):
+            self.append(item)
+        elif self.is_array_backed and _is_numeric_element(
+            item, self._value_annotation
+        ):
+            self.data = np.insert(self.data, i, item)
+        else:
+            self._unpack()
+            super().insert(i, item)
+
+    def extend(self, iterable: Iterator) -> None:
+        if self.is_array_backed:
+            if isinstance(iterable, QuamNumericList) and iterable.is_array_backed:
+                iterable = iterable.data
+            elif not isinstance(iterable, np.ndarray):
+                iterable = list(iterable)
+            items = _to_numeric_array(iterable, self._value_annotation)
+            if items is not None:
+                self.data = np.concatenate([self.data, items])
+                return
+        self._unpack()
+        super().extend(iterable)
+
+    def to_dict(
+        self, follow_references: bool = False, include_defaults: bool = False
+    ) -> list:
+        """Convert this object to a list of numbers.
+
+        See `QuamList.to_dict` for details.
+        """
+        if self.is_array_backed:
+            return self.data.tolist()
+        return super().to_dict(
+            follow_references=follow_references, include_defaults=include_defaults
+        )
+
+
+# List methods of QuamNumericList that aren't vectorised
+for _method_name in [
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__delitem__",
+    "__imul__",
+    "pop",
+    "remove",
+    "clear",
+    "count",
+    "index",
+    "reverse",
+    "sort",
+]:
+    setattr(QuamNumericList, _method_name, _numeric_list_method(_method_name))
+del _method_name
@@ -1,4 +1,46 @@
-__all__ = ["generate_config_final_actions"]
+import hashlib
+import numbers
+import struct
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import warnings
+
+import numpy as np
+
+__all__ = [
+    "generate_config_final_actions",
+    "convert_config_arrays_to_lists",
+    "get_config_fingerprint_tree",
+    "get_config_fingerprint",
+    "get_config_delta",
+    "deduplicate_integration_weights",
+    "LazyWaveform",
+    "materialise_waveforms",
+    "get_config_footprint",
+    "get_waveform_memory_usage",
+    "check_waveform_memory",
+]
+
+FINGERPRINT_DIGEST_SIZE = 16
+FOOTPRINT_QUANTITIES = {
+    "waveforms": "waveform_samples",
+    "integration_weights": "integration_weights_segments",
+    "digital_waveforms": "digital_waveform_entries",
+}
+FOOTPRINT_SAVINGS = (
+    "constant_waveform_samples",
+    "duplicate_waveform_samples",
+    "duplicate_integration_weights_segments",
+)
+CONFIG_DELTA_SECTIONS = (
+    "elements",
+    "pulses",
+    "waveforms",
+    "integration_weights",
+    "mixers",
+    "controllers",
+    "octaves",
+)
 
 
 def generate_config_final_actions(qua_config):
@@ -26,3 +68,579 @@ def generate_config_final_actions(qua_config):
         if "analog_inputs" in controller_cfg:
             for analog_input in controller_cfg["analog_inputs"].values():
                 analog_input.setdefault("offset", 0.0)
+
+
+def _integration_weights_to_list(integration_weights):
+    """Convert an (N, 2) array of (weight, length) rows to a list of tuples"""
+    if not isinstance(integration_weights, np.ndarray):
+        return integration_weights
+    weights = integration_weights[:, 0].tolist()
+    lengths = integration_weights[:, 1].astype(int).tolist()
+    return list(zip(weights, lengths))
+
+
+def _waveform_arrays_to_lists(waveform_cfg):
+    """Convert the samples of a config waveform entry to lists in place"""
+    if isinstance(waveform_cfg.get("samples"), np.ndarray):
+        waveform_cfg["samples"] = waveform_cfg["samples"].tolist()
+    if isinstance(waveform_cfg.get("sample"), np.generic):
+        waveform_cfg["sample"] = waveform_cfg["sample"].item()
+
+
+def convert_config_arrays_to_lists(qua_config):
+    """Convert numpy arrays in the qua config to lists.
+
+    During `QuamRoot.generate_config()`, waveform samples and integration weights are
+    kept as numpy arrays. This function converts them to (nested) lists of Python
+    floats in a single vectorised `ndarray.tolist()` call per entry, such that the
+    config can be serialised, e.g. to JSON.
+
+    The following entries are converted in place:
+    - `qua_config["waveforms"][<name>]["samples"]` and `["sample"]`
+    - `qua_config["integration_weights"][<name>]["cosine"]` and `["sine"]`, which are
+      converted to lists of (weight, length) tuples
+
+    Waveforms that are a `LazyWaveform` are not materialised, but are instead
+    converted once they are materialised.
+
+    Args:
+        qua_config (dict): The generated qua config.
+    """
+    for waveform_cfg in qua_config.get("waveforms", {}).values():
+        if isinstance(waveform_cfg, LazyWaveform):
+            # Converted once the waveform is materialised
+            waveform_cfg.arrays_to_lists = True
+            if waveform_cfg.is_materialised:
+                waveform_cfg.materialise()
+        else:
+            _waveform_arrays_to_lists(waveform_cfg)
+
+    for weights_cfg in qua_config.get("integration_weights", {}).values():
+        for key in ["cosine", "sine"]:
+            if key in weights_cfg:
+                weights_cfg[key] = _integration_weights_to_list(weights_cfg[key])
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_))
+
+
+def _update_hash(hasher, value):
+    """Feed the canonical encoding of a config value to a hasher.
+
+    The encoding is type-tagged and length-prefixed, such that it is unambiguous.
+    It is insensitive to the representation of the config:
+    - Dict entries are sorted by their key, which is converted to a string
+    - Lists, tuples and numpy arrays are encoded identically
+    - Numbers and numeric sequences are encoded as float64 bytes, so that e.g. a
+      waveform gives the same encoding as a numpy array or as a list of floats
+    """
+    if isinstance(value, Mapping):
+        items = sorted((str(key), val) for key, val in value.items())
+        hasher.update(b"d" + struct.pack("<Q", len(items)))
+        for key, val in items:
+            _update_hash(hasher, key)
+            _update_hash(hasher, val)
+    elif isinstance(value, np.ndarray) and value.ndim > 1:
+        hasher.update(b"l" + struct.pack("<Q", len(value)))
+        for row in value:
+            _update_hash(hasher, row)
+    elif isinstance(value, np.ndarray) and value.dtype.kind in "iuf":
+        # Adding 0.0 normalises -0.0 to 0.0, which are numerically identical
+        samples = np.ascontiguousarray(value, dtype="<f8").ravel() + 0.0
+        hasher.update(b"n" + struct.pack("<Q", len(samples)))
+        hasher.update(samples.tobytes())
+    elif isinstance(value, np.ndarray):
+        _update_hash(hasher, value.tolist())
+    elif isinstance(value, (list, tuple)):
+        if all(_is_number(elem) for elem in value):
+            samples = np.asarray(value, dtype="<f8") + 0.0
+            hasher.update(b"n" + struct.pack("<Q", len(samples)))
+            hasher.update(samples.tobytes())
+        else:
+            hasher.update(b"l" + struct.pack("<Q", len(value)))
+            for elem in value:
+                _update_hash(hasher, elem)
+    elif isinstance(value, str):
+        encoded = value.encode()
+        hasher.update(b"s" + struct.pack("<Q", len(encoded)) + encoded)
+    elif isinstance(value, (bool, np.bool_)):
+        hasher.update(b"b" + bytes([bool(value)]))
+    elif _is_number(value):
+        hasher.update(b"f" + struct.pack("<d", float(value) + 0.0))
+    elif value is None:
+        hasher.update(b"N")
+    else:
+        encoded = repr(value).encode()
+        hasher.update(b"r" + struct.pack("<Q", len(encoded)) + encoded)
+
+
+def _hash_config_value(value) -> str:
+    hasher = hashlib.blake2b(digest_size=FINGERPRINT_DIGEST_SIZE)
+    _update_hash(hasher, value)
+    return hasher.hexdigest()
+
+
+def get_config_fingerprint_tree(qua_config) -> Dict[str, Union[str, Dict[str, str]]]:
+    """Compute the fingerprints of all the fragments of a qua config.
+
+    Each entry of a top-level config section, e.g. `qua_config["elements"]["q1.xy"]`,
+    is hashed separately. The hash is canonical: it does not depend on dict ordering,
+    and numbers are hashed as float64 bytes, so waveform samples and integration
+    weights give identical hashes whether they are numpy arrays or lists.
+
+    Args:
+        qua_config (dict): The generated qua config.
+
+    Returns:
+        A dictionary with the same top-level sections as the qua config. Sections that
+        are dictionaries map each entry name to its fingerprint; all other sections,
+        e.g. "version", map directly to a fingerprint.
+    """
+    fingerprint_tree = {}
+    for section, section_cfg in qua_config.items():
+        if isinstance(section_cfg, Mapping):
+            fingerprint_tree[section] = {
+                str(name): _hash_config_value(fragment)
+                for name, fragment in section_cfg.items()
+            }
+        else:
+            fingerprint_tree[section] = _hash_config_value(section_cfg)
+    return fingerprint_tree
+
+
+def get_config_fingerprint(qua_config_or_fingerprint_tree) -> str:
+    """Compute a stable fingerprint of a qua config.
+
+    Two configs have the same fingerprint if and only if they have the same content,
+    regardless of dict ordering or whether arrays are stored as numpy arrays or lists.
+    This can be used to skip uploading a config that is identical to the previous one.
+
+    Args:
+        qua_config_or_fingerprint_tree: Either a qua config, or a fingerprint tree of a
+            qua config as returned by `get_config_fingerprint_tree`.
+
+    Returns:
+        The fingerprint of the config as a hexadecimal string.
+    """
+    if _is_fingerprint_tree(qua_config_or_fingerprint_tree):
+        fingerprint_tree = qua_config_or_fingerprint_tree
+    else:
+        fingerprint_tree = get_config_fingerprint_tree(qua_config_or_fingerprint_tree)
+    return _hash_config_value(fingerprint_tree)
+
+
+def _is_fingerprint_tree(obj: Any) -> bool:
+    """Check whether an object is a fingerprint tree rather than a qua config"""
+    for section_fingerprints in obj.values():
+        if isinstance(section_fingerprints, str):
+            continue
+        if not isinstance(section_fingerprints, Mapping):
+            return False
+        if not all(isinstance(val, str) for val in section_fingerprints.values()):
+            return False
+    return True
+
+
+def get_config_delta(
+    previous_config_or_fingerprint_tree,
+    qua_config,
+    fingerprint_tree: Optional[Dict[str, Union[str, Dict[str, str]]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Determine which entries of a qua config differ from a previous config.
+
+    The comparison is done per fragment, e.g. per element or waveform, by comparing
+    fingerprints (see `get_config_fingerprint_tree`) instead of performing a deep
+    comparison of the configs.
+
+    Args:
+        previous_config_or_fingerprint_tree: The previous qua config, or its
+            fingerprint tree as returned by `get_config_fingerprint_tree`.
+            Storing only the fingerprint tree avoids keeping the previous config in
+            memory.
+        qua_config (dict): The current qua config.
+        fingerprint_tree: Optional fingerprint tree of the current qua config, as
+            returned by `get_config_fingerprint_tree`. If provided, the fragments of
+            the current config aren't hashed again.
+
+    Returns:
+        A dictionary with an entry for each of the sections "elements", "pulses",
+        "waveforms", "integration_weights", "mixers", "controllers" and "octaves".
+        Each entry is a dictionary with keys:
+        - "added": A dict with the fragments that are not in the previous config
+        - "removed": A list with the names of fragments that are no longer present
+        - "changed": A dict with the fragments whose contents have changed
+    """
+    if _is_fingerprint_tree(previous_config_or_fingerprint_tree):
+        previous_tree = previous_config_or_fingerprint_tree
+    else:
+        previous_tree = get_config_fingerprint_tree(previous_config_or_fingerprint_tree)
+
+    config_delta = {}
+    for section in CONFIG_DELTA_SECTIONS:
+        section_cfg = qua_config.get(section, {})
+        previous_fingerprints = previous_tree.get(section, {})
+        if fingerprint_tree is not None:
+            fingerprints = fingerprint_tree.get(section, {})
+        else:
+            fingerprints = None
+
+        section_delta = {"added": {}, "removed": [], "changed": {}}
+        current_names = set()
+        for name, fragment in section_cfg.items():
+            current_names.add(str(name))
+            previous_fingerprint = previous_fingerprints.get(str(name))
+            if previous_fingerprint is None:
+                section_delta["added"][name] = fragment
+                continue
+            if fingerprints is not None:
+                fingerprint = fingerprints[str(name)]
+            else:
+                fingerprint = _hash_config_value(fragment)
+            if previous_fingerprint != fingerprint:
+                section_delta["changed"][name] = fragment
+
+        section_delta["removed"] = [
+            name for name in previous_fingerprints if name not in current_names
+        ]
+        config_delta[section] = section_delta
+
+    return config_delta
+
+
+def deduplicate_integration_weights(qua_config) -> Dict[str, str]:
+    """Remove duplicate integration weights from a qua config.
+
+    Readout pulses often have identical integration weights, e.g. for multiplexed
+    readout of many resonators. Each set of identical integration weights is only
+    kept once, under the name of its first occurrence, and the
+    `integration_weights` mapping of all pulses is updated accordingly.
+    The config is modified in place.
+
+    Args:
+        qua_config (dict): The generated qua config.
+
+    Returns:
+        A dictionary mapping the name of each removed integration weights entry to
+        the name of the entry that replaces it.
+    """
+    integration_weights_cfg = qua_config.get("integration_weights", {})
+
+    names_by_fingerprint = {}
+    replaced_names = {}
+    for name, weights_cfg in integration_weights_cfg.items():
+        fingerprint = _hash_config_value(weights_cfg)
+        if fingerprint in names_by_fingerprint:
+            replaced_names[name] = names_by_fingerprint[fingerprint]
+        else:
+            names_by_fingerprint[fingerprint] = name
+
+    if not replaced_names:
+        return replaced_names
+
+    for name in replaced_names:
+        integration_weights_cfg.pop(name)
+
+    for pulse_cfg in qua_config.get("pulses", {}).values():
+        weights_mapping = pulse_cfg.get("integration_weights")
+        if not weights_mapping:
+            continue
+        pulse_cfg["integration_weights"] = {
+            label: replaced_names.get(name, name)
+            for label, name in weights_mapping.items()
+        }
+
+    return replaced_names
+
+
+class LazyWaveform(Mapping):
+    """Config waveform entry whose samples are only calculated when accessed.
+
+    A `LazyWaveform` behaves as a read-only waveform config entry, e.g.
+    `{"type": "arbitrary", "samples": [...]}`. The entry is only calculated when it is
+    first accessed, after which it is cached. It is added to the config by
+    `QuamRoot.generate_config(lazy_waveforms=True)`, such that inspecting other parts
+    of the config doesn't require calculating any waveforms.
+
+    The entry is calculated from the pulse at the time of the first access, so any
+    changes made to the pulse after generating the config but before accessing the
+    entry are included. Use `materialise_waveforms` to fix the waveforms of a config.
+
+    Note that `json.dump` only accepts dicts, so lazy waveforms should first be
+    converted using `materialise_waveforms`.
+
+    Args:
+        calculate_entry: Function without arguments that returns the waveform entry.
+    """
+
+    def __init__(self, calculate_entry: Callable[[], Dict[str, Any]]):
+        self._calculate_entry = calculate_entry
+        self._entry = None
+        self.arrays_to_lists = False
+
+    @property
+    def is_materialised(self) -> bool:
+        """Whether the waveform entry has been calculated"""
+        return self._entry is not None
+
+    def materialise(self) -> Dict[str, Any]:
+        """Calculate the waveform entry if needed, and return it as a dict"""
+        if self._entry is None:
+            self._entry = dict(self._calculate_entry())
+        if self.arrays_to_lists:
+            _waveform_arrays_to_lists(self._entry)
+        return self._entry
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialise()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialise())
+
+    def __len__(self) -> int:
+        return len(self.materialise())
+
+    def __repr__(self) -> str:
+        if not self.is_materialised:
+            return f"{self.__class__.__name__}(<not materialised>)"
+        return f"{self.__class__.__name__}({self._entry!r})"
+
+
+def materialise_waveforms(qua_config):
+    """Replace all lazy waveforms in a qua config by regular waveform entries.
+
+    This calculates the samples of every `LazyWaveform`, and is needed before e.g.
+    serialising the config to JSON. The config is modified in place.
+
+    Args:
+        qua_config (dict): The generated qua config.
+
+    Returns:
+        The qua config.
+    """
+    waveforms_cfg = qua_config.get("waveforms", {})
+    for name, waveform_cfg in waveforms_cfg.items():
+        if isinstance(waveform_cfg, LazyWaveform):
+            waveforms_cfg[name] = waveform_cfg.materialise()
+    return qua_config
+
+
+def _get_element_output_ports(element_cfg) -> Dict[str, Tuple]:
+    """Get the analog output ports of an element, keyed by the waveform suffix"""
+    if "singleInput" in element_cfg:
+        return {"single": tuple(element_cfg["singleInput"]["port"])}
+    elif "mixInputs" in element_cfg:
+        mix_inputs = element_cfg["mixInputs"]
+        return {"I": tuple(mix_inputs["I"]), "Q": tuple(mix_inputs["Q"])}
+    elif "MWInput" in element_cfg:
+        mw_input = element_cfg["MWInput"]
+        port = mw_input["port"] if isinstance(mw_input, Mapping) else mw_input
+        return {"I": tuple(port), "Q": tuple(port)}
+    return {}
+
+
+def _get_element_input_devices(element_cfg) -> List[Tuple]:
+    """Get the devices of the analog inputs used to measure an element"""
+    ports = list(element_cfg.get("outputs", {}).values())
+    if "MWOutput" in element_cfg:
+        mw_output = element_cfg["MWOutput"]
+        ports.append(mw_output["port"] if isinstance(mw_output, Mapping) else mw_output)
+    return [tuple(port)[:-1] for port in ports]
+
+
+def _get_element_digital_devices(element_cfg) -> List[Tuple]:
+    """Get the devices of the digital outputs used by an element"""
+    return [
+        tuple(digital_cfg["port"])[:-1]
+        for digital_cfg in element_cfg.get("digitalInputs", {}).values()
+        if "port" in digital_cfg
+    ]
+
+
+def _get_footprint_entry_size(qua_config, section: str, name: str) -> int:
+    """Get the memory footprint of a waveform, integration weights or digital marker"""
+    entry_cfg = qua_config.get(section, {}).get(name)
+    if entry_cfg is None:
+        return 0
+    elif section == "waveforms":
+        if entry_cfg.get("type") != "arbitrary":
+            return 0
+        return len(entry_cfg["samples"])
+    elif section == "integration_weights":
+        return len(entry_cfg.get("cosine", [])) + len(entry_cfg.get("sine", []))
+    else:
+        return len(entry_cfg.get("samples", []))
+
+
+def _is_constant_waveform(waveform_cfg) -> bool:
+    if waveform_cfg.get("type") != "arbitrary" or not len(waveform_cfg["samples"]):
+        return False
+    return bool(np.ptp(np.asarray(waveform_cfg["samples"], dtype=float)) == 0)
+
+
+def _get_footprint_savings(qua_config, entries) -> Dict[str, int]:
+    """Determine what deduplication and constant detection would save for entries"""
+    savings = {quantity: 0 for quantity in FOOTPRINT_SAVINGS}
+
+    fingerprints = {section: set() for section in ("waveforms", "integration_weights")}
+    for section, name in sorted(entries):
+        if section not in fingerprints:
+            continue
+        entry_cfg = qua_config[section][name]
+        size = _get_footprint_entry_size(qua_config, section, name)
+
+        if section == "waveforms" and _is_constant_waveform(entry_cfg):
+            savings["constant_waveform_samples"] += size
+            continue
+
+        fingerprint = _hash_config_value(entry_cfg)
+        if fingerprint in fingerprints[section]:
+            savings[f"duplicate_{FOOTPRINT_QUANTITIES[section]}"] += size
+        fingerprints[section].add(fingerprint)
+    return savings
+
+
+def get_config_footprint(qua_config) -> Dict[str, Dict[Any, Dict[str, int]]]:
+    """Analyse the memory footprint of a qua config.
+
+    For each element, pulse and device (controller / FEM), the footprint consists of
+    the number of arbitrary waveform samples, the number of integration weights
+    segments and the number of digital waveform entries. Each waveform, integration
+    weights or digital waveform is counted once per element, pulse and device that
+    uses it, even if it is used by multiple operations.
+
+    Waveforms are attributed to the devices of the element's analog outputs,
+    integration weights to the devices of its analog inputs, and digital waveforms
+    to the devices of its digital outputs. A device is either a tuple `(controller,)`
+    for an OPX+, or `(controller, fem)` for a FEM of an OPX1000.
+
+    Additionally, the possible savings per device are determined:
+
+    - "constant_waveform_samples": Samples of arbitrary waveforms whose samples are
+      all equal, which could be replaced by a constant waveform.
+    - "duplicate_waveform_samples": Samples of arbitrary waveforms that are identical
+      to another waveform on the same device.
+    - "duplicate_integration_weights_segments": Segments of integration weights that
+      are identical to other integration weights on the same device.
+
+    Args:
+        qua_config (dict): The generated qua config.
+
+    Returns:
+        A dictionary with the entries "elements", "pulses", "devices" and "savings".
+        The first three map each element, pulse and device to its footprint, i.e. a
+        dictionary with the keys "waveform_samples", "integration_weights_segments"
+        and "digital_waveform_entries". The "savings" map each device to its possible
+        savings.
+    """
+    pulses_cfg = qua_config.get("pulses", {})
+
+    element_entries = {}
+    pulse_entries = {}
+    device_entries = {}
+    for element_name, element_cfg in qua_config.get("elements", {}).items():
+        output_ports = _get_element_output_ports(element_cfg)
+        input_devices = _get_element_input_devices(element_cfg)
+        digital_devices = _get_element_digital_devices(element_cfg)
+
+        entries = element_entries.setdefault(element_name, set())
+        for pulse_name in element_cfg.get("operations", {}).values():
+            pulse_cfg = pulses_cfg.get(pulse_name, {})
+
+            used_entries = []
+            for suffix, waveform_name in pulse_cfg.get("waveforms", {}).items():
+                port = output_ports.get(suffix)
+                devices = [port[:-1]] if port is not None else []
+                used_entries.append(("waveforms", waveform_name, devices))
+            for weights_name in pulse_cfg.get("integration_weights", {}).values():
+                used_entries.append(
+                    ("integration_weights", weights_name, input_devices)
+                )
+            if pulse_cfg.get("digital_marker") is not None:
+                marker_name = pulse_cfg["digital_marker"]
+                used_entries.append(("digital_waveforms", marker_name, digital_devices))
+
+            for section, name, devices in used_entries:
+                entries.add((section, name))
+                pulse_entries.setdefault(pulse_name, set()).add((section, name))
+                for device in devices:
+                    device_entries.setdefault(device, set()).add((section, name))
+
+    def get_footprint(entries) -> Dict[str, int]:
+        footprint = {quantity: 0 for quantity in FOOTPRINT_QUANTITIES.values()}
+        for section, name in entries:
+            size = _get_footprint_entry_size(qua_config, section, name)
+            footprint[FOOTPRINT_QUANTITIES[section]] += size
+        return footprint
+
+    return {
+        "elements": {
+            name: get_footprint(entries) for name, entries in element_entries.items()
+        },
+        "pulses": {
+            name: get_footprint(entries) for name, entries in pulse_entries.items()
+        },
+        "devices": {
+            device: get_footprint(entries) for device, entries in device_entries.items()
+        },
+        "savings": {
+            device: _get_footprint_savings(qua_config, entries)
+            for device, entries in device_entries.items()
+        },
+    }
+
+
+def get_waveform_memory_usage(qua_config) -> Dict[Tuple, int]:
+    """Determine the number of arbitrary waveform samples per controller / FEM.
+
+    Each arbitrary waveform is counted once for every controller (OPX+) or FEM whose
+    analog outputs play it. Waveforms are attributed to devices through the elements'
+    `singleInput`, `mixInputs` and `MWInput` ports. Constant waveforms, and waveforms
+    of elements whose outputs are not specified through controller ports, are not
+    counted. See `get_config_footprint` for a more extensive analysis.
+
+    Args:
+        qua_config (dict): The generated qua config.
+
+    Returns:
+        A dictionary mapping each device to its number of waveform samples. A device
+        is either a tuple `(controller,)` for an OPX+, or `(controller, fem)` for a
+        FEM of an OPX1000.
+    """
+    device_footprints = get_config_footprint(qua_config)["devices"]
+    return {
+        device: footprint["waveform_samples"]
+        for device, footprint in device_footprints.items()
+    }
+
+
+def check_waveform_memory(qua_config, max_samples: int) -> Dict[Tuple, int]:
+    """Warn if the waveform memory of a controller or FEM exceeds a budget.
+
+    The waveform memory usage is determined by `get_waveform_memory_usage`. This is
+    particularly relevant for ports with a sampling rate of 2 GS/s, whose waveforms
+    have two samples per ns.
+
+    Args:
+        qua_config (dict): The generated qua config.
+        max_samples: The maximum number of arbitrary waveform samples per controller
+            or FEM.
+
+    Returns:
+        A dictionary with the waveform memory usage of the devices that exceed the
+        budget, see `get_waveform_memory_usage`.
+
+    Warns:
+        UserWarning: For each device whose waveform memory exceeds the budget.
+    """
+    exceeded = {}
+    for device, num_samples in get_waveform_memory_usage(qua_config).items():
+        if num_samples <= max_samples:
+            continue
+        exceeded[device] = num_samples
+        device_str = "/".join(str(elem) for elem in device)
+        warnings.warn(
+            f"Waveforms of {device_str} require {num_samples} samples, which exceeds "
+            f"the waveform memory budget of {max_samples} samples"
+        )
+    return exceeded
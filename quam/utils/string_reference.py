@@ -1,5 +1,7 @@
-from typing import Tuple, Any
+from typing import List, Tuple, Any
 from collections import UserList, UserDict
+from dataclasses import fields, is_dataclass
+from fnmatch import fnmatchcase
 
 
 DELIMITER = "."
@@ -118,3 +120,71 @@ def get_referenced_value(obj, string: str, root=None) -> Any:
         return get_relative_reference_value(obj, string)
     except (AttributeError, KeyError) as e:
         raise ValueError(f"String {string} is not a valid reference, Error: {e}") from e
+
+
+def is_glob_reference(string: str) -> bool:
+    """Check if a string is a reference containing wildcards
+
+    Wildcards follow the `fnmatch` syntax, i.e. "*", "?" and "[...]"
+    """
+    if not is_reference(string):
+        return False
+    return any(char in string for char in "*?[")
+
+
+def _get_child_names(obj) -> List[Any]:
+    """Get the names of the attributes, keys or indices of an object"""
+    if isinstance(obj, (dict, UserDict)):
+        return list(obj.keys())
+    elif isinstance(obj, (list, UserList)):
+        return list(range(len(obj)))
+    elif is_dataclass(obj):
+        return [data_field.name for data_field in fields(obj)]
+    return []
+
+
+def get_referenced_values(obj, string: str, root=None) -> List[Any]:
+    """Get all values that a reference string with wildcards points to
+
+    Each attribute in the reference string can contain wildcards following the
+    `fnmatch` syntax, e.g. "#/qubits/q*/xy" or "#/channels/ch[0-3]".
+    Attributes without wildcards are resolved as in `get_referenced_value`.
+
+    Args:
+        string: The reference string, which may contain wildcards
+        root: The root object to start the search from (default: None)
+            Only relevant if the string is an absolute reference.
+
+    Returns:
+        A list of all values that the reference string points to, in the order of
+        the attributes / keys of the referenced objects.
+
+    Raises:
+        ValueError: If the string is not a valid reference, or if an attribute
+            without wildcards does not exist.
+    """
+    if not is_glob_reference(string):
+        return [get_referenced_value(obj, string, root=root)]
+
+    if is_absolute_reference(string):
+        obj = root
+
+    prefix, remaining_string = string.split("/", 1)
+    objs = [get_referenced_value(obj, f"{prefix}/", root=root)]
+    for attr in remaining_string.split("/"):
+        if not attr:
+            continue
+        if attr == "..":
+            objs = [get_referenced_value(elem, "#../") for elem in objs]
+            continue
+        elif not any(char in attr for char in "*?["):
+            objs = [get_referenced_value(elem, f"#./{attr}") for elem in objs]
+            continue
+
+        matched_objs = []
+        for elem in objs:
+            for name in _get_child_names(elem):
+                if fnmatchcase(str(name), attr):
+                    matched_objs.append(get_referenced_value(elem, f"#./{name}"))
+        objs = matched_objs
+    return objs
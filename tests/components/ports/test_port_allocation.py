@@ -0,0 +1,213 @@
+from dataclasses import field
+
+import pytest
+
+from quam.components.channels import IQChannel, SingleChannel
+from quam.components.ports import (
+    FEMPortsContainer,
+    LFFEMAnalogOutputPort,
+    MWFEMAnalogOutputPort,
+    OPXPlusPortsContainer,
+    WiringIndex,
+)
+from quam.components.ports.ports_containers import _allocate_ports
+from quam.core import QuamRoot, quam_dataclass
+
+
+@quam_dataclass
+class PortsQuAM(QuamRoot):
+    ports: FEMPortsContainer = field(default_factory=FEMPortsContainer)
+    xy: IQChannel = None
+    z: SingleChannel = None
+
+
+def test_fem_allocate_ports():
+    ports = FEMPortsContainer()
+    references = ports.allocate_ports(
+        {
+            "q1.z": ["analog_output"],
+            "q1.xy": ["analog_output", "analog_output"],
+            "q2.xy": ["mw_output"],
+            "rr": ["analog_output", "analog_output", "analog_input", "analog_input"],
+        },
+        fems={"con1": {1: "MW", 2: "LF"}},
+    )
+    # Requirements with most ports are allocated first
+    assert references == {
+        "q1.z": ["#/analog_outputs/con1/2/5"],
+        "q1.xy": ["#/analog_outputs/con1/2/3", "#/analog_outputs/con1/2/4"],
+        "q2.xy": ["#/mw_outputs/con1/1/1"],
+        "rr": [
+            "#/analog_outputs/con1/2/1",
+            "#/analog_outputs/con1/2/2",
+            "#/analog_inputs/con1/2/1",
+            "#/analog_inputs/con1/2/2",
+        ],
+    }
+    assert isinstance(ports.analog_outputs["con1"][2][5], LFFEMAnalogOutputPort)
+    assert isinstance(ports.mw_outputs["con1"][1][1], MWFEMAnalogOutputPort)
+
+    # Existing ports are not allocated again
+    references = ports.allocate_ports(
+        {"q2.z": ["analog_output"]}, fems={"con1": {1: "MW", 2: "LF"}}
+    )
+    assert references == {"q2.z": ["#/analog_outputs/con1/2/6"]}
+
+
+def test_fem_allocate_ports_same_fem():
+    ports = FEMPortsContainer()
+    fems = {"con1": {1: "LF", 2: "LF"}}
+    singles = {f"z{idx}": ["analog_output"] for idx in range(7)}
+    ports.allocate_ports(singles, fems=fems)
+
+    # Only one output left on FEM 1, so the IQ pair must go to FEM 2
+    references = ports.allocate_ports(
+        {"xy": ["analog_output", "analog_output"], "z": ["analog_output"]}, fems=fems
+    )
+    assert references == {
+        "xy": ["#/analog_outputs/con1/2/1", "#/analog_outputs/con1/2/2"],
+        "z": ["#/analog_outputs/con1/1/8"],
+    }
+
+
+def test_fem_allocate_ports_insufficient():
+    ports = FEMPortsContainer()
+    with pytest.raises(ValueError):
+        ports.allocate_ports({"xy": ["mw_output"]}, fems={"con1": {1: "LF"}})
+    with pytest.raises(ValueError):
+        ports.allocate_ports(
+            {"rr": ["analog_input"] * 3}, fems={"con1": {1: "LF", 2: "LF"}}
+        )
+    with pytest.raises(ValueError):
+        ports.allocate_ports({"xy": ["mw_output"]}, fems={"con1": {1: "HF"}})
+    with pytest.raises(TypeError):
+        ports.allocate_ports({"z": "analog_output"}, fems={"con1": {1: "LF"}})
+
+    # Nothing should have been created
+    assert not ports.analog_inputs
+    assert not ports.mw_outputs
+
+
+def test_fem_allocate_ports_used_ports():
+    machine = PortsQuAM()
+    machine.z = SingleChannel(opx_output=("con1", 1, 1))
+    machine.xy = IQChannel(
+        opx_output_I=("con1", 1, 2),
+        opx_output_Q=("con1", 1, 4),
+        frequency_converter_up=None,
+    )
+    wiring = WiringIndex(machine)
+
+    references = machine.ports.allocate_ports(
+        {"z2": ["analog_output"], "z3": ["analog_output"]},
+        fems={"con1": {1: "LF"}},
+        used_ports=wiring.used_ports,
+    )
+    assert references == {
+        "z2": ["#/ports/analog_outputs/con1/1/3"],
+        "z3": ["#/ports/analog_outputs/con1/1/5"],
+    }
+
+    machine.z = None
+    machine.z = SingleChannel(opx_output=references["z2"][0])
+    assert machine.z.opx_output is machine.ports.analog_outputs["con1"][1][3]
+
+
+def test_fem_allocate_ports_no_create():
+    ports = FEMPortsContainer()
+    references = ports.allocate_ports(
+        {"z": ["analog_output"]}, fems={"con1": {1: "LF"}}, create_ports=False
+    )
+    assert references == {"z": ["#/analog_outputs/con1/1/1"]}
+    assert not ports.analog_outputs
+
+
+def test_fem_allocate_ports_large():
+    ports = FEMPortsContainer()
+    requirements = {}
+    for idx in range(1000):
+        requirements[f"q{idx}.xy"] = ["mw_output"]
+        requirements[f"q{idx}.z"] = ["analog_output"]
+        requirements[f"q{idx}.drive"] = ["analog_output", "analog_output"]
+    fems = {
+        f"con{idx}": {fem: "MW" if fem % 2 else "LF" for fem in range(1, 9)}
+        for idx in range(1, 100)
+    }
+    references = ports.allocate_ports(requirements, fems=fems, create_ports=False)
+
+    all_references = [ref for refs in references.values() for ref in refs]
+    assert len(all_references) == len(set(all_references)) == 4000
+    for idx in range(1000):
+        drive_I, drive_Q = references[f"q{idx}.drive"]
+        assert drive_I.split("/")[:-1] == drive_Q.split("/")[:-1]
+
+
+def test_opx_plus_allocate_ports():
+    ports = OPXPlusPortsContainer()
+    references = ports.allocate_ports(
+        {
+            "z": ["analog_output"],
+            "rr": ["analog_output", "analog_output", "analog_input", "analog_input"],
+            "trigger": ["digital_output"],
+        },
+        controllers=["con1", "con2"],
+    )
+    assert references == {
+        "z": ["#/analog_outputs/con1/3"],
+        "rr": [
+            "#/analog_outputs/con1/1",
+            "#/analog_outputs/con1/2",
+            "#/analog_inputs/con1/1",
+            "#/analog_inputs/con1/2",
+        ],
+        "trigger": ["#/digital_outputs/con1/1"],
+    }
+    assert ports.analog_inputs["con1"][2].port_tuple == ("con1", 2)
+
+    references = ports.allocate_ports(
+        {"rr2": ["analog_input"]}, controllers=["con1", "con2"]
+    )
+    assert references == {"rr2": ["#/analog_inputs/con2/1"]}
+
+
+def test_opx_plus_allocate_ports_greedy_failure():
+    ports = OPXPlusPortsContainer()
+    # con1 has two free outputs and both inputs, con2 has free outputs but no inputs
+    used_ports = [("analog_output", ("con1", port_id)) for port_id in range(1, 9)]
+    used_ports += [("analog_input", ("con2", port_id)) for port_id in (1, 2)]
+    requirements = {
+        "xy": ["analog_output", "analog_output"],
+        "rr": ["analog_output", "analog_input"],
+    }
+
+    # Placing xy first-fit on con1 leaves no outputs for rr, which needs an input
+    references = ports.allocate_ports(
+        requirements, controllers=["con1", "con2"], used_ports=used_ports
+    )
+    assert references == {
+        "xy": ["#/analog_outputs/con2/1", "#/analog_outputs/con2/2"],
+        "rr": ["#/analog_outputs/con1/9", "#/analog_inputs/con1/1"],
+    }
+
+    with pytest.raises(ValueError):
+        ports.allocate_ports(
+            {**requirements, "z": ["analog_output"] * 9},
+            controllers=["con1", "con2"],
+            used_ports=used_ports,
+        )
+
+
+def test_allocate_ports_search_symmetric_devices():
+    # Only the preferred device has an input, and the greedy pass assigns it to xy0
+    free_ports = {("con0",): {"analog_output": [2, 1], "analog_input": [1]}}
+    for idx in range(1, 50):
+        free_ports[(f"con{idx}",)] = {"analog_output": [2, 1], "analog_input": []}
+    requirements = {f"xy{idx}": ["analog_output"] * 2 for idx in range(49)}
+    requirements["rr"] = ["analog_output", "analog_input"]
+
+    allocations = _allocate_ports(requirements, free_ports)
+    assert allocations["rr"] == [
+        ("analog_output", ("con0", 1)),
+        ("analog_input", ("con0", 1)),
+    ]
+    assert len({allocation[0][1][0] for allocation in allocations.values()}) == 50
@@ -0,0 +1,90 @@
+import numpy as np
+
+from quam.components.channels import (
+    DigitalOutputChannel,
+    IQChannel,
+    InOutSingleChannel,
+    SingleChannel,
+)
+from quam.components.ports import (
+    LFFEMAnalogOutputPort,
+    OPXPlusAnalogOutputPort,
+    get_port_flyweight,
+)
+from quam.components.ports.base_ports import _get_cached_port
+
+
+def test_port_flyweight_interned():
+    port = get_port_flyweight(OPXPlusAnalogOutputPort, ("con1", 1), offset=0.1)
+    assert isinstance(port, OPXPlusAnalogOutputPort)
+    assert port.port_tuple == ("con1", 1)
+    assert port.offset == 0.1
+
+    assert get_port_flyweight(OPXPlusAnalogOutputPort, ("con1", 1), offset=0.1) is port
+    assert get_port_flyweight(OPXPlusAnalogOutputPort, ["con1", 1], offset=0.1) is port
+    assert (
+        get_port_flyweight(OPXPlusAnalogOutputPort, ("con1", 1), offset=0.2) is not port
+    )
+    assert (
+        get_port_flyweight(OPXPlusAnalogOutputPort, ("con1", 2), offset=0.1) is not port
+    )
+
+
+def test_port_flyweight_list_properties():
+    port = get_port_flyweight(
+        LFFEMAnalogOutputPort, ("con1", 1, 2), feedforward_filter=[0.5, 0.25]
+    )
+    assert port.feedforward_filter == [0.5, 0.25]
+    assert port.get_port_properties()["feedforward_filter"] == [0.5, 0.25]
+
+    port2 = get_port_flyweight(
+        LFFEMAnalogOutputPort,
+        ("con1", 1, 2),
+        feedforward_filter=np.array([0.5, 0.25]),
+    )
+    assert port2 is port
+
+    port3 = get_port_flyweight(
+        LFFEMAnalogOutputPort, ("con1", 1, 2), crosstalk={1: 0.1}
+    )
+    assert port3.crosstalk == {1: 0.1}
+
+
+def test_channels_share_port_flyweights():
+    channel = SingleChannel(
+        id="ch1",
+        opx_output=("con1", 1, 1),
+        opx_output_offset=0.1,
+        filter_fir_taps=[0.5, 0.25],
+        digital_outputs={"m": DigitalOutputChannel(opx_output=("con1", 1, 1))},
+    )
+    channel2 = IQChannel(
+        id="ch2",
+        opx_output_I=("con1", 1, 2),
+        opx_output_Q=("con1", 1, 3),
+        frequency_converter_up=None,
+    )
+    readout = InOutSingleChannel(
+        id="res", opx_output=("con1", 1, 4), opx_input=("con1", 1, 1)
+    )
+
+    cfg = {"controllers": {}, "elements": {}}
+    for component in [channel, channel.digital_outputs["m"], channel2, readout]:
+        component.apply_to_config(cfg)
+    fem_cfg = cfg["controllers"]["con1"]["fems"][1]
+    assert fem_cfg["analog_outputs"][1]["offset"] == 0.1
+    assert fem_cfg["analog_outputs"][1]["feedforward_filter"] == [0.5, 0.25]
+    assert set(fem_cfg["analog_outputs"]) == {1, 2, 3, 4}
+    assert set(fem_cfg["analog_inputs"]) == {1}
+    assert fem_cfg["digital_outputs"][1] == {
+        "inverted": False,
+        "shareable": False,
+        "level": "LVTTL",
+    }
+    assert channel.filter_fir_taps.parent is channel
+
+    # Generating the config again doesn't instantiate new ports
+    misses = _get_cached_port.cache_info().misses
+    for component in [channel, channel.digital_outputs["m"], channel2, readout]:
+        component.apply_to_config({"controllers": {}, "elements": {}})
+    assert _get_cached_port.cache_info().misses == misses
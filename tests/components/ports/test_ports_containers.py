@@ -175,3 +175,44 @@ def test_fem_ports_container_reference_to_port(port_type):
 
     ports_group = getattr(ports_container, f"{port_type}s")
     assert port is ports_group["con1"][2][3]
+
+
+def test_parse_port_reference():
+    from quam.components.ports.ports_containers import _parse_port_reference
+
+    assert _parse_port_reference("#/ports/analog_outputs/con1/2/3", 3) == (
+        "analog_output",
+        "con1",
+        2,
+        3,
+    )
+    assert _parse_port_reference("#/analog_inputs/1/2", 2) == ("analog_input", 1, 2)
+
+
+def test_fem_ports_container_port_index():
+    from quam.components.ports.ports_containers import _get_port_index
+
+    ports_container = FEMPortsContainer()
+    port = ports_container.get_analog_output("con1", 2, 3, create=True)
+    assert _get_port_index(ports_container) == {("analog_output", "con1", 2, 3): port}
+    assert ports_container.reference_to_port("#/analog_outputs/con1/2/3") is port
+
+    # Replacing a port invalidates the index
+    new_port = LFFEMAnalogOutputPort("con1", 2, 3, offset=0.1)
+    ports_container.analog_outputs["con1"][2][3] = new_port
+    assert _get_port_index(ports_container) == {}
+    assert ports_container.reference_to_port("#/analog_outputs/con1/2/3") is new_port
+
+    # Removing a port invalidates the index
+    del ports_container.analog_outputs["con1"][2][3]
+    with pytest.raises(KeyError):
+        ports_container.reference_to_port("#/analog_outputs/con1/2/3")
+
+
+def test_opx_plus_ports_container_port_index():
+    from quam.components.ports.ports_containers import _get_port_index
+
+    ports_container = OPXPlusPortsContainer()
+    port = ports_container.reference_to_port("#/digital_outputs/con1/3", create=True)
+    assert _get_port_index(ports_container) == {("digital_output", "con1", 3): port}
+    assert ports_container.get_digital_output("con1", 3) is port
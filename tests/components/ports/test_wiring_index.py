@@ -0,0 +1,169 @@
+from dataclasses import field
+from typing import Dict
+
+from quam.components.channels import (
+    Channel,
+    DigitalOutputChannel,
+    IQChannel,
+    InOutSingleChannel,
+    SingleChannel,
+)
+from quam.components.ports import FEMPortsContainer, WiringIndex
+from quam.core import QuamRoot, quam_dataclass
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+
+
+@quam_dataclass
+class WiredQuAM(QuamRoot):
+    ports: FEMPortsContainer = field(default_factory=FEMPortsContainer)
+    channels: Dict[str, Channel] = field(default_factory=dict)
+
+
+def create_quam():
+    machine = WiredQuAM()
+    machine.ports.get_analog_output("con1", 1, 1, create=True)
+    machine.ports.get_analog_output("con1", 1, 2, create=True)
+    machine.ports.get_analog_output("con1", 1, 8, create=True)
+    machine.ports.get_digital_output("con1", 1, 1, create=True, shareable=True)
+
+    machine.channels["xy"] = IQChannel(
+        opx_output_I="#/ports/analog_outputs/con1/1/1",
+        opx_output_Q="#/ports/analog_outputs/con1/1/2",
+        frequency_converter_up=None,
+        digital_outputs={
+            "m": DigitalOutputChannel(opx_output="#/ports/digital_outputs/con1/1/1")
+        },
+    )
+    machine.channels["z"] = SingleChannel(
+        opx_output=("con1", 1, 3),
+        digital_outputs={
+            "m": DigitalOutputChannel(opx_output="#/ports/digital_outputs/con1/1/1")
+        },
+    )
+    machine.channels["res"] = InOutSingleChannel(
+        opx_output=("con1", 2, 1), opx_input=("con1", 2, 1)
+    )
+    return machine
+
+
+def test_wiring_index_users():
+    machine = create_quam()
+    wiring = WiringIndex(machine)
+
+    xy = machine.channels["xy"]
+    port = machine.ports.analog_outputs["con1"][1][1]
+    assert wiring.get_users(port) == [(xy, "opx_output_I")]
+    assert wiring.get_users(("con1", 1, 1), port_type="analog_output") == [
+        (xy, "opx_output_I")
+    ]
+    assert wiring.get_users(("con1", 1, 3), port_type="analog_output") == [
+        (machine.channels["z"], "opx_output")
+    ]
+    assert wiring.get_users(("con1", 2, 1), port_type="analog_input") == [
+        (machine.channels["res"], "opx_input")
+    ]
+    assert len(wiring.get_users(("con1", 1, 1), port_type="digital_output")) == 2
+    assert wiring.get_users(("con1", 1, 4), port_type="analog_output") == []
+
+
+def test_wiring_index_conflicts():
+    machine = create_quam()
+    wiring = WiringIndex(machine)
+    # The digital output is shared by two channels with the same port settings
+    assert wiring.conflicts == {}
+
+    # Sharing the same port object is never a conflict
+    machine.channels["z2"] = z2 = SingleChannel(
+        opx_output="#/ports/analog_outputs/con1/1/2"
+    )
+    wiring.add_component(z2)
+    assert wiring.conflicts == {}
+
+    z2.opx_output = None
+    z2.opx_output = ("con1", 1, 2)
+    z2.opx_output_offset = 0.1
+    machine.ports.analog_outputs["con1"][1][2].offset = 0.0
+    wiring.add_component(z2)
+    assert list(wiring.conflicts) == [("analog_output", ("con1", 1, 2))]
+    assert wiring.conflicts[("analog_output", ("con1", 1, 2))] == [
+        (machine.channels["xy"], "opx_output_Q"),
+        (z2, "opx_output"),
+    ]
+
+    # Port settings are determined when the conflicts are requested
+    z2.opx_output_offset = 0.0
+    assert wiring.conflicts == {}
+
+    z2.opx_output_offset = 0.1
+    z2.opx_output = None
+    z2.opx_output = ("con1", 1, 4)
+    wiring.add_component(z2)
+    assert wiring.conflicts == {}
+
+    wiring.remove_component(z2)
+    assert wiring.get_users(("con1", 1, 4), port_type="analog_output") == []
+
+
+def test_wiring_index_conflicts_digital_output():
+    machine = create_quam()
+    machine.channels["z"].digital_outputs["m"].opx_output = None
+    machine.channels["z"].digital_outputs["m"].opx_output = ("con1", 1, 1)
+    machine.channels["z"].digital_outputs["m"].shareable = True
+    wiring = WiringIndex(machine)
+    assert wiring.conflicts == {}
+
+    machine.channels["z"].digital_outputs["m"].inverted = True
+    assert list(wiring.conflicts) == [("digital_output", ("con1", 1, 1))]
+
+
+def test_wiring_index_conflicts_multiplexed_readout():
+    machine = create_quam_superconducting_referenced(num_qubits=3)
+    wiring = WiringIndex(machine)
+
+    resonators = [qubit.resonator for qubit in machine.qubits.values()]
+    for port_type, attr in [
+        ("analog_output", "opx_output_I"),
+        ("analog_input", "opx_input_Q"),
+    ]:
+        port = getattr(resonators[0], attr)
+        users = wiring.get_users(port, port_type=port_type)
+        assert users == [(resonator, attr) for resonator in resonators]
+    assert wiring.conflicts == {}
+
+    resonators[1].opx_input_offset_I = 0.01
+    assert wiring.conflicts == {}
+    resonators[2].opx_input_offset_I = 0.02
+    assert list(wiring.conflicts) == [("analog_input", ("con1", 1))]
+
+
+def test_wiring_index_unused_ports_and_occupancy():
+    machine = create_quam()
+    wiring = WiringIndex(machine)
+
+    assert wiring.unused_ports == [machine.ports.analog_outputs["con1"][1][8]]
+    assert wiring.get_occupancy() == {
+        ("con1", 1): {"analog_output": [1, 2, 3], "digital_output": [1]},
+        ("con1", 2): {"analog_output": [1], "analog_input": [1]},
+    }
+    assert wiring.get_free_ports(("con1", 1), "analog_output", range(1, 9)) == [
+        4,
+        5,
+        6,
+        7,
+        8,
+    ]
+
+
+def test_wiring_index_large():
+    machine = WiredQuAM()
+    for idx in range(1200):
+        fem, port = divmod(idx, 8)
+        machine.channels[f"ch{idx}"] = SingleChannel(
+            opx_output=("con1", fem + 1, port + 1)
+        )
+    wiring = WiringIndex(machine)
+    assert len(wiring.used_ports) == 1200
+    assert wiring.conflicts == {}
+    assert len(wiring.get_occupancy()) == 150
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from qualang_tools.config.waveform_tools import drag_gaussian_pulse_waveforms
+
+from quam.components import pulses
+
+
+def gaussian_reference(amplitude, length, sigma, axis_angle=None, subtracted=True):
+    t = np.arange(length)
+    waveform = amplitude * np.exp(-((t - (length - 1) / 2) ** 2) / (2 * sigma**2))
+    if subtracted:
+        waveform = waveform - waveform[-1]
+    if axis_angle is not None:
+        waveform = waveform * np.exp(1j * axis_angle)
+    return waveform
+
+
+def test_gaussian_batch_equals_single():
+    pulse_list = [
+        pulses.GaussianPulse(
+            length=24,
+            amplitude=0.05 * idx,
+            sigma=3 + idx,
+            axis_angle=None if idx % 2 else idx * 0.3,
+            subtracted=idx % 3 != 0,
+        )
+        for idx in range(8)
+    ]
+    waveforms = pulses.GaussianPulse.calculate_waveforms_batch(pulse_list)
+
+    for pulse, waveform in zip(pulse_list, waveforms):
+        expected = gaussian_reference(
+            pulse.amplitude, 24, pulse.sigma, pulse.axis_angle, pulse.subtracted
+        )
+        assert np.array_equal(waveform, expected)
+        assert np.iscomplexobj(waveform) == (pulse.axis_angle is not None)
+        assert np.array_equal(waveform, pulse.calculate_waveform())
+
+
+def test_gaussian_batch_returns_views():
+    pulse_list = [
+        pulses.GaussianPulse(length=20, amplitude=0.1 * idx, sigma=4)
+        for idx in range(3)
+    ]
+    waveforms = pulses.GaussianPulse.calculate_waveforms_batch(pulse_list)
+    assert waveforms[0].base is not None
+    assert waveforms[0].base is waveforms[1].base
+
+
+def test_drag_batch_equals_single():
+    pulse_list = [
+        pulses.DragPulse(
+            length=40,
+            amplitude=0.1 + 0.02 * idx,
+            sigma=6 + idx,
+            alpha=0.5 * (idx % 3),
+            anharmonicity=-200e6,
+            detuning=1e6 * (idx % 2),
+            axis_angle=idx * np.pi / 4,
+            subtracted=bool(idx % 2),
+        )
+        for idx in range(6)
+    ]
+    waveforms = pulses.DragPulse.calculate_waveforms_batch(pulse_list)
+
+    for pulse, waveform in zip(pulse_list, waveforms):
+        assert np.array_equal(waveform, pulse.calculate_waveform())
+
+        I, Q = drag_gaussian_pulse_waveforms(
+            pulse.amplitude,
+            pulse.length,
+            pulse.sigma,
+            pulse.alpha,
+            pulse.anharmonicity,
+            pulse.detuning,
+            pulse.subtracted,
+        )
+        expected = (np.array(I) + 1j * np.array(Q)) * np.exp(1j * pulse.axis_angle)
+        assert np.allclose(waveform, expected, rtol=0, atol=1e-12)
+
+
+def test_drag_batch_invalid_pulse():
+    pulse_list = [
+        pulses.DragPulse(
+            length=40,
+            amplitude=0.1,
+            sigma=6,
+            alpha=alpha,
+            anharmonicity=0,
+            axis_angle=0,
+        )
+        for alpha in [0, 1]
+    ]
+    with pytest.raises(ValueError):
+        pulses.DragPulse.calculate_waveforms_batch(pulse_list)
+
+
+def test_calculate_waveforms_groups_by_class_and_length(mocker):
+    pulse_list = [
+        pulses.GaussianPulse(length=length, amplitude=0.01 * idx, sigma=4)
+        for idx in range(10)
+        for length in [20, 40]
+    ]
+    pulse_list.append(pulses.SquarePulse(length=20, amplitude=0.1))
+
+    expected_waveforms = [pulse.calculate_waveform() for pulse in pulse_list]
+
+    spy = mocker.spy(pulses.GaussianPulse, "calculate_waveforms_batch")
+    waveforms = pulses.calculate_waveforms(pulse_list)
+
+    assert spy.call_count == 2
+    assert sorted(len(call.args[0]) for call in spy.call_args_list) == [10, 10]
+    for waveform, expected_waveform in zip(waveforms, expected_waveforms):
+        assert np.array_equal(waveform, expected_waveform)
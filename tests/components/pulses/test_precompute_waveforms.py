@@ -0,0 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import IQChannel, SingleChannel
+from quam.components.hardware import FrequencyConverter, LocalOscillator, Mixer
+from quam.core import quam_dataclass
+
+
+@quam_dataclass
+class CountingPulse(pulses.GaussianPulse):
+    num_calls: int = 0
+
+    def waveform_function(self):
+        self.num_calls += 1
+        return super().waveform_function()
+
+
+def create_quam(num_channels=5):
+    machine = BasicQuAM()
+    for idx in range(num_channels):
+        channel = IQChannel(
+            opx_output_I=("con1", 2 * idx + 1),
+            opx_output_Q=("con1", 2 * idx + 2),
+            frequency_converter_up=FrequencyConverter(
+                mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+            ),
+        )
+        machine.channels[f"ch{idx}"] = channel
+        channel.operations["X180"] = pulses.DragPulse(
+            length=40,
+            amplitude=0.1 * idx,
+            sigma=7,
+            alpha=0.5,
+            anharmonicity=-200e6,
+            axis_angle=0,
+        )
+        channel.operations["gauss"] = CountingPulse(
+            length=20, amplitude=0.2, sigma=4, axis_angle=np.pi / 2
+        )
+    machine.channels["flux"] = SingleChannel(opx_output=("con2", 1))
+    machine.channels["flux"].operations["square"] = pulses.SquarePulse(
+        length=100, amplitude=0.1
+    )
+    return machine
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_generate_config_workers_identical(workers):
+    machine = create_quam()
+
+    cfg_sequential = machine.generate_config()
+    cfg_parallel = machine.generate_config(workers=workers)
+
+    assert cfg_parallel == cfg_sequential
+    assert list(cfg_parallel["waveforms"]) == list(cfg_sequential["waveforms"])
+    assert pulses._precomputed_waveforms.get() is None
+
+
+def test_generate_config_workers_calculates_waveform_once():
+    machine = create_quam(num_channels=2)
+
+    machine.generate_config(workers=2)
+
+    for channel_name in ["ch0", "ch1"]:
+        assert machine.channels[channel_name].operations["gauss"].num_calls == 1
+
+
+def test_calculate_waveforms_order():
+    pulse_list = [
+        pulses.GaussianPulse(length=20, amplitude=0.1 * idx, sigma=4)
+        for idx in range(10)
+    ]
+    waveforms = pulses.calculate_waveforms(pulse_list, workers=3)
+
+    for pulse, waveform in zip(pulse_list, waveforms):
+        assert np.array_equal(waveform, pulse.calculate_waveform())
+
+
+def test_precompute_waveforms_reset_after_error():
+    channel = SingleChannel(id="ch", opx_output=("con1", 1))
+    channel.operations["pulse"] = pulses.SquarePulse(length=100, amplitude=0.1)
+
+    with pytest.raises(RuntimeError):
+        with pulses.precompute_waveforms([channel.operations["pulse"]]):
+            assert pulses._precomputed_waveforms.get() is not None
+            raise RuntimeError
+
+    assert pulses._precomputed_waveforms.get() is None
+
+
+def test_precompute_waveforms_nested():
+    channel = SingleChannel(id="ch", opx_output=("con1", 1))
+    channel.operations["outer"] = outer_pulse = CountingPulse(
+        length=20, amplitude=0.2, sigma=4
+    )
+    channel.operations["inner"] = inner_pulse = CountingPulse(
+        length=20, amplitude=0.1, sigma=4
+    )
+
+    with pulses.precompute_waveforms([outer_pulse]):
+        outer_waveforms = pulses._precomputed_waveforms.get()
+        with pulses.precompute_waveforms([inner_pulse]):
+            assert set(pulses._precomputed_waveforms.get()) == {
+                id(outer_pulse),
+                id(inner_pulse),
+            }
+        assert pulses._precomputed_waveforms.get() is outer_waveforms
+
+        config = {"pulses": {}, "waveforms": {}}
+        for pulse in [outer_pulse, inner_pulse]:
+            pulse._config_add_pulse(config)
+            pulse._config_add_waveforms(config)
+    assert pulses._precomputed_waveforms.get() is None
+
+    assert outer_pulse.num_calls == 1
+    assert inner_pulse.num_calls == 2
+
+
+def test_precompute_waveforms_keyed_on_pulse():
+    channel = SingleChannel(id="ch", opx_output=("con1", 1))
+    channel.operations["pulse"] = pulse = pulses.SquarePulse(length=100, amplitude=0.1)
+    other_pulse = pulses.SquarePulse(length=100, amplitude=0.2)
+    channel.operations["other"] = other_pulse
+
+    with pulses.precompute_waveforms([pulse]):
+        # Simulate a different pulse whose id matches a precomputed waveform
+        precomputed_waveforms = pulses._precomputed_waveforms.get()
+        precomputed_waveforms[id(other_pulse)] = precomputed_waveforms[id(pulse)]
+
+        config = {"pulses": {}, "waveforms": {}}
+        other_pulse._config_add_pulse(config)
+        other_pulse._config_add_waveforms(config)
+    assert config["waveforms"][other_pulse.waveform_name]["sample"] == 0.2
+
+
+def test_precompute_waveforms_thread_local():
+    channel = SingleChannel(id="ch", opx_output=("con1", 1))
+    channel.operations["pulse"] = pulse = pulses.SquarePulse(length=100, amplitude=0.1)
+
+    with pulses.precompute_waveforms([pulse]):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(pulses._precomputed_waveforms.get)
+            assert future.result() is None
+        assert id(pulse) in pulses._precomputed_waveforms.get()
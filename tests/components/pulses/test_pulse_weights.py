@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from quam.components import pulses
 
 
@@ -120,3 +121,144 @@ def test_constant_readout_pulse_integration_weights_custom_compressed_phase():
         "minus_imag": [(np.sin(np.pi / 2) * -0.4, 40), (np.sin(np.pi / 2) * -0.6, 60)],
     }
     compare_integration_weights(expected_weights, weights)
+
+
+def test_convert_integration_weights_matches_qualang():
+    from qualang_tools.config import convert_integration_weights
+
+    rng = np.random.default_rng(42)
+    for integration_weights in [
+        [0.4] * 10 + [0.6] * 15,
+        [0.1],
+        rng.normal(size=300).tolist(),
+        np.round(rng.normal(size=150), 1).tolist(),
+    ]:
+        expected = convert_integration_weights(integration_weights)
+        segments = pulses.convert_integration_weights(integration_weights)
+        assert isinstance(segments, np.ndarray)
+        assert np.array_equal(segments, np.array(expected, dtype=float))
+
+
+def test_integration_weights_cached():
+    pulse1 = pulses.SquareReadoutPulse(
+        length=100, amplitude=1, integration_weights=[(0.4, 40), (0.6, 60)]
+    )
+    pulse2 = pulses.SquareReadoutPulse(
+        length=100, amplitude=0.5, integration_weights=[(0.4, 40), (0.6, 60)]
+    )
+
+    weights1 = pulse1.integration_weights_function()
+    weights2 = pulse2.integration_weights_function()
+    assert weights1["real"] is weights2["real"]
+    assert not weights1["real"].flags.writeable
+
+    # Only the arrays are shared, not the dict
+    assert weights1 is not weights2
+    weights1["real"] = np.array([[1.0, 100]])
+    expected = [(0.4, 40), (0.6, 60)]
+    assert np.allclose(pulse2.integration_weights_function()["real"], expected)
+    assert np.allclose(pulse1.integration_weights_function()["real"], expected)
+
+    pulse2.integration_weights_angle = np.pi / 2
+    weights2 = pulse2.integration_weights_function()
+    assert weights1["real"] is not weights2["real"]
+    assert np.allclose(weights2["imag"], [(0.4, 40), (0.6, 60)])
+
+    pulse1.integration_weights[0] = (0.5, 40)
+    weights1 = pulse1.integration_weights_function()
+    assert np.allclose(weights1["real"], [(0.5, 40), (0.6, 60)])
+
+
+def test_integration_weights_integer_samples():
+    pulse = pulses.SquareReadoutPulse(
+        length=40, amplitude=1, integration_weights=[1] * 5 + [0] * 5
+    )
+    weights = pulse.integration_weights_function()
+    compare_integration_weights({"real": [(1, 20), (0, 20)]}, weights)
+
+
+def test_compress_integration_weights_error_bound():
+    rng = np.random.default_rng(1)
+    integration_weights = np.sin(np.arange(500) / 50) + rng.normal(scale=1e-3, size=500)
+
+    previous_num_segments = len(integration_weights) + 1
+    for tolerance in [0, 0.01, 0.05, 0.2]:
+        segments, max_error = pulses.compress_integration_weights(
+            integration_weights, tolerance=tolerance
+        )
+        assert max_error <= tolerance + 2**-16
+        assert segments[:, 1].sum() == 4 * len(integration_weights)
+        assert len(segments) < previous_num_segments
+        previous_num_segments = len(segments)
+
+        sample_weights = np.repeat(segments[:, 0], (segments[:, 1] // 4).astype(int))
+        assert np.isclose(
+            np.max(np.abs(sample_weights - integration_weights)), max_error
+        )
+
+
+def test_compress_integration_weights_granularity():
+    integration_weights = np.linspace(0, 1, 101)
+    segments, _ = pulses.compress_integration_weights(
+        integration_weights, tolerance=0.05, granularity=16
+    )
+    assert np.all(segments[:-1, 1] % 16 == 0)
+    assert segments[-1, 1] % 16 == 4
+    assert segments[:, 1].sum() == 404
+
+
+def test_compress_integration_weights_constant():
+    segments, max_error = pulses.compress_integration_weights(
+        [0.4] * 10 + [0.6] * 15, tolerance=0
+    )
+    assert np.allclose(segments, [(0.4, 40), (0.6, 60)], atol=1e-4)
+    assert max_error < 2**-15
+
+
+def test_compress_integration_weights_invalid():
+    with pytest.raises(ValueError):
+        pulses.compress_integration_weights([0.1, 0.2], tolerance=-1)
+    with pytest.raises(ValueError):
+        pulses.compress_integration_weights([0.1, 0.2], tolerance=0.1, granularity=6)
+
+
+def test_readout_pulse_integration_weights_tolerance():
+    integration_weights = np.linspace(0, 1, 250).tolist()
+    pulse = pulses.SquareReadoutPulse(
+        length=1000, amplitude=1, integration_weights=integration_weights
+    )
+    assert len(pulse.integration_weights_function()["real"]) == 100
+
+    pulse.integration_weights_tolerance = 0.05
+    weights = pulse.integration_weights_function()
+    expected_segments, _ = pulses.compress_integration_weights(
+        integration_weights, tolerance=0.05
+    )
+    assert np.array_equal(weights["real"], expected_segments)
+    assert len(weights["real"]) == 10
+
+
+def test_readout_pulse_integration_weights_compression():
+    integration_weights = np.sin(np.linspace(0, np.pi, 250)).tolist()
+    pulse = pulses.SquareReadoutPulse(
+        length=1000, amplitude=1, integration_weights=integration_weights
+    )
+    num_segments, error = pulse.get_integration_weights_compression()
+    assert num_segments == len(pulse.integration_weights_function()["real"]) == 100
+    assert 0 < error < 0.05
+
+    pulse.integration_weights_tolerance = 0.01
+    num_segments, error = pulse.get_integration_weights_compression()
+    expected_segments, expected_error = pulses.compress_integration_weights(
+        integration_weights, tolerance=0.01
+    )
+    assert num_segments == len(expected_segments)
+    assert num_segments == len(pulse.integration_weights_function()["real"])
+    assert error == expected_error
+    assert error <= 0.01 + 2**-16
+
+    pulse.integration_weights = [(0.5, 400), (0.2, 600)]
+    assert pulse.get_integration_weights_compression() == (2, 0.0)
+
+    pulse.integration_weights = None
+    assert pulse.get_integration_weights_compression() == (1, 0.0)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import IQChannel, SingleChannel
+from quam.components.hardware import FrequencyConverter, LocalOscillator, Mixer
+
+
+def test_flattop_segments_concatenate_to_waveform():
+    pulse = pulses.FlatTopGaussianPulse(
+        length=20040, flat_length=20000, amplitude=0.1, axis_angle=0.3, segmented=True
+    )
+    segments = pulse.waveform_segments()
+
+    assert list(segments) == pulse.segment_labels == ["rise", "flat", "fall"]
+    assert [length for length, _ in segments.values()] == [20, 20000, 20]
+
+    rise, flat, fall = (waveform for _, waveform in segments.values())
+    assert np.isscalar(flat)
+    waveform = np.concatenate([rise, np.full(20000, flat), fall])
+    assert np.allclose(waveform, pulse.calculate_waveform(), atol=1e-14)
+
+
+def test_flattop_not_segmented():
+    pulse = pulses.FlatTopGaussianPulse(length=40, flat_length=20, amplitude=0.1)
+    assert pulse.segment_labels is None
+    assert pulse.waveform_segments() is None
+
+
+def test_flattop_segmented_config_single_channel():
+    machine = BasicQuAM()
+    channel = machine.channels["flux"] = SingleChannel(opx_output=("con1", 1))
+    channel.operations["flattop"] = pulses.FlatTopGaussianPulse(
+        length=10032,
+        flat_length=10000,
+        amplitude=0.2,
+        segmented=True,
+        digital_marker="ON",
+    )
+
+    cfg = machine.generate_config()
+
+    assert cfg["elements"]["flux"]["operations"] == {
+        "flattop.rise": "flux.flattop.rise.pulse",
+        "flattop.flat": "flux.flattop.flat.pulse",
+        "flattop.fall": "flux.flattop.fall.pulse",
+    }
+    assert "flux.flattop.pulse" not in cfg["pulses"]
+    assert cfg["pulses"]["flux.flattop.flat.pulse"] == {
+        "operation": "control",
+        "length": 10000,
+        "waveforms": {"single": "flux.flattop.flat.wf"},
+        "digital_marker": "ON",
+    }
+    assert cfg["waveforms"]["flux.flattop.flat.wf"] == {
+        "type": "constant",
+        "sample": 0.2,
+    }
+    assert cfg["pulses"]["flux.flattop.rise.pulse"]["length"] == 16
+    rise_samples = cfg["waveforms"]["flux.flattop.rise.wf"]["samples"]
+    fall_samples = cfg["waveforms"]["flux.flattop.fall.wf"]["samples"]
+    assert len(rise_samples) == 16
+    assert fall_samples == rise_samples[::-1]
+
+
+def test_flattop_segmented_config_IQ_channel():
+    machine = BasicQuAM()
+    channel = machine.channels["xy"] = IQChannel(
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+        ),
+    )
+    channel.operations["flattop"] = pulses.FlatTopGaussianPulse(
+        length=56, flat_length=24, amplitude=0.2, axis_angle=np.pi / 2, segmented=True
+    )
+
+    cfg = machine.generate_config()
+
+    assert cfg["pulses"]["xy.flattop.flat.pulse"]["waveforms"] == {
+        "I": "xy.flattop.flat.wf.I",
+        "Q": "xy.flattop.flat.wf.Q",
+    }
+    assert cfg["waveforms"]["xy.flattop.flat.wf.Q"] == {
+        "type": "constant",
+        "sample": pytest.approx(0.2),
+    }
+    assert len(cfg["waveforms"]["xy.flattop.rise.wf.Q"]["samples"]) == 16
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from qualang_tools.config.waveform_tools import (
+    drag_gaussian_pulse_waveforms,
+    flattop_gaussian_waveform as qualang_flattop_gaussian_waveform,
+)
+
+from quam.components import pulses
+
+
+@pytest.mark.parametrize(
+    "length, sigma, alpha, anharmonicity, detuning, subtracted",
+    [
+        (16, 4, 0.5, -200e6, 0.0, True),
+        (40, 8, 0.5, -200e6, 5e6, False),
+        (101, 10, 0.0, 0.0, 0.0, True),
+        (20000, 3000, 1.2, -150e6, 1e6, True),
+    ],
+)
+def test_drag_gaussian_waveform(
+    length, sigma, alpha, anharmonicity, detuning, subtracted
+):
+    I, Q = drag_gaussian_pulse_waveforms(
+        0.3, length, sigma, alpha, anharmonicity, detuning, subtracted
+    )
+    waveform = pulses.drag_gaussian_waveform(
+        0.3, length, sigma, alpha, anharmonicity, detuning, subtracted
+    )
+    assert np.allclose(waveform.real, I, rtol=0, atol=1e-12)
+    assert np.allclose(waveform.imag, Q, rtol=0, atol=1e-12)
+
+
+def test_drag_gaussian_waveform_errors():
+    with pytest.raises(ValueError):
+        pulses.drag_gaussian_waveform(0.3, 20, 4, alpha=1, anharmonicity=0)
+    with pytest.raises(ValueError):
+        pulses.drag_gaussian_waveform(
+            0.3, 20, 4, alpha=1, anharmonicity=10e6, detuning=10e6
+        )
+
+
+def test_drag_pulse_axis_angle():
+    drag_pulse = pulses.DragPulse(
+        amplitude=0.2, sigma=4, alpha=2, anharmonicity=-200e6, length=20, axis_angle=0
+    )
+    I, Q = drag_gaussian_pulse_waveforms(0.2, 20, 4, 2, -200e6)
+    waveform = drag_pulse.calculate_waveform()
+    assert np.allclose(waveform, np.array(I) + 1j * np.array(Q), atol=1e-12)
+
+    drag_pulse.axis_angle = np.pi / 2
+    waveform_Y = drag_pulse.calculate_waveform()
+    assert np.allclose(waveform_Y, 1j * waveform, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "flat_length, rise_fall_length", [(0, 8), (10, 8), (100, 7), (5, 0), (99000, 500)]
+)
+def test_flattop_gaussian_waveform(flat_length, rise_fall_length):
+    expected = qualang_flattop_gaussian_waveform(0.2, flat_length, rise_fall_length)
+    waveform = pulses.flattop_gaussian_waveform(0.2, flat_length, rise_fall_length)
+    assert len(waveform) == flat_length + 2 * rise_fall_length
+    assert np.allclose(waveform, expected, rtol=0, atol=1e-12)
+
+
+def test_flattop_gaussian_pulse():
+    pulse = pulses.FlatTopGaussianPulse(
+        length=36, flat_length=20, amplitude=0.1, axis_angle=np.pi
+    )
+    expected = qualang_flattop_gaussian_waveform(0.1, 20, 8)
+    assert np.allclose(pulse.calculate_waveform(), -np.array(expected), atol=1e-12)
+
+    pulse.flat_length = 21
+    with pytest.raises(ValueError):
+        pulse.calculate_waveform()
@@ -0,0 +1,191 @@
+from dataclasses import field
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from quam.components import (
+    FrequencyConverter,
+    IQChannel,
+    LocalOscillator,
+    Mixer,
+    Octave,
+    get_frequency_plan,
+)
+from quam.components.channels import InOutIQChannel
+from quam.core import QuamRoot, quam_dataclass
+
+
+@quam_dataclass
+class PlanQuAM(QuamRoot):
+    channels: Dict[str, IQChannel] = field(default_factory=dict)
+    local_oscillators: Dict[str, LocalOscillator] = field(default_factory=dict)
+    octave: Octave = None
+
+
+def create_quam():
+    machine = PlanQuAM()
+    machine.local_oscillators["lo1"] = LocalOscillator(frequency=6e9)
+
+    for idx, RF_frequency in enumerate([5.9e9, 6.1e9, 6.2e9]):
+        # Channels sharing a local oscillator, with a fixed RF frequency
+        machine.channels[f"q{idx}"] = IQChannel(
+            opx_output_I=("con1", 2 * idx + 1),
+            opx_output_Q=("con1", 2 * idx + 2),
+            frequency_converter_up=FrequencyConverter(
+                mixer=Mixer(), local_oscillator="#/local_oscillators/lo1"
+            ),
+            intermediate_frequency="#./inferred_intermediate_frequency",
+            RF_frequency=RF_frequency,
+        )
+
+    # Channel with its own local oscillator, whose RF frequency is inferred
+    machine.channels["rr"] = InOutIQChannel(
+        opx_output_I=("con1", 7),
+        opx_output_Q=("con1", 8),
+        opx_input_I=("con1", 1),
+        opx_input_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=7e9)
+        ),
+        intermediate_frequency=50e6,
+    )
+    return machine
+
+
+def test_get_frequency_plan():
+    machine = create_quam()
+    plan = get_frequency_plan(machine)
+
+    assert [channel.name for channel in plan.channels] == ["q0", "q1", "q2", "rr"]
+    assert np.allclose(plan.RF_frequencies, [5.9e9, 6.1e9, 6.2e9, 7.05e9])
+    assert np.allclose(plan.LO_frequencies, [6e9, 6e9, 6e9, 7e9])
+    assert np.allclose(plan.intermediate_frequencies, [-100e6, 100e6, 200e6, 50e6])
+    assert list(plan.LO_groups) == [0, 0, 0, 1]
+    assert plan.LO_sources[0] == (machine.local_oscillators["lo1"], "frequency")
+    assert plan.LO_sources[1][1] == "frequency"
+    # The IF of the qubits is inferred from their RF and LO frequencies
+    assert plan.IF_sources[:3] == [None, None, None]
+    assert plan.IF_sources[3] == (machine.channels["rr"], "intermediate_frequency")
+
+
+def test_solve_frequency_plan_both_sidebands():
+    machine = create_quam()
+    plan = get_frequency_plan(machine).solve(max_intermediate_frequency=400e6)
+
+    # The LO is centred between the RF frequencies of each group
+    assert np.allclose(plan.LO_frequencies, [6.05e9, 6.05e9, 6.05e9, 7.05e9])
+    assert np.allclose(plan.intermediate_frequencies, [-150e6, 50e6, 150e6, 0])
+
+    # The LO should not be within 20 MHz of any RF frequency
+    plan = get_frequency_plan(machine).solve(
+        max_intermediate_frequency=400e6, min_intermediate_frequency=20e6
+    )
+    assert np.all(np.abs(plan.intermediate_frequencies) >= 20e6 - 1e-3)
+    assert np.all(np.abs(plan.intermediate_frequencies) <= 400e6 + 1e-3)
+    assert np.isclose(plan.LO_frequencies[0], 6.05e9)
+    assert np.isclose(abs(plan.intermediate_frequencies[3]), 20e6)
+
+
+def test_solve_frequency_plan_single_sideband():
+    machine = create_quam()
+
+    plan = get_frequency_plan(machine).solve(
+        max_intermediate_frequency=400e6,
+        min_intermediate_frequency=50e6,
+        sideband="upper",
+    )
+    assert np.all(plan.intermediate_frequencies[:3] >= 50e6 - 1e-3)
+    assert np.isclose(plan.LO_frequencies[0], (6.2e9 - 400e6 + 5.9e9 - 50e6) / 2)
+
+    plan = get_frequency_plan(machine).solve(
+        max_intermediate_frequency=400e6,
+        sideband="lower",
+        LO_resolution=1e6,
+    )
+    assert np.all(plan.intermediate_frequencies <= 0)
+    assert np.allclose(plan.LO_frequencies % 1e6, 0)
+
+
+def test_solve_frequency_plan_infeasible():
+    machine = create_quam()
+    with pytest.raises(ValueError, match=r"\['q0', 'q1', 'q2'\]"):
+        get_frequency_plan(machine).solve(max_intermediate_frequency=100e6)
+    with pytest.raises(ValueError):
+        get_frequency_plan(machine).solve(LO_range=(2e9, 5e9))
+
+
+def test_apply_frequency_plan():
+    machine = create_quam()
+    plan = get_frequency_plan(machine).solve(max_intermediate_frequency=400e6)
+    plan.apply()
+
+    assert machine.local_oscillators["lo1"].frequency == 6.05e9
+    for channel, RF_frequency in zip(plan.channels, plan.RF_frequencies):
+        assert np.isclose(channel.RF_frequency, RF_frequency)
+        assert np.isclose(
+            channel.intermediate_frequency, RF_frequency - channel.LO_frequency
+        )
+
+    rr = machine.channels["rr"]
+    assert rr.frequency_converter_up.local_oscillator.frequency == 7.05e9
+    assert rr.intermediate_frequency == 0
+    assert rr.RF_frequency == 7.05e9
+
+    # References are kept
+    q0 = machine.channels["q0"]
+    assert q0.frequency_converter_up.get_unreferenced_value("local_oscillator") == (
+        "#/local_oscillators/lo1"
+    )
+    assert q0.get_unreferenced_value("intermediate_frequency") == (
+        "#./inferred_intermediate_frequency"
+    )
+
+
+def test_frequency_plan_octave():
+    machine = PlanQuAM()
+    machine.octave = Octave(name="octave1", ip="127.0.0.1", port=80)
+    machine.octave.initialize_frequency_converters()
+    machine.octave.RF_outputs[1].LO_frequency = 5e9
+
+    for idx, intermediate_frequency in enumerate([10e6, 300e6]):
+        machine.channels[f"q{idx}"] = IQChannel(
+            opx_output_I=("con1", 2 * idx + 1),
+            opx_output_Q=("con1", 2 * idx + 2),
+            frequency_converter_up="#/octave/RF_outputs/1",
+            intermediate_frequency=intermediate_frequency,
+        )
+
+    plan = get_frequency_plan(machine)
+    assert plan.LO_sources == [(machine.octave.RF_outputs[1], "LO_frequency")]
+    assert list(plan.LO_groups) == [0, 0]
+
+    plan.solve(max_intermediate_frequency=400e6).apply()
+    assert machine.octave.RF_outputs[1].LO_frequency == 5.155e9
+    assert machine.channels["q0"].intermediate_frequency == -145e6
+    assert machine.channels["q1"].intermediate_frequency == 145e6
+    assert machine.channels["q0"].RF_frequency == 5.01e9
+
+
+def test_frequency_plan_large():
+    machine = PlanQuAM()
+    rng = np.random.default_rng(42)
+    for idx in range(100):
+        machine.local_oscillators[f"lo{idx}"] = LocalOscillator(frequency=6e9)
+        for sub_idx in range(4):
+            machine.channels[f"q{idx}_{sub_idx}"] = IQChannel(
+                opx_output_I=("con1", 1),
+                opx_output_Q=("con1", 2),
+                frequency_converter_up=FrequencyConverter(
+                    mixer=Mixer(), local_oscillator=f"#/local_oscillators/lo{idx}"
+                ),
+                intermediate_frequency=float(rng.uniform(-300e6, 300e6)),
+            )
+    plan = get_frequency_plan(machine)
+    assert len(plan.channels) == 400
+    assert plan.num_LO_groups == 100
+
+    plan = plan.solve(max_intermediate_frequency=400e6, min_intermediate_frequency=1e6)
+    assert np.all(np.abs(plan.intermediate_frequencies) <= 400e6 + 1e-3)
+    assert np.all(np.abs(plan.intermediate_frequencies) >= 1e6 - 1e-3)
+    assert np.allclose(plan.LO_frequencies, plan.LO_frequencies[plan.LO_groups * 4])
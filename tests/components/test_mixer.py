@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from quam.components import FrequencyConverter, IQChannel, LocalOscillator, Mixer
+from quam.core import QuamRoot, quam_dataclass
+
+
+@quam_dataclass
+class MixerQuAM(QuamRoot):
+    channel: IQChannel = None
+
+
+def create_quam(**mixer_kwargs):
+    machine = MixerQuAM()
+    machine.channel = IQChannel(
+        id="xy",
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(**mixer_kwargs),
+            local_oscillator=LocalOscillator(frequency=6e9),
+        ),
+        intermediate_frequency=100e6,
+    )
+    return machine
+
+
+def test_IQ_imbalance_matrices():
+    gains = np.array([0, 0.01, -0.05])
+    phases = np.array([0, 0.02, 0.1])
+    matrices = Mixer.IQ_imbalance_matrices(gains, phases)
+    assert matrices.shape == (3, 4)
+    for g, phi, matrix in zip(gains, phases, matrices):
+        assert np.allclose(matrix, Mixer.IQ_imbalance(g, phi))
+
+
+def test_mixer_without_correction_table():
+    machine = create_quam(correction_gain=0.01, correction_phase=0.02)
+    cfg = machine.generate_config()
+    assert cfg["mixers"]["xy.mixer"] == [
+        {
+            "intermediate_frequency": 100e6,
+            "lo_frequency": 6e9,
+            "correction": Mixer.IQ_imbalance(0.01, 0.02),
+        }
+    ]
+
+
+def test_mixer_get_correction():
+    mixer = Mixer(
+        correction_table=[
+            [150e6, 6e9, 0.03, 0.04],
+            [50e6, 6e9, 0.01, 0.02],
+            [100e6, 7e9, 0.05, 0.06],
+        ]
+    )
+    assert np.allclose(
+        mixer.get_correction([0, 50e6, 100e6, 200e6], LO_frequency=6e9),
+        [[0.01, 0.02], [0.01, 0.02], [0.02, 0.03], [0.03, 0.04]],
+    )
+    # The calibration points with the closest LO frequency are used
+    assert np.allclose(mixer.get_correction(50e6, LO_frequency=6.8e9), [0.05, 0.06])
+
+    mixer = Mixer(correction_gain=0.1, correction_phase=0.2)
+    assert np.allclose(mixer.get_correction([10e6, 20e6]), [[0.1, 0.2], [0.1, 0.2]])
+
+
+def test_mixer_correction_table_config():
+    machine = create_quam(
+        correction_table=[
+            [50e6, 6e9, 0.01, 0.02],
+            [150e6, 6e9, 0.03, 0.04],
+            [100e6, 6e9, 0.02, 0.03],
+            [100e6, 6.5e9, 0.05, 0.06],
+        ],
+        correction_intermediate_frequencies=[75e6, 150e6],
+    )
+    cfg = machine.generate_config()
+    entries = cfg["mixers"]["xy.mixer"]
+
+    frequencies = [
+        (entry["intermediate_frequency"], entry["lo_frequency"]) for entry in entries
+    ]
+    # The current IF comes first, duplicate (IF, LO) pairs are removed
+    assert frequencies == [
+        (100e6, 6e9),
+        (75e6, 6e9),
+        (150e6, 6e9),
+        (50e6, 6e9),
+        (100e6, 6.5e9),
+    ]
+
+    corrections = {
+        frequencies: entry["correction"]
+        for frequencies, entry in zip(frequencies, entries)
+    }
+    assert corrections[(100e6, 6e9)] == pytest.approx(Mixer.IQ_imbalance(0.02, 0.03))
+    assert corrections[(75e6, 6e9)] == pytest.approx(Mixer.IQ_imbalance(0.015, 0.025))
+    assert corrections[(100e6, 6.5e9)] == pytest.approx(Mixer.IQ_imbalance(0.05, 0.06))
+    assert all(isinstance(value, float) for value in corrections[(50e6, 6e9)])
+
+
+def test_mixer_correction_table_serialisation(tmp_path):
+    machine = create_quam(correction_table=[[50e6, 6e9, 0.01, 0.02]])
+    machine.save(tmp_path / "quam.json")
+    loaded = MixerQuAM.load(tmp_path / "quam.json")
+    mixer = loaded.channel.frequency_converter_up.mixer
+    assert np.allclose(mixer.correction_table, [[50e6, 6e9, 0.01, 0.02]])
+    assert loaded.generate_config()["mixers"] == machine.generate_config()["mixers"]
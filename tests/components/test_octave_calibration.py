@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from quam.components import (
+    IQChannel,
+    Mixer,
+    Octave,
+    OctaveCalibrationDatabase,
+    OctaveCalibrationEntry,
+)
+from quam.core import QuamRoot, quam_dataclass
+
+
+@quam_dataclass
+class OctaveQuAM(QuamRoot):
+    octave: Octave = None
+    channel: IQChannel = None
+
+
+def create_database(path=None):
+    database = OctaveCalibrationDatabase(path)
+    for LO_frequency in [7e9, 5e9, 6e9]:
+        for output_gain in [0, 10]:
+            for intermediate_frequency in [-100e6, 0, 100e6, 200e6]:
+                entry = OctaveCalibrationEntry(
+                    LO_frequency=LO_frequency,
+                    output_gain=output_gain,
+                    intermediate_frequency=intermediate_frequency,
+                    correction_gain=LO_frequency / 1e12 + output_gain / 1e3,
+                    correction_phase=intermediate_frequency / 1e10,
+                )
+                database.add("octave1", 1, entry)
+    return database
+
+
+def test_calibration_database_exact_lookup():
+    database = create_database()
+    assert len(database) == 24
+    assert database.converters == [("octave1", 1)]
+
+    entry = database.get("octave1", 1, 6e9, 10, 100e6)
+    assert entry.LO_frequency == 6e9
+    assert entry.output_gain == 10
+    assert entry.intermediate_frequency == 100e6
+    assert entry.correction_gain == pytest.approx(0.016)
+
+    with pytest.raises(KeyError):
+        database.get("octave1", 1, 6e9, 10, 50e6)
+    with pytest.raises(KeyError):
+        database.get("octave1", 2, 6e9, 10, 100e6)
+
+
+def test_calibration_database_nearest_lookup():
+    database = create_database()
+    entry = database.get("octave1", 1, 6.4e9, 2, 140e6, nearest=True)
+    assert entry[:3] == (6e9, 0, 100e6)
+    entry = database.get("octave1", 1, 9e9, 20, -1e9, nearest=True)
+    assert entry[:3] == (7e9, 10, -100e6)
+
+    entries = database.get_entries("octave1", 1, 4e9, 0, nearest=True)
+    assert [entry.intermediate_frequency for entry in entries] == [
+        -100e6,
+        0,
+        100e6,
+        200e6,
+    ]
+    assert all(entry.LO_frequency == 5e9 for entry in entries)
+    assert database.get_entries("octave1", 1, 4e9, 0) == []
+
+
+def test_calibration_database_replace_entry():
+    database = create_database()
+    database.add("octave1", 1, (6e9, 0, 100e6, 0.5, 0.6))
+    assert len(database) == 24
+    assert database.get("octave1", 1, 6e9, 0, 100e6).correction_gain == 0.5
+
+
+def test_calibration_database_save_load(tmp_path):
+    database = create_database(tmp_path)
+    path = database.save()
+    assert path == tmp_path / "octave_calibration.json"
+
+    contents = json.loads(path.read_text())
+    LO_frequencies = [row[0] for row in contents["entries"]["octave1/1"]]
+    assert LO_frequencies == sorted(LO_frequencies)
+
+    loaded = OctaveCalibrationDatabase.load(tmp_path)
+    assert len(loaded) == 24
+    assert list(loaded.iterate_entries()) == list(database.iterate_entries())
+    assert loaded.get("octave1", 1, 5e9, 10, 0) == database.get(
+        "octave1", 1, 5e9, 10, 0
+    )
+
+
+def create_quam(calibration_db_path=None):
+    machine = OctaveQuAM()
+    machine.octave = Octave(
+        name="octave1", ip="127.0.0.1", port=80, calibration_db_path=calibration_db_path
+    )
+    machine.octave.initialize_frequency_converters()
+    converter = machine.octave.RF_outputs[1]
+    converter.LO_frequency = 6.1e9
+    machine.channel = IQChannel(
+        id="xy",
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up="#/octave/RF_outputs/1",
+        intermediate_frequency=120e6,
+    )
+    converter.channel = "#/channel"
+    return machine
+
+
+def test_octave_calibration_config(tmp_path):
+    machine = create_quam()
+    assert machine.octave.get_calibration_database() is None
+    assert "octave_octave1_1" not in machine.generate_config()["mixers"]
+
+    machine = create_quam(calibration_db_path=str(tmp_path))
+    assert machine.octave.get_calibration_database() is None
+
+    create_database(tmp_path).save()
+    database = machine.octave.get_calibration_database()
+    assert len(database) == 24
+    assert machine.octave.get_calibration_database() is database
+
+    cfg = machine.generate_config()
+    entries = cfg["mixers"]["octave_octave1_1"]
+    assert [
+        (entry["intermediate_frequency"], entry["lo_frequency"]) for entry in entries
+    ] == [(120e6, 6.1e9), (-100e6, 6.1e9), (0, 6.1e9), (100e6, 6.1e9), (200e6, 6.1e9)]
+
+    nearest_entry = database.get("octave1", 1, 6e9, 0, 100e6)
+    assert entries[0]["correction"] == pytest.approx(
+        Mixer.IQ_imbalance(
+            nearest_entry.correction_gain, nearest_entry.correction_phase
+        )
+    )
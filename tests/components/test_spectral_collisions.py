@@ -0,0 +1,209 @@
+from dataclasses import field
+from typing import Dict
+
+import numpy as np
+
+from quam.components import (
+    FrequencyConverter,
+    IQChannel,
+    LocalOscillator,
+    Mixer,
+    Octave,
+    SingleChannel,
+    SpectralLine,
+    find_spectral_collisions,
+    get_spectral_lines,
+)
+from quam.components.channels import Channel, MWChannel
+from quam.components.ports import FEMPortsContainer
+from quam.core import QuamRoot, quam_dataclass
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+
+
+@quam_dataclass
+class SpectralQuAM(QuamRoot):
+    channels: Dict[str, Channel] = field(default_factory=dict)
+    octave: Octave = None
+    ports: FEMPortsContainer = field(default_factory=FEMPortsContainer)
+
+
+def create_quam():
+    machine = SpectralQuAM()
+    machine.channels["xy1"] = IQChannel(
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+        ),
+        intermediate_frequency=100e6,
+    )
+    # Shares the up-converter of xy1 with an RF frequency close to its mixer image
+    machine.channels["xy2"] = IQChannel(
+        opx_output_I=("con1", 3),
+        opx_output_Q=("con1", 4),
+        frequency_converter_up="#/channels/xy1/frequency_converter_up",
+        intermediate_frequency=-99e6,
+    )
+    # Independent line with an RF frequency close to the mixer image of xy1
+    machine.channels["xy3"] = IQChannel(
+        opx_output_I=("con1", 6),
+        opx_output_Q=("con1", 7),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=5.8e9)
+        ),
+        intermediate_frequency=101e6,
+    )
+    # Flux channel on the same port as xy1 with a nearby IF
+    machine.channels["z1"] = SingleChannel(
+        opx_output=("con1", 1), intermediate_frequency=-100.5e6
+    )
+    machine.channels["z2"] = SingleChannel(
+        opx_output=("con1", 5), intermediate_frequency=100e6
+    )
+    return machine
+
+
+def get_collision_descriptions(collisions):
+    return {
+        ((line1.source, line1.kind), (line2.source, line2.kind))
+        for line1, line2 in collisions
+    }
+
+
+def test_get_spectral_lines():
+    machine = create_quam()
+    lines = get_spectral_lines(machine)
+
+    descriptions = [(line.source, line.kind, line.frequency) for line in lines]
+    assert ("xy1", "RF", 6.1e9) in descriptions
+    assert ("xy1", "image", 5.9e9) in descriptions
+    assert ("xy2", "RF", 5.901e9) in descriptions
+    assert ("xy3", "RF", 5.901e9) in descriptions
+    assert ("z1", "IF", 100.5e6) in descriptions
+    assert len([line for line in lines if line.kind == "LO"]) == 2
+
+    domains = {line.source: line.domain for line in lines if line.kind == "RF"}
+    assert domains["xy1"] == domains["xy2"] != domains["xy3"]
+
+    z1_line = next(line for line in lines if line.source == "z1")
+    assert z1_line.domain == ("IF", ("con1", 1))
+    assert z1_line.component is machine.channels["z1"]
+
+
+def test_find_spectral_collisions():
+    machine = create_quam()
+    collisions = machine.get_spectral_collisions(threshold=2e6)
+
+    assert get_collision_descriptions(collisions) == {
+        (("xy1", "image"), ("xy2", "RF")),
+        (("xy2", "image"), ("xy1", "RF")),
+        (("xy1", "IF"), ("z1", "IF")),
+    }
+    for line1, line2 in collisions:
+        assert line1.frequency <= line2.frequency
+        assert line2.frequency - line1.frequency <= 2e6
+
+    # z2 has the same IF as xy1 but is on a different port, and xy3 has the same RF
+    # frequency as xy2 but is on a different output line
+    collisions = machine.get_spectral_collisions(threshold=0.5e6)
+    assert get_collision_descriptions(collisions) == {
+        (("xy1", "IF"), ("z1", "IF")),
+    }
+
+
+def test_spectral_collisions_components_selection():
+    machine = create_quam()
+    collisions = machine.get_spectral_collisions(
+        threshold=2e6, components=["#/channels/xy*"]
+    )
+    assert get_collision_descriptions(collisions) == {
+        (("xy1", "image"), ("xy2", "RF")),
+        (("xy2", "image"), ("xy1", "RF")),
+    }
+
+
+def test_spectral_collisions_octave_and_MW():
+    machine = SpectralQuAM()
+    machine.octave = Octave(name="octave1", ip="127.0.0.1", port=80)
+    machine.octave.initialize_frequency_converters()
+    machine.octave.RF_outputs[2].LO_frequency = 5e9
+
+    port = machine.ports.get_mw_output(
+        "con1", 1, 1, create=True, upconverters={1: 5.0005e9, 2: 5.0009e9}
+    )
+    for idx in range(2):
+        machine.channels[f"mw{idx}"] = MWChannel(
+            opx_output="#/ports/mw_outputs/con1/1/1", upconverter=1
+        )
+    machine.channels["mw2"] = MWChannel(
+        opx_output="#/ports/mw_outputs/con1/1/1", upconverter=2
+    )
+
+    lines = get_spectral_lines(machine)
+    assert [(line.kind, line.frequency) for line in lines] == [
+        ("LO", 5e9),
+        ("LO", 5.0005e9),
+        ("LO", 5.0009e9),
+    ]
+    assert lines[1].component is port
+
+    # The Octave up-converter is on a different output line than the MW-FEM port
+    collisions = machine.get_spectral_collisions(threshold=1e6)
+    assert [(line1.frequency, line2.frequency) for line1, line2 in collisions] == [
+        (5.0005e9, 5.0009e9)
+    ]
+
+    machine.octave.RF_outputs[2].LO_frequency = 5.0005e9
+    collisions = machine.get_spectral_collisions(threshold=1e6)
+    assert len(collisions) == 1
+
+
+def test_spectral_collisions_example_device():
+    machine = create_quam_superconducting_referenced(num_qubits=3)
+    resonators = [qubit.resonator for qubit in machine.qubits.values()]
+    resonator_LOs = [
+        resonator.frequency_converter_up.local_oscillator for resonator in resonators
+    ]
+
+    # Only the resonators on the shared feedline collide, not the separate 6 GHz
+    # local oscillators of the qubit drive lines
+    collisions = machine.get_spectral_collisions(threshold=1e6)
+    assert collisions
+    for line1, line2 in collisions:
+        assert line1.domain == line2.domain
+        assert line1.component in resonators + resonator_LOs
+        assert line2.component in resonators + resonator_LOs
+
+    for qubit, resonator in zip(machine.qubits.values(), resonators):
+        resonator.intermediate_frequency = 50e6 + 10e6 * qubit.id
+    collisions = machine.get_spectral_collisions(threshold=1e6)
+    kinds = sorted((line1.kind, line2.kind) for line1, line2 in collisions)
+    assert kinds == [("LO", "LO")] * 3
+
+
+def test_find_spectral_collisions_matches_pairwise():
+    rng = np.random.default_rng(1)
+    frequencies = rng.uniform(4e9, 8e9, size=2000)
+    domains = [("IF", ("con1", 1)) if flag else "RF" for flag in rng.random(2000) < 0.5]
+    lines = [
+        SpectralLine(frequency, "RF", f"ch{idx}", None, domain)
+        for idx, (frequency, domain) in enumerate(zip(frequencies, domains))
+    ]
+    threshold = 1e6
+    collisions = find_spectral_collisions(lines, threshold)
+
+    expected = set()
+    for idx1, line1 in enumerate(lines):
+        for line2 in lines[idx1 + 1 :]:
+            if line1.domain != line2.domain:
+                continue
+            if abs(line1.frequency - line2.frequency) <= threshold:
+                expected.add(frozenset([line1.source, line2.source]))
+    assert len(collisions) == len(expected) > 0
+    assert {frozenset([l1.source, l2.source]) for l1, l2 in collisions} == expected
+
+
+def test_find_spectral_collisions_empty():
+    assert find_spectral_collisions([], threshold=1e6) == []
@@ -0,0 +1,82 @@
+import json
+
+import numpy as np
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import InOutSingleChannel, SingleChannel
+from quam.utils.config import convert_config_arrays_to_lists
+
+
+def create_quam_with_pulses():
+    machine = BasicQuAM()
+    machine.channels["drive"] = SingleChannel(opx_output=("con1", 1))
+    machine.channels["drive"].operations["gaussian"] = pulses.GaussianPulse(
+        length=20, amplitude=0.1, sigma=4
+    )
+    machine.channels["readout"] = InOutSingleChannel(
+        opx_output=("con1", 2), opx_input=("con1", 1)
+    )
+    machine.channels["readout"].operations["readout"] = pulses.SquareReadoutPulse(
+        length=100, amplitude=0.1, integration_weights=[(0.4, 40), (0.6, 60)]
+    )
+    return machine
+
+
+def test_generate_config_converts_arrays_to_lists():
+    machine = create_quam_with_pulses()
+    cfg = machine.generate_config()
+
+    samples = cfg["waveforms"]["drive.gaussian.wf"]["samples"]
+    assert isinstance(samples, list)
+    assert all(type(sample) is float for sample in samples)
+
+    expected_waveform = machine.channels["drive"].operations["gaussian"]
+    assert samples == expected_waveform.calculate_waveform().tolist()
+
+    weights = cfg["integration_weights"]["readout.readout.iw1"]
+    assert weights["cosine"] == [(0.4, 40), (0.6, 60)]
+    assert all(type(length) is int for _, length in weights["cosine"])
+
+    json.dumps(cfg)
+
+
+def test_generate_config_keep_arrays():
+    machine = create_quam_with_pulses()
+    cfg = machine.generate_config(arrays_to_lists=False)
+
+    samples = cfg["waveforms"]["drive.gaussian.wf"]["samples"]
+    assert isinstance(samples, np.ndarray)
+    assert samples.dtype == float
+    assert samples.flags["C_CONTIGUOUS"]
+
+    weights = cfg["integration_weights"]["readout.readout.iw1"]["cosine"]
+    assert isinstance(weights, np.ndarray)
+    assert weights.shape == (2, 2)
+
+    cfg_lists = machine.generate_config()
+    convert_config_arrays_to_lists(cfg)
+    assert cfg == cfg_lists
+
+
+def test_convert_config_arrays_to_lists_IQ_waveform():
+    cfg = {
+        "waveforms": {
+            "wf.I": {"type": "arbitrary", "samples": np.array([0.1, 0.2])},
+            "wf.Q": {"type": "arbitrary", "samples": [0.3, 0.4]},
+            "const": {"type": "constant", "sample": np.float64(0.5)},
+        },
+        "integration_weights": {
+            "iw": {"cosine": np.array([[1.0, 40.0]]), "sine": [(0.0, 40)]}
+        },
+    }
+    convert_config_arrays_to_lists(cfg)
+
+    assert cfg == {
+        "waveforms": {
+            "wf.I": {"type": "arbitrary", "samples": [0.1, 0.2]},
+            "wf.Q": {"type": "arbitrary", "samples": [0.3, 0.4]},
+            "const": {"type": "constant", "sample": 0.5},
+        },
+        "integration_weights": {"iw": {"cosine": [(1.0, 40)], "sine": [(0.0, 40)]}},
+    }
+    assert type(cfg["waveforms"]["const"]["sample"]) is float
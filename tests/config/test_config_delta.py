@@ -0,0 +1,90 @@
+from quam.components import pulses
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+from quam.utils.config import get_config_delta, get_config_fingerprint_tree
+
+
+def is_empty_delta(section_delta):
+    return not any(section_delta.values())
+
+
+def test_config_delta_unchanged():
+    machine = create_quam_superconducting_referenced(num_qubits=2)
+    previous_config = machine.generate_config()
+
+    delta = machine.generate_config_delta(previous_config)
+    assert set(delta) == {
+        "elements",
+        "pulses",
+        "waveforms",
+        "integration_weights",
+        "mixers",
+        "controllers",
+        "octaves",
+    }
+    assert all(is_empty_delta(section_delta) for section_delta in delta.values())
+
+
+def test_config_delta_changes():
+    machine = create_quam_superconducting_referenced(num_qubits=2)
+    previous_config = machine.generate_config()
+    previous_tree = get_config_fingerprint_tree(previous_config)
+
+    machine.qubits["q1"].xy.intermediate_frequency = 50e6
+    machine.qubits["q0"].xy.operations["square"] = pulses.SquarePulse(
+        length=100, amplitude=0.2
+    )
+    machine.qubits.pop("q1")
+    machine.qubits["q0"].z.operations["flux"] = pulses.SquarePulse(
+        length=16, amplitude=0.1
+    )
+
+    for previous in [previous_config, previous_tree]:
+        delta = machine.generate_config_delta(previous)
+
+        assert delta["elements"]["added"] == {}
+        assert sorted(delta["elements"]["changed"]) == ["q0.xy", "q0.z"]
+        assert sorted(delta["elements"]["removed"]) == ["IQ1", "q1.xy", "q1.z"]
+
+        assert sorted(delta["pulses"]["added"]) == [
+            "q0.xy.square.pulse",
+            "q0.z.flux.pulse",
+        ]
+        assert delta["waveforms"]["added"]["q0.xy.square.wf.I"] == {
+            "type": "constant",
+            "sample": 0.2,
+        }
+        assert delta["mixers"]["removed"] == ["q1.xy.mixer", "IQ1.mixer"]
+        assert list(delta["controllers"]["changed"]) == ["con1"]
+
+
+def test_config_delta_chained():
+    machine = create_quam_superconducting_referenced(num_qubits=2)
+    previous_tree = get_config_fingerprint_tree(machine.generate_config())
+
+    machine.qubits["q0"].xy.intermediate_frequency = 50e6
+    delta, config, tree = machine.generate_config_delta(
+        previous_tree, return_config=True
+    )
+    assert list(delta["elements"]["changed"]) == ["q0.xy"]
+    assert config == machine.generate_config()
+    assert tree == get_config_fingerprint_tree(config)
+
+    # The returned fingerprint tree is used as the reference for the next delta
+    machine.qubits["q1"].xy.intermediate_frequency = 60e6
+    delta, config, tree = machine.generate_config_delta(tree, return_config=True)
+    assert list(delta["elements"]["changed"]) == ["q1.xy"]
+    assert config == machine.generate_config()
+
+    delta = machine.generate_config_delta(tree)
+    assert all(is_empty_delta(section_delta) for section_delta in delta.values())
+
+
+def test_get_config_delta_added_section():
+    previous_config = {"version": 1, "elements": {}}
+    current_config = {"version": 1, "elements": {"ch1": {"operations": {}}}}
+
+    delta = get_config_delta(previous_config, current_config)
+    assert delta["elements"]["added"] == {"ch1": {"operations": {}}}
+    assert is_empty_delta(delta["octaves"])
@@ -0,0 +1,89 @@
+import numpy as np
+
+from quam.components import pulses
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+from quam.utils.config import get_config_fingerprint, get_config_fingerprint_tree
+
+
+def create_machine():
+    machine = create_quam_superconducting_referenced(num_qubits=2)
+    for qubit in machine.qubits.values():
+        qubit.xy.operations["drag"] = pulses.DragPulse(
+            length=40,
+            amplitude=0.1,
+            sigma=8,
+            alpha=0.5,
+            anharmonicity=-200e6,
+            axis_angle=0,
+        )
+    return machine
+
+
+def test_generate_config_return_fingerprint():
+    machine = create_machine()
+    cfg, fingerprint = machine.generate_config(return_fingerprint=True)
+
+    assert isinstance(fingerprint, str)
+    assert fingerprint == get_config_fingerprint(cfg)
+    assert fingerprint == get_config_fingerprint(machine.generate_config())
+
+    _, fingerprint_arrays = machine.generate_config(
+        arrays_to_lists=False, return_fingerprint=True
+    )
+    assert fingerprint_arrays == fingerprint
+
+
+def test_fingerprint_changes_with_config():
+    machine = create_machine()
+    _, fingerprint = machine.generate_config(return_fingerprint=True)
+
+    machine.qubits["q0"].xy.operations["drag"].amplitude = 0.2
+    _, fingerprint_changed = machine.generate_config(return_fingerprint=True)
+    assert fingerprint_changed != fingerprint
+
+
+def test_fingerprint_insensitive_to_ordering_and_representation():
+    cfg = {
+        "version": 1,
+        "waveforms": {
+            "wf1": {"type": "arbitrary", "samples": np.array([0.1, 0.2, 0.3])},
+            "wf2": {"type": "constant", "sample": 0.1},
+        },
+        "integration_weights": {
+            "iw1": {"cosine": np.array([[1.0, 40], [0.5, 60]]), "sine": []}
+        },
+    }
+    cfg_reordered = {
+        "integration_weights": {"iw1": {"sine": [], "cosine": [(1.0, 40), (0.5, 60)]}},
+        "waveforms": {
+            "wf2": {"sample": 0.1, "type": "constant"},
+            "wf1": {"samples": [0.1, 0.2, 0.3], "type": "arbitrary"},
+        },
+        "version": 1,
+    }
+    assert get_config_fingerprint(cfg) == get_config_fingerprint(cfg_reordered)
+
+    cfg_reordered["waveforms"]["wf1"]["samples"][1] = np.nextafter(0.2, 1)
+    assert get_config_fingerprint(cfg) != get_config_fingerprint(cfg_reordered)
+
+
+def test_fingerprint_tree():
+    machine = create_machine()
+    cfg = machine.generate_config()
+    tree = get_config_fingerprint_tree(cfg)
+
+    assert set(tree) == set(cfg)
+    assert isinstance(tree["version"], str)
+    assert set(tree["elements"]) == set(cfg["elements"])
+    assert get_config_fingerprint(tree) == get_config_fingerprint(cfg)
+
+    machine.qubits["q1"].xy.intermediate_frequency = 50e6
+    tree_changed = get_config_fingerprint_tree(machine.generate_config())
+    changed_elements = [
+        name
+        for name, fp in tree["elements"].items()
+        if tree_changed["elements"][name] != fp
+    ]
+    assert changed_elements == ["q1.xy"]
@@ -0,0 +1,125 @@
+import numpy as np
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import (
+    DigitalOutputChannel,
+    InOutSingleChannel,
+    SingleChannel,
+)
+from quam.core import quam_dataclass
+from quam.utils.config import get_config_footprint
+
+
+@quam_dataclass
+class FlatPulse(pulses.Pulse):
+    amplitude: float
+
+    def waveform_function(self):
+        return np.full(self.length, self.amplitude)
+
+
+def create_quam():
+    machine = BasicQuAM()
+    machine.channels["ch1"] = SingleChannel(
+        opx_output=("con1", 1, 1),
+        digital_outputs={"m": DigitalOutputChannel(opx_output=("con1", 1, 1))},
+    )
+    machine.channels["ch2"] = SingleChannel(opx_output=("con1", 1, 2))
+    machine.channels["ch3"] = SingleChannel(opx_output=("con1", 2, 1))
+    for channel in machine.channels.values():
+        channel.operations["gauss"] = pulses.GaussianPulse(
+            length=20, amplitude=0.1, sigma=4
+        )
+    machine.channels["ch1"].operations["gauss"].digital_marker = "ON"
+    machine.channels["ch1"].operations["flat"] = FlatPulse(length=16, amplitude=0.2)
+    machine.channels["ch3"].operations["long"] = pulses.GaussianPulse(
+        length=100, amplitude=0.1, sigma=20
+    )
+
+    machine.channels["res"] = InOutSingleChannel(
+        opx_output=("con1", 1, 3), opx_input=("con1", 1, 1)
+    )
+    machine.channels["res"].operations["readout"] = pulses.SquareReadoutPulse(
+        length=100, amplitude=0.1, integration_weights=[(0.5, 40), (1.0, 60)]
+    )
+    return machine
+
+
+def test_config_footprint():
+    cfg = create_quam().generate_config()
+    footprint = get_config_footprint(cfg)
+
+    assert footprint["elements"]["ch1"] == {
+        "waveform_samples": 36,
+        "integration_weights_segments": 0,
+        "digital_waveform_entries": 1,
+    }
+    assert footprint["elements"]["ch3"]["waveform_samples"] == 120
+    assert footprint["elements"]["res"] == {
+        "waveform_samples": 0,
+        "integration_weights_segments": 12,
+        "digital_waveform_entries": 1,
+    }
+    assert footprint["pulses"]["ch1.flat.pulse"]["waveform_samples"] == 16
+
+    assert footprint["devices"] == {
+        ("con1", 1): {
+            "waveform_samples": 56,
+            "integration_weights_segments": 12,
+            "digital_waveform_entries": 1,
+        },
+        ("con1", 2): {
+            "waveform_samples": 120,
+            "integration_weights_segments": 0,
+            "digital_waveform_entries": 0,
+        },
+    }
+    assert footprint["savings"] == {
+        ("con1", 1): {
+            "constant_waveform_samples": 16,
+            "duplicate_waveform_samples": 20,
+            "duplicate_integration_weights_segments": 0,
+        },
+        ("con1", 2): {
+            "constant_waveform_samples": 0,
+            "duplicate_waveform_samples": 0,
+            "duplicate_integration_weights_segments": 0,
+        },
+    }
+
+
+def test_quam_root_config_footprint():
+    machine = create_quam()
+    footprint = machine.get_config_footprint()
+
+    assert list(footprint["pulses"])[:2] == [
+        "#/channels/ch3/operations/long",
+        "#/channels/ch1/operations/gauss",
+    ]
+    assert footprint["pulses"]["#/channels/res/operations/readout"] == {
+        "waveform_samples": 0,
+        "integration_weights_segments": 12,
+        "digital_waveform_entries": 1,
+    }
+    assert "const_pulse" not in footprint["pulses"]
+
+    footprint = machine.get_config_footprint(components=["#/channels/ch3"])
+    assert list(footprint["elements"]) == ["ch3"]
+    assert footprint["devices"][("con1", 2)]["waveform_samples"] == 120
+
+
+def test_config_footprint_segmented_pulse():
+    machine = BasicQuAM()
+    machine.channels["ch1"] = SingleChannel(opx_output=("con1", 1))
+    machine.channels["ch1"].operations["flattop"] = pulses.FlatTopGaussianPulse(
+        length=1000, amplitude=0.1, flat_length=980, segmented=True
+    )
+    footprint = machine.get_config_footprint()
+    assert footprint["pulses"] == {
+        "#/channels/ch1/operations/flattop": {
+            "waveform_samples": 20,
+            "integration_weights_segments": 0,
+            "digital_waveform_entries": 0,
+        }
+    }
+    assert footprint["devices"][("con1",)]["waveform_samples"] == 20
@@ -0,0 +1,56 @@
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import InOutSingleChannel
+from quam.utils.config import deduplicate_integration_weights
+
+
+def create_multiplexed_quam(num_resonators=3):
+    machine = BasicQuAM()
+    for idx in range(num_resonators):
+        resonator = InOutSingleChannel(
+            opx_output=("con1", idx + 1), opx_input=("con1", 1)
+        )
+        machine.channels[f"res{idx}"] = resonator
+        resonator.operations["readout"] = pulses.SquareReadoutPulse(
+            length=1000, amplitude=0.01 * (idx + 1)
+        )
+    return machine
+
+
+def test_generate_config_deduplicate_weights():
+    machine = create_multiplexed_quam()
+
+    cfg = machine.generate_config()
+    assert len(cfg["integration_weights"]) == 9
+
+    cfg_dedup = machine.generate_config(deduplicate_weights=True)
+    assert list(cfg_dedup["integration_weights"]) == [
+        "res0.readout.iw1",
+        "res0.readout.iw2",
+        "res0.readout.iw3",
+    ]
+    for idx in range(3):
+        pulse_cfg = cfg_dedup["pulses"][f"res{idx}.readout.pulse"]
+        assert pulse_cfg["integration_weights"] == {
+            "iw1": "res0.readout.iw1",
+            "iw2": "res0.readout.iw2",
+            "iw3": "res0.readout.iw3",
+        }
+        for label, name in pulse_cfg["integration_weights"].items():
+            original_name = cfg["pulses"][f"res{idx}.readout.pulse"][
+                "integration_weights"
+            ][label]
+            assert (
+                cfg_dedup["integration_weights"][name]
+                == cfg["integration_weights"][original_name]
+            )
+
+
+def test_deduplicate_integration_weights_different_weights():
+    machine = create_multiplexed_quam(num_resonators=2)
+    machine.channels["res1"].operations["readout"].integration_weights_angle = 0.1
+
+    cfg = machine.generate_config()
+    replaced_names = deduplicate_integration_weights(cfg)
+
+    assert replaced_names == {}
+    assert len(cfg["integration_weights"]) == 6
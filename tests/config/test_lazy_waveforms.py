@@ -0,0 +1,122 @@
+import json
+
+import numpy as np
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import IQChannel, SingleChannel
+from quam.components.hardware import FrequencyConverter, LocalOscillator, Mixer
+from quam.core import quam_dataclass
+from quam.utils.config import LazyWaveform, materialise_waveforms
+
+
+@quam_dataclass
+class CountingPulse(pulses.GaussianPulse):
+    num_calls: int = 0
+
+    def waveform_function(self):
+        self.num_calls += 1
+        return super().waveform_function()
+
+
+def create_quam():
+    machine = BasicQuAM()
+    machine.channels["xy"] = IQChannel(
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+        ),
+    )
+    machine.channels["xy"].operations["gauss"] = CountingPulse(
+        length=20, amplitude=0.2, sigma=4, axis_angle=0
+    )
+    machine.channels["xy"].operations["square"] = pulses.SquarePulse(
+        length=100, amplitude=0.1
+    )
+    machine.channels["z"] = SingleChannel(opx_output=("con1", 3))
+    machine.channels["z"].operations["gauss"] = CountingPulse(
+        length=40, amplitude=0.1, sigma=8
+    )
+    return machine
+
+
+def test_lazy_waveforms_not_calculated():
+    machine = create_quam()
+    cfg = machine.generate_config(lazy_waveforms=True)
+    cfg_eager = machine.generate_config()
+
+    xy_pulse = machine.channels["xy"].operations["gauss"]
+    z_pulse = machine.channels["z"].operations["gauss"]
+    assert xy_pulse.num_calls == 1
+    assert z_pulse.num_calls == 1
+
+    assert cfg["elements"] == cfg_eager["elements"]
+    assert cfg["pulses"] == cfg_eager["pulses"]
+    assert list(cfg["waveforms"]) == list(cfg_eager["waveforms"])
+    for name in ["xy.gauss.wf.I", "xy.gauss.wf.Q", "xy.square.wf.I", "z.gauss.wf"]:
+        assert isinstance(cfg["waveforms"][name], LazyWaveform)
+    assert "not materialised" in repr(cfg["waveforms"]["xy.gauss.wf.I"])
+
+    # Accessing the I waveform also calculates the Q waveform of the same pulse
+    assert cfg["waveforms"]["xy.gauss.wf.I"]["type"] == "arbitrary"
+    assert xy_pulse.num_calls == 2
+    assert cfg["waveforms"]["xy.gauss.wf.Q"]["type"] == "arbitrary"
+    assert xy_pulse.num_calls == 2
+    assert z_pulse.num_calls == 1
+    assert not cfg["waveforms"]["z.gauss.wf"].is_materialised
+
+
+def test_materialise_lazy_waveforms():
+    machine = create_quam()
+    cfg = machine.generate_config(lazy_waveforms=True)
+    cfg_eager = machine.generate_config()
+
+    materialise_waveforms(cfg)
+    assert all(type(wf) is dict for wf in cfg["waveforms"].values())
+    assert isinstance(cfg["waveforms"]["z.gauss.wf"]["samples"], list)
+    assert cfg == cfg_eager
+    json.dumps(cfg)
+
+
+def test_lazy_waveforms_keep_arrays():
+    machine = create_quam()
+    cfg = machine.generate_config(lazy_waveforms=True, arrays_to_lists=False)
+    assert isinstance(cfg["waveforms"]["z.gauss.wf"]["samples"], np.ndarray)
+
+
+def test_lazy_waveforms_fingerprint():
+    machine = create_quam()
+    _, fingerprint = machine.generate_config(return_fingerprint=True)
+    _, fingerprint_lazy = machine.generate_config(
+        lazy_waveforms=True, return_fingerprint=True
+    )
+    assert fingerprint_lazy == fingerprint
+
+
+def test_lazy_waveforms_calculated_on_access():
+    machine = create_quam()
+    cfg = machine.generate_config(lazy_waveforms=True)
+    materialised_cfg = machine.generate_config(lazy_waveforms=True)
+    materialise_waveforms(materialised_cfg)
+
+    # The config is live until its waveforms are accessed
+    machine.channels["z"].operations["gauss"].amplitude = 0.3
+    cfg_eager = machine.generate_config()
+    assert cfg["waveforms"]["z.gauss.wf"] == cfg_eager["waveforms"]["z.gauss.wf"]
+    assert (
+        materialised_cfg["waveforms"]["z.gauss.wf"]
+        != cfg_eager["waveforms"]["z.gauss.wf"]
+    )
+
+    # Once accessed, the waveform no longer changes
+    machine.channels["z"].operations["gauss"].amplitude = 0.1
+    assert cfg["waveforms"]["z.gauss.wf"] == cfg_eager["waveforms"]["z.gauss.wf"]
+
+
+def test_defer_waveforms_nested():
+    assert not pulses._lazy_waveforms.get()
+    with pulses.defer_waveforms():
+        with pulses.defer_waveforms():
+            assert pulses._lazy_waveforms.get()
+        assert pulses._lazy_waveforms.get()
+    assert not pulses._lazy_waveforms.get()
@@ -0,0 +1,82 @@
+import pytest
+
+from quam.components import BasicQuAM, Octave, pulses
+from quam.components.channels import IQChannel, SingleChannel
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+
+
+def test_partial_config_single_qubit():
+    machine = create_quam_superconducting_referenced(num_qubits=3)
+    full_cfg = machine.generate_config()
+    cfg = machine.generate_config(components=[machine.qubits["q1"]])
+
+    assert list(cfg["elements"]) == ["q1.xy", "q1.z", "IQ1"]
+    assert list(cfg["mixers"]) == ["q1.xy.mixer", "IQ1.mixer"]
+
+    analog_outputs = cfg["controllers"]["con1"]["analog_outputs"]
+    assert set(analog_outputs) == {1, 2, 6, 7, 8}
+
+    for section in ["elements", "mixers", "pulses", "waveforms"]:
+        for name, section_cfg in cfg[section].items():
+            assert section_cfg == full_cfg[section][name]
+
+
+def test_partial_config_reference_selection():
+    machine = create_quam_superconducting_referenced(num_qubits=3)
+    cfg = machine.generate_config(components=["#/qubits/q2/xy"])
+    assert list(cfg["elements"]) == ["q2.xy"]
+    assert set(cfg["controllers"]["con1"]["analog_outputs"]) == {9, 10}
+
+
+def test_partial_config_glob_selection():
+    machine = create_quam_superconducting_referenced(num_qubits=3)
+    cfg = machine.generate_config(components=["#/qubits/q[01]/xy", "#/qubits/*/z"])
+    assert list(cfg["elements"]) == ["q0.xy", "q1.xy", "q0.z", "q1.z", "q2.z"]
+
+
+def test_partial_config_invalid_selection():
+    machine = create_quam_superconducting_referenced(num_qubits=1)
+
+    with pytest.raises(ValueError):
+        machine.generate_config(components=["qubits/q0"])
+    with pytest.raises(ValueError):
+        machine.generate_config(components=["#/qubits/q0/xy/intermediate_frequency"])
+    with pytest.raises(TypeError):
+        machine.generate_config(components=[1])
+
+
+def test_partial_config_full_selection_equals_full_config():
+    machine = create_quam_superconducting_referenced(num_qubits=2)
+    assert machine.generate_config(components=[machine]) == machine.generate_config()
+
+
+def test_partial_config_octave():
+    machine = BasicQuAM()
+    octave = Octave(name="octave1", ip="127.0.0.1", port=80)
+    machine.octaves["octave1"] = octave
+    octave.initialize_frequency_converters()
+
+    for idx in [1, 2]:
+        octave.RF_outputs[idx].LO_frequency = 2e9
+        channel = IQChannel(
+            opx_output_I=("con1", 2 * idx - 1),
+            opx_output_Q=("con1", 2 * idx),
+            frequency_converter_up=octave.RF_outputs[idx].get_reference(),
+        )
+        channel.operations["pulse"] = pulses.SquarePulse(length=100, amplitude=0.1)
+        machine.channels[f"ch{idx}"] = channel
+    machine.channels["flux"] = SingleChannel(opx_output=("con1", 5))
+
+    full_cfg = machine.generate_config()
+    cfg = machine.generate_config(components=[machine.channels["ch2"]])
+
+    assert list(cfg["elements"]) == ["ch2"]
+    assert list(cfg["octaves"]) == ["octave1"]
+    assert list(cfg["octaves"]["octave1"]["RF_outputs"]) == [2]
+    assert (
+        cfg["octaves"]["octave1"]["RF_outputs"][2]
+        == full_cfg["octaves"]["octave1"]["RF_outputs"][2]
+    )
+    assert set(cfg["controllers"]["con1"]["analog_outputs"]) == {3, 4}
@@ -0,0 +1,176 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import ClassVar, Dict, Tuple
+
+import numpy as np
+import pytest
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import IQChannel, InOutSingleChannel
+from quam.components.hardware import FrequencyConverter, LocalOscillator, Mixer
+from quam.core import quam_dataclass
+from quam.utils.config import convert_config_arrays_to_lists, materialise_waveforms
+
+# Resolution of the 16-bit DACs with a range of 1 V
+DAC_RESOLUTION = 2**-16
+
+
+def create_quam():
+    machine = BasicQuAM()
+    machine.channels["xy"] = IQChannel(
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+        ),
+    )
+    machine.channels["xy"].operations["gauss"] = pulses.GaussianPulse(
+        length=100, amplitude=0.2, sigma=20, axis_angle=0.3
+    )
+    machine.channels["xy"].operations["drag"] = pulses.DragPulse(
+        length=40, amplitude=0.3, sigma=8, alpha=0.7, anharmonicity=200e6, axis_angle=0
+    )
+    machine.channels["xy"].operations["flattop"] = pulses.FlatTopGaussianPulse(
+        length=60, amplitude=0.1, flat_length=40, axis_angle=0
+    )
+    machine.channels["res"] = InOutSingleChannel(
+        opx_output=("con1", 3), opx_input=("con1", 1)
+    )
+    rng = np.random.default_rng(42)
+    machine.channels["res"].operations["readout"] = pulses.SquareReadoutPulse(
+        length=400,
+        amplitude=0.1,
+        integration_weights=list(rng.uniform(-1, 1, 100)),
+    )
+    return machine
+
+
+def test_single_precision_calculate_waveform():
+    pulse = create_quam().channels["xy"].operations["gauss"]
+    assert pulse.calculate_waveform().dtype == np.complex128
+
+    with pulses.single_precision_waveforms():
+        assert pulse.calculate_waveform().dtype == np.complex64
+        waveforms = pulses.calculate_waveforms([pulse])
+        assert waveforms[0].dtype == np.complex64
+
+        square_pulse = pulses.SquarePulse(length=100, amplitude=0.1)
+        assert square_pulse.calculate_waveform() == 0.1
+
+    assert not pulses._single_precision.get()
+
+
+def test_single_precision_config_arrays():
+    machine = create_quam()
+    cfg = machine.generate_config(arrays_to_lists=False, single_precision=True)
+
+    for name in ["xy.gauss.wf.I", "xy.drag.wf.Q", "xy.flattop.wf.I"]:
+        assert cfg["waveforms"][name]["samples"].dtype == np.float32
+    assert cfg["integration_weights"]["res.readout.iw1"]["cosine"].dtype == np.float32
+
+    cfg = machine.generate_config(arrays_to_lists=False)
+    assert cfg["waveforms"]["xy.gauss.wf.I"]["samples"].dtype == np.float64
+
+
+@quam_dataclass
+class BlockingPulse(pulses.SquarePulse):
+    """Pulse whose waveform calculation waits until its `resume` event is set"""
+
+    events_key: str = None
+
+    events: ClassVar[Dict[str, Tuple[Event, Event]]] = {}
+
+    def waveform_function(self):
+        entered, resume = self.events[self.events_key]
+        entered.set()
+        resume.wait(timeout=10)
+        return super().waveform_function()
+
+
+def test_single_precision_concurrent_threads():
+    machines = {"single": create_quam(), "double": create_quam()}
+    for key, machine in machines.items():
+        BlockingPulse.events[key] = (Event(), Event())
+        machine.channels["res"].operations["block"] = BlockingPulse(
+            length=100, amplitude=0.1, events_key=key
+        )
+    single_entered, single_resume = BlockingPulse.events["single"]
+    double_entered, double_resume = BlockingPulse.events["double"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        single_future = executor.submit(
+            machines["single"].generate_config,
+            arrays_to_lists=False,
+            single_precision=True,
+        )
+        single_entered.wait(timeout=10)
+        double_future = executor.submit(
+            machines["double"].generate_config, arrays_to_lists=False, workers=2
+        )
+        double_entered.wait(timeout=10)
+
+        # The single precision config is completed while the double precision config
+        # is being generated, and vice versa
+        single_resume.set()
+        cfg_single = single_future.result()
+        double_resume.set()
+        cfg_double = double_future.result()
+
+    iw_name = "res.readout.iw1"
+    for name in ["xy.gauss.wf.I", "xy.drag.wf.Q", "xy.flattop.wf.I"]:
+        assert cfg_single["waveforms"][name]["samples"].dtype == np.float32
+        assert cfg_double["waveforms"][name]["samples"].dtype == np.float64
+    assert cfg_single["integration_weights"][iw_name]["cosine"].dtype == np.float32
+    assert cfg_double["integration_weights"][iw_name]["cosine"].dtype == np.float64
+
+
+@pytest.mark.parametrize("lazy_waveforms", [False, True])
+def test_single_precision_within_dac_resolution(lazy_waveforms):
+    machine = create_quam()
+    cfg = machine.generate_config()
+    cfg_single = machine.generate_config(
+        single_precision=True, lazy_waveforms=lazy_waveforms
+    )
+    json.dumps(materialise_waveforms(cfg_single))
+
+    assert list(cfg_single["waveforms"]) == list(cfg["waveforms"])
+    for name, waveform_cfg in cfg["waveforms"].items():
+        waveform_single_cfg = cfg_single["waveforms"][name]
+        if waveform_cfg["type"] == "constant":
+            assert waveform_single_cfg == waveform_cfg
+            continue
+        samples = np.array(waveform_cfg["samples"])
+        samples_single = np.array(waveform_single_cfg["samples"])
+        assert np.max(np.abs(samples - samples_single)) < DAC_RESOLUTION / 2
+
+    for name, weights_cfg in cfg["integration_weights"].items():
+        for key in ["cosine", "sine"]:
+            weights, lengths = np.array(weights_cfg[key]).T
+            weights_single, lengths_single = np.array(
+                cfg_single["integration_weights"][name][key]
+            ).T
+            assert np.all(lengths == lengths_single)
+            assert np.max(np.abs(weights - weights_single)) < 2**-15
+
+
+def test_single_precision_to_lists():
+    cfg = {
+        "waveforms": {
+            "wf": {
+                "type": "arbitrary",
+                "samples": np.array([0.1, 0.2, -0.3], dtype=np.float32),
+            }
+        },
+        "integration_weights": {
+            "iw": {"cosine": np.array([[0.1, 40.0]], dtype=np.float32), "sine": []}
+        },
+    }
+    convert_config_arrays_to_lists(cfg)
+    samples = cfg["waveforms"]["wf"]["samples"]
+    assert all(type(sample) is float for sample in samples)
+    assert samples == np.array([0.1, 0.2, -0.3], dtype=np.float32).tolist()
+    assert np.allclose(samples, [0.1, 0.2, -0.3], atol=1e-7)
+    ((weight, length),) = cfg["integration_weights"]["iw"]["cosine"]
+    assert type(weight) is float and type(length) is int
+    assert abs(weight - 0.1) < 1e-7 and length == 40
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import SingleChannel
+from quam.components.ports import LFFEMAnalogOutputPort
+from quam.utils.config import check_waveform_memory, get_waveform_memory_usage
+
+
+def create_quam(sampling_rate=1e9):
+    machine = BasicQuAM()
+    machine.channels["ch1"] = SingleChannel(
+        opx_output=LFFEMAnalogOutputPort("con1", 1, 1, sampling_rate=sampling_rate)
+    )
+    machine.channels["ch2"] = SingleChannel(opx_output=("con2", 1))
+    for channel in machine.channels.values():
+        channel.operations["gauss"] = pulses.GaussianPulse(
+            length=20, amplitude=0.1, sigma=4
+        )
+        channel.operations["flattop"] = pulses.FlatTopGaussianPulse(
+            length=40, amplitude=0.1, flat_length=20
+        )
+        channel.operations["square"] = pulses.SquarePulse(length=100, amplitude=0.1)
+    return machine
+
+
+def test_channel_sampling_rate():
+    machine = create_quam(sampling_rate=2e9)
+    assert machine.channels["ch1"].sampling_rate == 2e9
+    assert machine.channels["ch2"].sampling_rate == 1e9
+    assert machine.channels["ch1"].operations["gauss"].sampling_rate == 2e9
+    assert pulses.GaussianPulse(length=20, amplitude=0.1, sigma=4).sampling_rate == 1e9
+
+    for channel_name, num_samples in [("ch1", 32), ("ch2", 16)]:
+        drag_pulse = pulses.DragPulse(
+            length=16,
+            amplitude=0.1,
+            sigma=4,
+            alpha=0.5,
+            anharmonicity=200e6,
+            axis_angle=0,
+        )
+        machine.channels[channel_name].operations["drag"] = drag_pulse
+        assert len(drag_pulse.calculate_waveform()) == num_samples
+
+
+def test_waveforms_2GSs_sampling_rate():
+    cfg = create_quam(sampling_rate=2e9).generate_config()
+    waveforms = cfg["waveforms"]
+
+    for pulse_name, length in [("gauss", 20), ("flattop", 40)]:
+        assert len(waveforms[f"ch1.{pulse_name}.wf"]["samples"]) == 2 * length
+        assert len(waveforms[f"ch2.{pulse_name}.wf"]["samples"]) == length
+
+    # The waveform is symmetric and its peak is not duplicated
+    samples = np.array(waveforms["ch1.gauss.wf"]["samples"])
+    assert np.allclose(samples, samples[::-1])
+    assert np.argmax(samples) in [19, 20]
+
+
+def test_get_waveform_memory_usage():
+    cfg = create_quam(sampling_rate=2e9).generate_config()
+    # The square pulse is a constant waveform and isn't counted
+    assert get_waveform_memory_usage(cfg) == {
+        ("con1", 1): 2 * (20 + 40),
+        ("con2",): 20 + 40,
+    }
+
+
+def test_waveform_memory_budget():
+    machine = create_quam(sampling_rate=2e9)
+    with pytest.warns(UserWarning, match="con1/1 require 120 samples"):
+        machine.generate_config(waveform_memory_budget=100)
+
+    cfg = machine.generate_config()
+    with pytest.warns(UserWarning):
+        assert check_waveform_memory(cfg, max_samples=100) == {("con1", 1): 120}
+    assert check_waveform_memory(cfg, max_samples=120) == {}
@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 
 from quam.components import *
 from quam.examples.superconducting_qubits.components import *
 from quam.components.channels import IQChannel
 from quam.core import QuamRoot, quam_dataclass
+from quam.utils.config import convert_config_arrays_to_lists
 
 
 def test_basic_transmon():
@@ -227,6 +229,9 @@ def test_transmon_add_pulse():
     config = {"controllers": {}, "elements": {}, "pulses": {}, "waveforms": {}}
     transmon.xy.operations["X180"].apply_to_config(config)
 
+    assert isinstance(config["waveforms"]["q1.xy.X180.wf.I"]["samples"], np.ndarray)
+    convert_config_arrays_to_lists(config)
+
     from qualang_tools.config.waveform_tools import drag_gaussian_pulse_waveforms
 
     I, Q = drag_gaussian_pulse_waveforms(
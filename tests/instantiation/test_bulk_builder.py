@@ -0,0 +1,223 @@
+import numpy as np
+import pytest
+
+from quam.components import *
+from quam.components.channels import IQChannel, InOutIQChannel, SingleChannel
+from quam.core.bulk_builder import build_components
+from quam.examples.superconducting_qubits.components import QuAM, Transmon
+from quam.examples.superconducting_qubits.generate_superconducting_quam import (
+    create_quam_superconducting_referenced,
+)
+
+
+def create_quam_superconducting_bulk(num_qubits: int) -> QuAM:
+    """Bulk equivalent of `create_quam_superconducting_referenced`"""
+    machine = QuAM()
+    machine.wiring = {
+        "qubits": {
+            f"q{idx}": {
+                "port_I": ("con1", 3 * idx + 3),
+                "port_Q": ("con1", 3 * idx + 4),
+                "port_Z": ("con1", 3 * idx + 5),
+            }
+            for idx in range(num_qubits)
+        },
+        "feedline": {
+            "opx_output_I": ("con1", 1),
+            "opx_output_Q": ("con1", 2),
+            "opx_input_I": ("con1", 1),
+            "opx_input_Q": ("con1", 2),
+        },
+    }
+
+    idxs = np.arange(num_qubits)
+    qubits = build_components(
+        Transmon,
+        {
+            "id": idxs,
+            "xy/opx_output_I": [f"#/wiring/qubits/q{idx}/port_I" for idx in idxs],
+            "xy/opx_output_Q": [f"#/wiring/qubits/q{idx}/port_Q" for idx in idxs],
+            "xy/frequency_converter_up/local_oscillator/power": 10,
+            "xy/frequency_converter_up/local_oscillator/frequency": 6e9,
+            "xy/intermediate_frequency": 100e6,
+            "z/opx_output": [f"#/wiring/qubits/q{idx}/port_Z" for idx in idxs],
+            "resonator/id": idxs,
+            "resonator/opx_output_I": "#/wiring/feedline/opx_output_I",
+            "resonator/opx_output_Q": "#/wiring/feedline/opx_output_Q",
+            "resonator/opx_input_I": "#/wiring/feedline/opx_input_I",
+            "resonator/opx_input_Q": "#/wiring/feedline/opx_input_Q",
+            "resonator/frequency_converter_up/local_oscillator/power": 10,
+            "resonator/frequency_converter_up/local_oscillator/frequency": 6e9,
+        },
+        components={
+            "xy/frequency_converter_up": FrequencyConverter,
+            "xy/frequency_converter_up/mixer": Mixer,
+            "xy/frequency_converter_up/local_oscillator": LocalOscillator,
+            "resonator/frequency_converter_up": FrequencyConverter,
+            "resonator/frequency_converter_up/mixer": Mixer,
+            "resonator/frequency_converter_up/local_oscillator": LocalOscillator,
+        },
+    )
+    machine.qubits.update({qubit.name: qubit for qubit in qubits})
+    return machine
+
+
+def test_build_components_matches_per_object_path():
+    machine = create_quam_superconducting_referenced(num_qubits=5)
+    machine_bulk = create_quam_superconducting_bulk(num_qubits=5)
+
+    assert machine_bulk.to_dict() == machine.to_dict()
+    assert machine_bulk.generate_config() == machine.generate_config()
+
+    qubit = machine_bulk.qubits["q3"]
+    assert isinstance(qubit.xy, IQChannel)
+    assert isinstance(qubit.z, SingleChannel)
+    assert isinstance(qubit.resonator, InOutIQChannel)
+    assert qubit.xy.parent is qubit
+    assert qubit.xy.frequency_converter_up.mixer.parent is (
+        qubit.xy.frequency_converter_up
+    )
+    assert qubit.xy.name == "q3.xy"
+    assert qubit.xy.mixer.name == "q3.xy.mixer"
+    assert qubit.xy.opx_output_I == ("con1", 12)
+    assert qubit.xy.LO_frequency == 6e9
+    assert qubit.xy.RF_frequency == 6.1e9
+
+
+def test_build_components_numpy_columns():
+    channels = build_components(
+        SingleChannel,
+        {
+            "id": np.arange(3),
+            "opx_output": [("con1", idx) for idx in range(1, 4)],
+            "intermediate_frequency": np.array([10e6, 20e6, 30e6]),
+            "filter_fir_taps": [[0.1, 0.2], [0.3], []],
+        },
+    )
+    assert [channel.id for channel in channels] == [0, 1, 2]
+    assert type(channels[1].intermediate_frequency) is float
+    assert channels[0].filter_fir_taps.to_dict() == [0.1, 0.2]
+    assert channels[0].filter_fir_taps.parent is channels[0]
+    assert not channels[0].operations
+    assert channels[0].operations is not channels[1].operations
+
+    for channel in channels:
+        channel_expected = SingleChannel(
+            id=channel.id,
+            opx_output=channel.opx_output,
+            intermediate_frequency=channel.intermediate_frequency,
+            filter_fir_taps=channel.filter_fir_taps.to_dict(),
+        )
+        assert channel.to_dict() == channel_expected.to_dict()
+
+
+def test_build_components_pulses():
+    channels = build_components(
+        IQChannel,
+        {
+            "opx_output_I": [("con1", 1), ("con1", 3)],
+            "opx_output_Q": [("con1", 2), ("con1", 4)],
+            "frequency_converter_up": "#/octave/RF_outputs/1",
+            "operations/X180/length": 40,
+            "operations/X180/amplitude": np.array([0.1, 0.2]),
+            "operations/X180/sigma": 8,
+            "operations/X180/axis_angle": 0.0,
+            "operations/readout/length": [100, 200],
+            "operations/readout/amplitude": 0.05,
+        },
+        components={
+            "operations/X180": pulses.GaussianPulse,
+            "operations/readout": pulses.SquarePulse,
+        },
+    )
+
+    channel = channels[1]
+    assert list(channel.operations) == ["X180", "readout"]
+    assert channel.operations.parent is channel
+    assert channel.operations["X180"].parent is channel.operations
+    assert channel.operations["X180"].amplitude == 0.2
+    assert channel.operations["readout"].length == 200
+
+    channel_expected = IQChannel(
+        opx_output_I=("con1", 3),
+        opx_output_Q=("con1", 4),
+        frequency_converter_up="#/octave/RF_outputs/1",
+        operations={
+            "X180": pulses.GaussianPulse(
+                length=40, amplitude=0.2, sigma=8, axis_angle=0.0
+            ),
+            "readout": pulses.SquarePulse(length=200, amplitude=0.05),
+        },
+    )
+    assert channel.to_dict() == channel_expected.to_dict()
+
+
+def test_build_components_num_rows():
+    mixers = build_components(Mixer, {}, num_rows=3)
+    assert len(mixers) == 3
+    assert all(mixer.to_dict() == Mixer().to_dict() for mixer in mixers)
+
+    with pytest.raises(ValueError):
+        build_components(Mixer, {"local_oscillator_frequency": 5e9})
+
+
+def test_build_components_validation():
+    with pytest.raises(ValueError):
+        build_components(SingleChannel, {"id": [1, 2], "opx_output": [("con1", 1)]})
+
+    with pytest.raises(TypeError):
+        build_components(SingleChannel, {"opx_output": [("con1", 1)], "foo": 1})
+
+    with pytest.raises(TypeError):
+        build_components(SingleChannel, {"id": [1, 2]})
+
+    with pytest.raises(TypeError):
+        build_components(
+            SingleChannel,
+            {"opx_output": [("con1", 1), ("con1", 2)], "intermediate_frequency": "a"},
+        )
+    build_components(
+        SingleChannel,
+        {"opx_output": [("con1", 1), ("con1", 2)], "intermediate_frequency": "a"},
+        validate_type=False,
+    )
+
+    # The class of the frequency converter can't be determined from its annotation
+    with pytest.raises(TypeError):
+        build_components(
+            IQChannel,
+            {
+                "opx_output_I": [("con1", 1)],
+                "opx_output_Q": [("con1", 2)],
+                "frequency_converter_up/local_oscillator/frequency": 6e9,
+            },
+        )
+
+
+def test_build_components_validation_literal():
+    for LO_sources in [["internal", "bogus"], ["bogus", "internal"]]:
+        with pytest.raises(TypeError):
+            build_components(OctaveUpConverter, {"id": [1, 2], "LO_source": LO_sources})
+
+    converters = build_components(
+        OctaveUpConverter,
+        {"id": [1, 2, 3], "LO_source": ["internal", "external", "internal"]},
+    )
+    assert [converter.LO_source for converter in converters] == [
+        "internal",
+        "external",
+        "internal",
+    ]
+
+
+def test_build_components_shared_component():
+    with pytest.raises(AttributeError):
+        build_components(
+            Transmon,
+            {"id": [1, 2], "z": SingleChannel(opx_output=("con1", 1))},
+        )
+
+    z_channels = [SingleChannel(opx_output=("con1", idx)) for idx in range(2)]
+    qubits = build_components(Transmon, {"id": [1, 2], "z": z_channels})
+    assert qubits[1].z is z_channels[1]
+    assert z_channels[1].parent is qubits[1]
@@ -0,0 +1,149 @@
+from typing import List, Optional
+
+import numpy as np
+
+from quam.components.channels import SingleChannel
+from quam.core import *
+
+
+@quam_dataclass
+class NumericComponent(QuamComponent):
+    floats: List[float] = None
+    ints: List[int] = None
+    optional_floats: Optional[List[float]] = None
+    strings: List[str] = None
+
+
+def test_numeric_list_from_annotation():
+    component = NumericComponent(
+        floats=[0.1, 1, 2.5], ints=[1, 2], optional_floats=[0.5], strings=["a"]
+    )
+    assert isinstance(component.floats, QuamNumericList)
+    assert component.floats.data.dtype == np.float64
+    assert isinstance(component.ints, QuamNumericList)
+    assert component.ints.data.dtype == np.int64
+    assert isinstance(component.optional_floats, QuamNumericList)
+    assert not isinstance(component.strings, QuamNumericList)
+    assert isinstance(component.strings, QuamList)
+
+    component.floats = np.linspace(0, 1, 5)
+    assert isinstance(component.floats, QuamNumericList)
+    assert component.floats.parent is component
+
+
+def test_numeric_list_non_numeric_fallback():
+    component = NumericComponent(floats=[0.1, "#../ints"], ints=[1, 2.5, True])
+    assert type(component.floats) is QuamList
+    assert type(component.ints) is QuamList
+    assert component.ints == [1, 2.5, True]
+
+
+def test_numeric_list_indexing():
+    numeric_list = QuamNumericList([0.1, 0.2, 0.3, 0.4])
+    assert numeric_list[1] == 0.2
+    assert type(numeric_list[1]) is float
+    assert numeric_list[-1] == 0.4
+    assert list(numeric_list) == [0.1, 0.2, 0.3, 0.4]
+    assert all(type(elem) is float for elem in numeric_list)
+
+    sliced = numeric_list[1:3]
+    assert isinstance(sliced, np.ndarray)
+    assert np.shares_memory(sliced, numeric_list.data)
+    assert np.asarray(numeric_list) is numeric_list.data
+    assert numeric_list == [0.1, 0.2, 0.3, 0.4]
+    assert repr(numeric_list) == "[0.1, 0.2, 0.3, 0.4]"
+
+
+def test_numeric_list_assignment():
+    numeric_list = QuamNumericList([0.1, 0.2, 0.3, 0.4])
+    numeric_list[0] = 1
+    numeric_list[1:3] = np.array([5.0, 6.0])
+    assert numeric_list == [1.0, 5.0, 6.0, 0.4]
+    assert numeric_list.is_array_backed
+
+    numeric_list.append(7)
+    numeric_list.insert(0, 8.0)
+    numeric_list.extend(np.array([9.0]))
+    numeric_list += [10.0]
+    assert numeric_list == [8.0, 1.0, 5.0, 6.0, 0.4, 7.0, 9.0, 10.0]
+    assert numeric_list.is_array_backed
+
+    assert numeric_list.pop() == 10.0
+    del numeric_list[0]
+    numeric_list.remove(0.4)
+    numeric_list.sort()
+    assert numeric_list == [1.0, 5.0, 6.0, 7.0, 9.0]
+    assert numeric_list.index(6.0) == 2
+    assert numeric_list.is_array_backed
+
+    numeric_list[1:3] = [2.0]
+    assert numeric_list == [1.0, 2.0, 7.0, 9.0]
+    assert numeric_list.is_array_backed
+
+
+def test_numeric_list_append_growth():
+    numeric_list = QuamNumericList([0.5])
+    reallocations = 0
+    for elem in range(1000):
+        buffer = numeric_list._buffer
+        numeric_list.append(elem)
+        reallocations += numeric_list._buffer is not buffer
+    assert reallocations < 10
+    assert numeric_list.is_array_backed
+    assert numeric_list == [0.5, *map(float, range(1000))]
+
+    copied = numeric_list.copy()
+    copied.append(1.5)
+    numeric_list.append(2.5)
+    assert copied[-1] == 1.5
+    assert numeric_list[-1] == 2.5
+
+
+def test_numeric_list_int_type():
+    numeric_list = QuamNumericList([1, 2], value_annotation=int)
+    assert numeric_list.data.dtype == np.int64
+    assert type(numeric_list[0]) is int
+    assert type(numeric_list + [3]) is QuamNumericList
+    assert (numeric_list + [3]).data.dtype == np.int64
+
+    numeric_list.append(0.5)
+    assert not numeric_list.is_array_backed
+    assert numeric_list == [1, 2, 0.5]
+
+    numeric_list.remove(0.5)
+    assert numeric_list.is_array_backed
+
+
+def test_numeric_list_reference_fallback():
+    component = NumericComponent(floats=[0.1, 0.2], ints=[3])
+    component.floats.append("#../ints")
+    assert not component.floats.is_array_backed
+    assert component.floats[2] == [3]
+
+
+def test_numeric_list_serialisation():
+    values = [0.1, 0.2, 0.3]
+    component = NumericComponent(floats=values, ints=[1, 2])
+    reference = NumericComponent(floats=None)
+    reference.floats = QuamList(values)
+    assert component.to_dict()["floats"] == reference.to_dict()["floats"] == values
+    assert component.to_dict()["ints"] == [1, 2]
+    assert all(type(elem) is int for elem in component.to_dict()["ints"])
+
+
+def test_channel_filter_taps():
+    channel = SingleChannel(
+        id="ch", opx_output=("con1", 1), filter_fir_taps=[0.5, 0.25]
+    )
+    assert isinstance(channel.filter_fir_taps, QuamNumericList)
+
+    cfg = {"controllers": {}, "elements": {}}
+    channel.apply_to_config(cfg)
+    port_cfg = cfg["controllers"]["con1"]["analog_outputs"][1]
+    assert port_cfg["feedforward_filter"] == [0.5, 0.25]
+
+
+def test_numeric_list_serialisation_int_in_float_list():
+    component = NumericComponent(floats=[1, 0.5])
+    assert component.to_dict()["floats"] == [1.0, 0.5]
+    assert type(component.to_dict()["floats"][0]) is float
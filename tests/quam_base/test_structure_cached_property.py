@@ -0,0 +1,165 @@
+import pytest
+
+from quam.components import BasicQuAM, pulses
+from quam.components.channels import IQChannel, SingleChannel
+from quam.components.hardware import FrequencyConverter, LocalOscillator, Mixer
+from quam.core import QuamComponent, QuamList, quam_dataclass
+from quam.core.quam_classes import structure_cached_property
+
+
+@quam_dataclass
+class CountingComponent(QuamComponent):
+    num_calls: int = 0
+
+    @structure_cached_property
+    def name(self):
+        self.__dict__["num_calls"] += 1
+        return f"{self.parent.get_attr_name(self)}"
+
+
+def test_structure_cached_property_caches():
+    machine = BasicQuAM()
+    machine.channels["ch1"] = SingleChannel(opx_output=("con1", 1))
+    machine.channels["ch1"].operations["c"] = component = CountingComponent()
+
+    assert component.name == "c"
+    assert component.name == "c"
+    assert component.num_calls == 1
+
+    # Structure changes elsewhere don't invalidate the cached value
+    machine.channels["ch2"] = SingleChannel(opx_output=("con1", 2))
+    machine.channels["ch1"].operations["d"] = CountingComponent()
+    assert component.name == "c"
+    assert component.num_calls == 1
+
+    component._structure_changed()
+    assert component.name == "c"
+    assert component.num_calls == 2
+
+    machine.channels["ch1"].operations._structure_changed()
+    assert component.name == "c"
+    assert component.num_calls == 3
+
+
+def test_channel_name_key_change():
+    machine = BasicQuAM()
+    channel = SingleChannel(opx_output=("con1", 1))
+    machine.channels["ch1"] = channel
+    pulse = channel.operations["gauss"] = pulses.GaussianPulse(
+        length=20, amplitude=0.1, sigma=4
+    )
+    assert channel.name == "ch1"
+    assert pulse.pulse_name == "ch1.gauss.pulse"
+
+    del machine.channels["ch1"]
+    channel.parent = None
+    machine.channels["ch2"] = channel
+    assert channel.name == "ch2"
+    assert pulse.pulse_name == "ch2.gauss.pulse"
+
+    del channel.operations["gauss"]
+    pulse.parent = None
+    channel.operations["X"] = pulse
+    assert pulse.name == "ch2.X"
+
+
+def test_channel_name_id_change():
+    machine = BasicQuAM()
+    channel = machine.channels["ch1"] = SingleChannel(opx_output=("con1", 1))
+    pulse = channel.operations["gauss"] = pulses.GaussianPulse(
+        length=20, amplitude=0.1, sigma=4
+    )
+    assert pulse.name == "ch1.gauss"
+
+    channel.id = "drive"
+    assert channel.name == "drive"
+    assert pulse.name == "drive.gauss"
+
+    channel.id = 3
+    assert channel.name == "ch3"
+
+    pulse.id = "X"
+    assert pulse.name == "ch3.X"
+
+
+def test_channel_name_detached():
+    channel = SingleChannel(opx_output=("con1", 1))
+    with pytest.raises(AttributeError):
+        channel.name
+
+    machine = BasicQuAM()
+    machine.channels["ch1"] = channel
+    assert channel.name == "ch1"
+
+    channel.parent = None
+    with pytest.raises(AttributeError):
+        channel.name
+
+
+def test_structure_cached_property_list_reorder():
+    components = QuamList([CountingComponent() for _ in range(3)])
+    component = components[2]
+    assert component.name == "2"
+
+    components.pop(0)
+    assert component.name == "1"
+    components.reverse()
+    assert component.name == "0"
+    components.insert(0, CountingComponent())
+    assert component.name == "1"
+
+
+def test_mixer_name_cached():
+    machine = BasicQuAM()
+    channel = machine.channels["xy"] = IQChannel(
+        opx_output_I=("con1", 1),
+        opx_output_Q=("con1", 2),
+        frequency_converter_up=FrequencyConverter(
+            mixer=Mixer(), local_oscillator=LocalOscillator(frequency=6e9)
+        ),
+    )
+    mixer = channel.frequency_converter_up.mixer
+    assert mixer.name == "xy.mixer"
+
+    channel.id = "drive"
+    assert mixer.name == "drive.mixer"
+
+
+@quam_dataclass
+class IndexedQubit(QuamComponent):
+    index: int
+    z: SingleChannel = None
+
+    @property
+    def name(self):
+        return f"qubit{self.index}"
+
+
+def test_channel_name_parent_name_not_cached():
+    qubit = IndexedQubit(index=1, z=SingleChannel(opx_output=("con1", 1)))
+    pulse = qubit.z.operations["flux"] = pulses.SquarePulse(length=20, amplitude=0.1)
+    assert qubit.z.name == "qubit1.z"
+    assert pulse.name == "qubit1.z.flux"
+
+    qubit.index = 5
+    assert qubit.z.name == "qubit5.z"
+    assert pulse.name == "qubit5.z.flux"
+
+
+def test_attr_name_in_parent_cached_per_parent():
+    machine = BasicQuAM()
+    for idx in range(3):
+        machine.channels[f"ch{idx}"] = SingleChannel(opx_output=("con1", idx + 1))
+    channels = machine.channels
+
+    version = channels.__dict__.get("_structure_version", 0)
+    assert channels["ch1"].name == "ch1"
+
+    # Only replacing, removing or reordering entries changes the parent's version
+    machine.channels["ch3"] = SingleChannel(opx_output=("con1", 4))
+    channels["ch0"].operations["X"] = pulses.SquarePulse(length=20, amplitude=0.1)
+    assert channels.__dict__.get("_structure_version", 0) == version
+
+    del machine.channels["ch0"]
+    assert channels.__dict__["_structure_version"] > version
+    assert channels["ch1"].name == "ch1"
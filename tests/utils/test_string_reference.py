@@ -147,3 +147,22 @@ def test_delimiter():
         assert transmon.xy.name == "q1$xy"
     finally:
         quam.utils.string_reference.DELIMITER = "."
+
+
+def test_get_referenced_values_glob():
+    root = {"a": {"x1": 1, "x2": 2, "y": 3}, "b": [{"c": 4}, {"c": 5}]}
+
+    assert is_glob_reference("#/a/x*")
+    assert not is_glob_reference("#/a/x1")
+    assert not is_glob_reference("a/x*")
+
+    assert get_referenced_values(None, "#/a/x*", root) == [1, 2]
+    assert get_referenced_values(None, "#/a/?", root) == [3]
+    assert get_referenced_values(None, "#/a/x[2-3]", root) == [2]
+    assert get_referenced_values(None, "#/b/*/c", root) == [4, 5]
+    assert get_referenced_values(root["a"], "#./*", root) == [1, 2, 3]
+    assert get_referenced_values(None, "#/a/x1", root) == [1]
+    assert get_referenced_values(None, "#/a/z*", root) == []
+
+    with pytest.raises(ValueError):
+        get_referenced_values(None, "#/c/*", root)